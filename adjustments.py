@@ -0,0 +1,73 @@
+"""수정주가: KRX 일반주가 + 종목별 권리 변동(분할/병합 등) 계수.
+
+KRX 일봉의 등락률은 기준가(권리락 반영 전일 종가) 대비로 계산되므로
+기준가 = 종가 / (1 + 등락률) 이고, 기준가와 실제 전일 종가의 비율이
+그 날의 조정 계수가 됩니다 (예: 50:1 액면분할이면 0.02).
+계수가 1이 아닌 날짜만 모아 두고, 수정주가는 각 날짜 이후 계수의
+누적곱을 일반주가에 곱해 벡터 연산으로 계산합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+# 등락률 반올림(소수 2자리)과 호가 단위 오차보다 큰 변화만 조정으로 간주
+SPLIT_TOL = 5e-3
+
+PRICE_COLS = ["Open", "High", "Low", "Close"]
+
+
+def split_factors(raw: pd.DataFrame, tol: float = SPLIT_TOL) -> pd.Series:
+    """일반주가 일봉 → 조정 계수 테이블.
+
+    Args:
+        raw: Close, Change(등락률, %) 컬럼이 있는 일반주가 일봉
+        tol: 조정으로 간주할 최소 |계수 - 1|
+
+    Returns:
+        조정일 → 계수 Series (조정일 이전 가격에 곱할 값)
+    """
+    close = raw["Close"].to_numpy(dtype=float)
+    if len(close) < 2:
+        return pd.Series(dtype=float, name="Factor")
+
+    # 거래정지(가격 0) 구간은 건너뛰고 직전 유효 종가와 비교
+    valid = close > 0
+    prev = pd.Series(np.where(valid, close, np.nan)).ffill().shift(1).to_numpy()
+
+    base = close / (1 + raw["Change"].to_numpy(dtype=float) / 100)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor = base / prev
+
+    mask = valid & np.isfinite(factor) & (np.abs(factor - 1) > tol)
+    return pd.Series(factor[mask], index=raw.index[mask], name="Factor")
+
+
+def cumulative_factor(index: pd.DatetimeIndex, factors: pd.Series) -> np.ndarray:
+    """각 날짜에 적용할 누적 계수 (그 날짜 이후 조정 계수의 곱)."""
+    if factors.empty:
+        return np.ones(len(index))
+    factors = factors.sort_index()
+    # suffix[i] = factors[i:]의 곱, 마지막은 1
+    suffix = np.append(np.cumprod(factors.to_numpy()[::-1])[::-1], 1.0)
+    pos = factors.index.searchsorted(index, side="right")
+    return suffix[pos]
+
+
+def adjust_ohlcv(raw: pd.DataFrame, factors: pd.Series) -> pd.DataFrame:
+    """일반주가 일봉 → 수정주가 일봉.
+
+    Args:
+        raw: 일반주가 일봉 (Open, High, Low, Close, Volume)
+        factors: split_factors() 결과 (raw 이후 날짜 포함 가능)
+
+    Returns:
+        가격에 누적 계수를 곱하고 거래량을 나눈 DataFrame
+    """
+    f = cumulative_factor(raw.index, factors)
+    if (f == 1).all():
+        return raw
+
+    df = raw.copy()
+    df[PRICE_COLS] = raw[PRICE_COLS].to_numpy(dtype=float) * f[:, None]
+    df["Volume"] = np.round(raw["Volume"].to_numpy(dtype=float) / f).astype("int64")
+    return df
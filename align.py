@@ -0,0 +1,171 @@
+"""기간 간 정렬: 일봉/주봉/월봉 정수 인덱스 맵과 배열 gather 헬퍼.
+
+주봉(W-FRI)과 월봉(월말) 라벨은 구간의 마지막 날이므로, 일봉 날짜 d를
+포함하는 바는 d 이상인 첫 라벨입니다 (searchsorted). 맵을 한 번 계산해
+두면 "이 날짜가 속한 주봉", "각 일자의 주간 신호 상태" 같은 질의가
+resample/reindex 없이 정수 배열 인덱싱으로 끝납니다.
+
+    maps = index_maps(daily.index, weekly.index, monthly.index)
+    daily["WeeklyMA"] = broadcast(weekly["MA"], maps["daily_weekly"], daily.index)
+    bt = execute_daily(weekly, daily, maps["daily_weekly"])
+"""
+
+import numpy as np
+import pandas as pd
+
+_WEEK = pd.Timedelta(days=7)
+
+
+def _containing(labels: pd.DatetimeIndex, dates: pd.DatetimeIndex) -> np.ndarray:
+    """각 날짜를 포함하는 바의 위치 (라벨 = 구간 마지막 날, 없으면 -1)."""
+    pos = labels.searchsorted(dates, side="left").astype(np.int64)
+    pos[pos == len(labels)] = -1
+    return pos
+
+
+def index_maps(
+    daily: pd.DatetimeIndex, weekly: pd.DatetimeIndex, monthly: pd.DatetimeIndex
+) -> dict[str, np.ndarray]:
+    """일봉→주봉, 일봉→월봉, 주봉→월봉 위치 맵.
+
+    Args:
+        daily, weekly, monthly: 각 기간 DataFrame의 인덱스
+
+    Returns:
+        {"daily_weekly": (일봉수,), "daily_monthly": (일봉수,),
+        "weekly_monthly": (주봉수,)} int64 배열 (대응 바가 없으면 -1)
+    """
+    daily = pd.DatetimeIndex(daily)
+    weekly = pd.DatetimeIndex(weekly)
+    monthly = pd.DatetimeIndex(monthly)
+
+    # 주봉은 마지막 거래일이 속한 월봉에 대응 (월을 걸친 주)
+    last = daily.searchsorted(weekly, side="right") - 1
+    last_day = daily[np.maximum(last, 0)] if len(daily) else weekly
+    in_week = (last >= 0) & (last_day > weekly - _WEEK)
+    week_end = pd.DatetimeIndex(np.where(in_week, last_day, weekly))
+
+    return {
+        "daily_weekly": _containing(weekly, daily),
+        "daily_monthly": _containing(monthly, daily),
+        "weekly_monthly": _containing(monthly, week_end),
+    }
+
+
+def completed(mapping: np.ndarray) -> np.ndarray:
+    """각 하위 바 시점에 이미 완성된 상위 바 위치 (미래 참조 방지).
+
+    상위 바는 자신의 마지막 하위 바 종가에 완성되므로, 그 전까지는
+    직전 상위 바를 가리킵니다 (없으면 -1). 데이터 마지막 바는 진행 중인
+    상위 바를 그 시점까지의 값으로 완성된 것으로 봅니다.
+    """
+    mapping = np.asarray(mapping)
+    if not len(mapping):
+        return mapping
+    is_last = np.append(mapping[1:] != mapping[:-1], True)
+    return np.where(is_last, mapping, mapping - 1)
+
+
+def broadcast(
+    values,
+    mapping: np.ndarray,
+    index: pd.Index | None = None,
+    complete: bool = True,
+    fill=np.nan,
+):
+    """상위 기간 값을 하위 기간 축으로 펼침 (배열 gather).
+
+    Args:
+        values: 상위 기간 값 (Series 또는 배열, 예: 주봉 MA/Buy/Impulse)
+        mapping: 하위→상위 위치 맵 (예: maps["daily_weekly"])
+        index: 지정 시 이 인덱스의 Series로 반환 (예: daily.index)
+        complete: True면 완성된 상위 바 값만 사용 (미래 참조 없음),
+            False면 진행 중인 바(해당 날짜를 포함하는 바)의 최종 값 사용
+        fill: 대응하는 상위 바가 없는 위치의 값
+
+    Returns:
+        하위 기간 길이의 배열 또는 Series
+    """
+    v = np.asarray(values)
+    pos = completed(mapping) if complete else np.asarray(mapping)
+    ok = pos >= 0
+    if v.dtype.kind in "iub" and not ok.all():
+        v = v.astype(float)
+    out = np.where(ok, v[np.maximum(pos, 0)] if len(v) else fill, fill)
+    if index is None:
+        return out
+    return pd.Series(out, index=index, name=getattr(values, "name", None))
+
+
+def execute_daily(
+    weekly: pd.DataFrame,
+    daily: pd.DataFrame,
+    mapping: np.ndarray,
+    close_last: bool = True,
+) -> pd.DataFrame:
+    """주봉 신호를 다음 일봉 시가에 체결하는 백테스트.
+
+    주봉 신호는 그 주의 마지막 거래일 종가에 확정되므로 다음 거래일 시가에
+    매수/매도합니다 (backtest()는 신호 주봉의 시가/종가로 체결).
+    포지션 상태 머신은 backtest()와 같습니다.
+
+    Args:
+        weekly: 신호가 포함된 주봉 (Buy, Sell)
+        daily: 일봉 (Open, Close)
+        mapping: 일봉→주봉 위치 맵 (maps["daily_weekly"])
+        close_last: 마지막 미청산 포지션을 마지막 일봉 종가로 정리할지 여부
+
+    Returns:
+        backtest()와 같은 컬럼의 거래 내역 DataFrame
+    """
+    n = len(daily)
+    mapping = np.asarray(mapping)
+
+    # 1) 주봉별 체결 위치 = 그 주 마지막 일봉 다음 바
+    last = np.searchsorted(mapping, np.arange(len(weekly)), side="right") - 1
+    exec_pos = last + 1
+    valid = (last >= 0) & (mapping[np.maximum(last, 0)] == np.arange(len(weekly)))
+    valid &= exec_pos < n
+
+    buy = (weekly["Buy"].to_numpy() == 1) & valid
+    sell = (weekly["Sell"].to_numpy() == 1) & valid
+
+    # 2) 상태 머신 (신호가 있는 주만 순회, 첫 주봉 제외)
+    entries, exits = [], []
+    in_pos = False
+    for j in np.flatnonzero(buy | sell):
+        if j == 0:
+            continue
+        if not in_pos and buy[j]:
+            entries.append(exec_pos[j])
+            in_pos = True
+        elif in_pos and sell[j]:
+            exits.append(exec_pos[j])
+            in_pos = False
+
+    # 3) 체결가 gather
+    dates = daily.index
+    opens = daily["Open"].to_numpy(dtype=float)
+    entry_dates, entry_px = list(dates[entries]), list(opens[entries])
+    exit_dates, exit_px = list(dates[exits]), list(opens[exits])
+
+    if in_pos:
+        if close_last:
+            exit_dates.append(dates[-1])
+            exit_px.append(float(daily["Close"].iloc[-1]))
+        else:
+            entry_dates, entry_px = entry_dates[:-1], entry_px[:-1]
+
+    result = pd.DataFrame(
+        {
+            "EntryDate": entry_dates,
+            "EntryPrice": entry_px,
+            "ExitDate": exit_dates,
+            "ExitPrice": exit_px,
+        }
+    )
+    result["Return"] = (result["ExitPrice"] - result["EntryPrice"]) / result[
+        "EntryPrice"
+    ]
+    result["CumRet"] = (1 + result["Return"]).cumprod()
+    return result
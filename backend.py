@@ -0,0 +1,310 @@
+"""계산 백엔드 선택: pandas(기본) 또는 Polars.
+
+TREND_SIGNAL_BACKEND=polars 환경변수나 set_backend("polars")로 켜면
+add_indicators, resample_weekly/monthly, generate_signals가 같은 정의를
+Polars lazy 프레임(Arrow 메모리, 멀티스레드)으로 계산하고 pandas
+DataFrame을 그대로 돌려줍니다.
+
+전체 시장처럼 종목이 많으면 *_panel 함수에 {종목코드: DataFrame}을 한 번에
+넘기세요. 모든 종목을 한 프레임으로 이어 붙여 종목별 윈도 연산(over)을
+모든 코어에서 병렬로 계산합니다.
+
+    set_backend("polars")
+    weekly = resample_panel(daily_frames, "weekly")
+    signals = generate_signals_panel(add_indicators_panel(weekly))
+
+Polars가 필요합니다 (pip install polars pyarrow).
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+BACKENDS = ("pandas", "polars")
+OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+
+_CODE, _DATE = "__code__", "__date__"
+_backend = os.environ.get("TREND_SIGNAL_BACKEND", "pandas").lower()
+
+
+def _require_polars():
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError(
+            "Polars 백엔드에는 polars가 필요합니다: pip install polars pyarrow"
+        ) from e
+    return pl
+
+
+def set_backend(name: str) -> None:
+    """계산 백엔드 설정.
+
+    Args:
+        name: 'pandas' 또는 'polars'
+    """
+    global _backend
+    name = name.lower()
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 백엔드: {name} ({', '.join(BACKENDS)})")
+    if name == "polars":
+        _require_polars()
+    _backend = name
+
+
+def get_backend() -> str:
+    """현재 계산 백엔드 이름."""
+    return _backend
+
+
+def use_polars() -> bool:
+    """Polars 백엔드 사용 여부."""
+    return _backend == "polars"
+
+
+# ---------------------------------------------------------------------- 변환
+
+
+def _to_long(frames: dict[str, pd.DataFrame]):
+    """{종목코드: DataFrame} → 종목/날짜 컬럼을 가진 Polars lazy 프레임."""
+    pl = _require_polars()
+    parts = []
+    for code, df in frames.items():
+        part = df.rename_axis(_DATE).reset_index()
+        part.insert(0, _CODE, code)
+        parts.append(part)
+    return pl.from_pandas(pd.concat(parts, ignore_index=True)).lazy()
+
+
+def _from_long(
+    result, frames: dict[str, pd.DataFrame], freq: str | None = None
+) -> dict[str, pd.DataFrame]:
+    """Polars 결과 → {종목코드: DataFrame} (입력 순서, 인덱스 이름/freq 유지).
+
+    freq: 리샘플링 결과의 인덱스 freq (None이면 입력과 같은 인덱스일 때 입력 freq)
+    """
+    pdf = result.to_pandas().set_index(_DATE)
+    if frames:
+        # Polars 연산이 바꾼 날짜 단위(us 등)를 입력과 맞춤
+        pdf.index = pdf.index.astype(next(iter(frames.values())).index.dtype)
+    groups = dict(tuple(pdf.groupby(_CODE, sort=False)))
+    empty = pdf.iloc[:0].drop(columns=_CODE)
+
+    out = {}
+    for code, df in frames.items():
+        part = groups[code].drop(columns=_CODE) if code in groups else empty
+        # 이어 붙이며 실수로 바뀐 정수 컬럼 복원 (결측이 생긴 컬럼 제외)
+        for col, dtype in df.dtypes.items():
+            if col in part and part[col].dtype != dtype and part[col].notna().all():
+                part[col] = part[col].astype(dtype)
+        if freq is not None:
+            part.index = _with_freq(part.index, freq)
+        elif part.index.equals(df.index):
+            part.index = df.index  # 입력 인덱스 그대로 (freq 포함)
+        out[code] = part.rename_axis(df.index.name)
+    return out
+
+
+def _with_freq(index: pd.DatetimeIndex, freq: str) -> pd.DatetimeIndex:
+    """pandas resample처럼 빈 기간 없이 이어지는 인덱스에만 freq 설정."""
+    try:
+        return pd.DatetimeIndex(index, freq=freq)
+    except ValueError:
+        return index
+
+
+def _nan_to_null(expr):
+    """0/0 등의 NaN을 null로 (pandas처럼 rolling에서 건너뛰고 비교는 False)."""
+    return expr.fill_nan(None)
+
+
+# ---------------------------------------------------------------------- 리샘플링
+
+
+def resample_panel(
+    frames: dict[str, pd.DataFrame], period: str = "weekly"
+) -> dict[str, pd.DataFrame]:
+    """일봉 → 주봉(금요일)/월봉(월말) 변환 (utils.resample_weekly/monthly와 동일).
+
+    Args:
+        frames: {종목코드: OHLCV 일봉}
+        period: 'weekly' 또는 'monthly'
+
+    Returns:
+        {종목코드: 주봉/월봉 DataFrame}
+    """
+    pl = _require_polars()
+    date = pl.col(_DATE)
+    if period == "weekly":
+        # 그 날짜 이후 첫 금요일 (weekday: 월=1 ... 일=7)
+        label = date + pl.duration(days=(12 - date.dt.weekday()) % 7)
+        freq = "W-FRI"
+    elif period == "monthly":
+        label = date.dt.month_end()
+        freq = "ME"
+    else:
+        raise ValueError(f"period 오류: {period}")
+
+    result = (
+        _to_long(frames)
+        .with_columns(label.dt.truncate("1d").alias("__label__"))
+        .group_by(_CODE, "__label__", maintain_order=True)
+        .agg(
+            pl.col("Open").drop_nulls().first(),
+            pl.col("High").max(),
+            pl.col("Low").min(),
+            pl.col("Close").drop_nulls().last(),
+            pl.col("Volume").sum(),
+        )
+        .drop_nulls(OHLCV)
+        .rename({"__label__": _DATE})
+        .collect()
+    )
+    out = _from_long(result, frames, freq)
+    for code, df in out.items():
+        # pandas는 빈 기간(freq 없음)이 있으면 정수 가격의 first/max/min/last를
+        # 실수로 바꿈 (Volume 합계는 정수 유지)
+        if len(df) and df.index.freq is None:
+            ints = [c for c in OHLCV[:4] if df[c].dtype.kind in "iu"]
+            out[code] = df.astype(dict.fromkeys(ints, np.float64))
+    return out
+
+
+# ---------------------------------------------------------------------- 지표
+
+
+def _indicator_exprs(ma_period: int, cmf_period: int) -> list:
+    """indicators.add_indicators와 같은 정의의 종목별 윈도 식."""
+    pl = _require_polars()
+    close = pl.col("Close").cast(pl.Float64)
+    high = pl.col("High").cast(pl.Float64)
+    low = pl.col("Low").cast(pl.Float64)
+    vol = pl.col("Volume").cast(pl.Float64)
+
+    # 1) CMF
+    rng = high - low
+    mf_mult = ((close - low) - (high - close)) / pl.when(rng != 0).then(rng)
+    cmf = (mf_mult * vol).rolling_sum(cmf_period) / vol.rolling_sum(cmf_period)
+
+    # 2) Fear & Greed (indicators.calc_fear_greed 참조)
+    mom = (close.log() - close.log().shift(5)) * 100
+    low52 = close.rolling_min(52, min_samples=1)
+    high52 = close.rolling_max(52, min_samples=1)
+    pos52 = _nan_to_null((close - low52) / (high52 - low52)).clip(0, 1)
+    vol_surge = _nan_to_null(
+        vol.rolling_mean(5, min_samples=1) / vol.rolling_mean(20, min_samples=1)
+    ).clip(0, 3)
+    ret = close.pct_change()
+    vol_spike = _nan_to_null(
+        ret.rolling_std(5, min_samples=1) / ret.rolling_std(20, min_samples=1)
+    ).clip(0, 3)
+
+    m = (mom.rolling_mean(7, min_samples=1) / 10).clip(-1, 1.5)
+    p = (2 * pos52.rolling_mean(7, min_samples=1) - 1).clip(-1, 1.5)
+    v = (vol_surge.rolling_mean(10, min_samples=1) - 1).clip(-0.5, 1.2)
+    vs = -(vol_spike.rolling_mean(10, min_samples=1) - 1).clip(-0.5, 1.2)
+    fg = 0.45 * m + 0.45 * p + 0.05 * v + 0.05 * vs
+
+    return [
+        _nan_to_null(close.rolling_mean(ma_period)).over(_CODE).alias("MA"),
+        _nan_to_null(cmf).over(_CODE).alias("CMF"),
+        _nan_to_null(fg).over(_CODE).alias("FG"),
+        pl.col("High").shift(1).over(_CODE).cast(pl.Float64).alias("PrevHigh"),
+        pl.col("Low").shift(1).over(_CODE).cast(pl.Float64).alias("PrevLow"),
+    ]
+
+
+def add_indicators_panel(
+    frames: dict[str, pd.DataFrame], ma_period: int = 10, cmf_period: int = 4
+) -> dict[str, pd.DataFrame]:
+    """다중 종목 지표 추가 (indicators.add_indicators와 동일한 컬럼).
+
+    Args:
+        frames: {종목코드: OHLCV DataFrame}
+        ma_period: 이동평균 기간
+        cmf_period: CMF 기간
+
+    Returns:
+        {종목코드: 지표가 추가된 DataFrame}
+    """
+    result = (
+        _to_long(frames).with_columns(_indicator_exprs(ma_period, cmf_period)).collect()
+    )
+    return _from_long(result, frames)
+
+
+# ---------------------------------------------------------------------- 신호
+
+
+def _actual_sell(buy: np.ndarray, sell: np.ndarray, first: np.ndarray) -> np.ndarray:
+    """실제 매도 (포지션 보유 후 첫 매도, 종목 첫 바는 건너뜀)."""
+    out = np.zeros(len(buy), dtype=np.int64)
+    in_pos = False
+    for i in np.flatnonzero((buy == 1) | (sell == 1) | first):
+        if first[i]:
+            in_pos = False
+        elif not in_pos and buy[i] == 1:
+            in_pos = True
+        elif in_pos and sell[i] == 1:
+            out[i] = 1
+            in_pos = False
+    return out
+
+
+def generate_signals_panel(
+    frames: dict[str, pd.DataFrame],
+) -> dict[str, pd.DataFrame]:
+    """다중 종목 매수/매도 신호 (signals.generate_signals와 동일한 정의).
+
+    Args:
+        frames: {종목코드: 지표가 포함된 DataFrame}
+
+    Returns:
+        {종목코드: Buy, Sell, ActualSell 컬럼이 추가된 DataFrame}
+    """
+    pl = _require_polars()
+    high, low, close, cmf, ma = (
+        pl.col(c) for c in ("High", "Low", "Close", "CMF", "MA")
+    )
+    buy = (high > pl.col("PrevHigh")) & (close > ma) & (cmf > 0)
+    sell = (low < pl.col("PrevLow")) & (close < ma) & (cmf < 0)
+
+    result = (
+        _to_long(frames)
+        .with_columns(
+            buy.fill_null(False).cast(pl.Int64).alias("Buy"),
+            sell.fill_null(False).cast(pl.Int64).alias("Sell"),
+            (pl.int_range(pl.len()).over(_CODE) == 0).alias("__first__"),
+        )
+        .collect()
+    )
+
+    # 포지션 상태 머신은 순차적이므로 신호가 있는 바만 순회
+    actual = _actual_sell(
+        result["Buy"].to_numpy(),
+        result["Sell"].to_numpy(),
+        result["__first__"].to_numpy(),
+    )
+    result = result.drop("__first__").with_columns(pl.Series("ActualSell", actual))
+    return _from_long(result, frames)
+
+
+# ---------------------------------------------------------------------- 단일 종목
+
+
+def add_indicators(
+    df: pd.DataFrame, ma_period: int = 10, cmf_period: int = 4
+) -> pd.DataFrame:
+    """add_indicators_panel 단일 종목판."""
+    return add_indicators_panel({"": df}, ma_period, cmf_period)[""]
+
+
+def resample(df: pd.DataFrame, period: str = "weekly") -> pd.DataFrame:
+    """resample_panel 단일 종목판."""
+    return resample_panel({"": df}, period)[""]
+
+
+def generate_signals(df: pd.DataFrame) -> pd.DataFrame:
+    """generate_signals_panel 단일 종목판."""
+    return generate_signals_panel({"": df})[""]
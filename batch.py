@@ -0,0 +1,217 @@
+"""여러 전략 설정을 한 번의 조회로 실행하는 배치 스크리닝.
+
+섹터별 ma_period/cmf_period, TD/Elder 포함 여부 등 전략 변형 N개를 같은
+종목군에 돌릴 때, 종목마다 주봉을 한 번만 조회하고 공통 지표(FG,
+PrevHigh/PrevLow, TD Setup, Elder Impulse)도 한 번만 계산한 뒤 전략별로
+나눠 씁니다. MA/CMF는 서로 다른 기간마다 한 번씩만 계산하므로 조회와
+중복 계산은 종목 × 전략이 아니라 종목 수에 비례합니다.
+
+    strategies = {
+        "default": {},
+        "fast": {"ma_period": 5, "cmf_period": 3},
+        "semis": {"ma_period": 20, "include_elder": True, "codes": ["삼성전자"]},
+    }
+    table = run_batch(codes, strategies, jobs=8)
+    table.loc["fast"]  # 전략별 결과 (code 인덱스)
+
+전략 설정 키 (생략 시 analyze()와 같은 기본값):
+    ma_period       이동평균 기간 (기본 10)
+    cmf_period      CMF 기간 (기본 4)
+    include_td      DeMark TD Setup 포함 (기본 False)
+    include_elder   Elder Impulse 포함 (기본 False)
+    codes           적용할 종목 (종목명 또는 코드, 기본 전체)
+"""
+
+from collections.abc import Iterator
+
+import pandas as pd
+from fetcher import fetch_ohlcv
+from indicators import (
+    calc_cmf,
+    calc_elder_impulse,
+    calc_fear_greed,
+    calc_ma,
+    calc_td_setup,
+)
+from signals import backtest, generate_signals, latest_signals, summary
+from utils import bounded_map, to_code, to_name
+
+STRATEGY_DEFAULTS = {
+    "ma_period": 10,
+    "cmf_period": 4,
+    "include_td": False,
+    "include_elder": False,
+    "codes": None,
+}
+
+
+def _normalize(strategies: dict[str, dict]) -> dict[str, dict]:
+    """전략 설정 검증 + 기본값 채우기 (codes는 종목코드 집합으로)."""
+    out = {}
+    for name, config in strategies.items():
+        unknown = set(config) - set(STRATEGY_DEFAULTS)
+        if unknown:
+            raise ValueError(f"전략 '{name}'의 알 수 없는 설정: {sorted(unknown)}")
+        config = {**STRATEGY_DEFAULTS, **config}
+        if config["codes"] is not None:
+            codes = {str(c): to_code(str(c)) for c in config["codes"]}
+            missing = [c for c, code in codes.items() if not code]
+            if missing:
+                raise ValueError(f"전략 '{name}'의 종목을 찾을 수 없습니다: {missing}")
+            config["codes"] = set(codes.values())
+        out[name] = config
+    return out
+
+
+def _fan_out(df: pd.DataFrame, code: str, strategies: dict) -> dict:
+    """종목 1개 주봉 → {전략명: (df, bt)} (공통 지표는 한 번만 계산).
+
+    전략별 df는 add_all_indicators(df, ma, cmf, include_td, include_elder)와
+    같은 컬럼/순서입니다.
+    """
+    active = {
+        name: s
+        for name, s in strategies.items()
+        if s["codes"] is None or code in s["codes"]
+    }
+    if not active:
+        return {}
+
+    # 1) 공통 지표 (기간 무관)
+    shared = pd.DataFrame(
+        {
+            "FG": calc_fear_greed(df),
+            "PrevHigh": df["High"].shift(1),
+            "PrevLow": df["Low"].shift(1),
+        },
+        index=df.index,
+    )
+    extras = {}
+    if any(s["include_td"] for s in active.values()):
+        extras["td"] = calc_td_setup(df).drop(columns=df.columns)
+    if any(s["include_elder"] for s in active.values()):
+        extras["elder"] = calc_elder_impulse(df).drop(columns=df.columns)
+
+    # 2) 기간별 지표 (서로 다른 기간마다 한 번)
+    ma = {n: calc_ma(df["Close"], n) for n in {s["ma_period"] for s in active.values()}}
+    cmf = {n: calc_cmf(df, n) for n in {s["cmf_period"] for s in active.values()}}
+
+    # 3) 전략별 조립 → 신호 → 백테스트
+    out = {}
+    for name, s in active.items():
+        parts = [
+            df,
+            ma[s["ma_period"]].rename("MA"),
+            cmf[s["cmf_period"]].rename("CMF"),
+            shared,
+        ]
+        if s["include_td"]:
+            parts.append(extras["td"])
+        if s["include_elder"]:
+            parts.append(extras["elder"])
+        sdf = generate_signals(pd.concat(parts, axis=1))
+        out[name] = (sdf, backtest(sdf))
+    return out
+
+
+def iter_batch(
+    queries: list[str],
+    strategies: dict[str, dict],
+    start: str | None = None,
+    end: str | None = None,
+    adjusted: bool = True,
+    keep_df: bool = False,
+    jobs: int = 1,
+    max_pending: int | None = None,
+) -> Iterator[tuple[str, str, dict]]:
+    """다중 종목 × 다중 전략 분석 (종목 완료 순으로 생성).
+
+    종목마다 조회 1회 후 해당 종목에 적용되는 모든 전략을 계산합니다.
+    동시 실행/배압은 analyze_iter와 같습니다 (utils.bounded_map).
+
+    Args:
+        queries: 종목명 또는 코드 리스트
+        strategies: {전략명: 전략 설정} (모듈 설명 참조)
+        start, end, adjusted: analyze()와 동일
+        keep_df: False면 무거운 df를 버리고 bt/summary/latest만 유지
+        jobs: 동시 처리 스레드 수 (1이면 입력 순서대로 순차 실행)
+        max_pending: 동시 진행/대기 종목 상한 (기본 jobs * 2)
+
+    Yields:
+        (전략명, 종목코드, {"code", "name", "df", "bt", "summary", "latest"})
+        (조회 실패/데이터 없는 종목은 건너뜀)
+    """
+    strategies = _normalize(strategies)
+
+    def run(q):
+        df, code = fetch_ohlcv(q, start, end, period="weekly", adjusted=adjusted)
+        if df is None or df.empty:
+            return None
+
+        name = to_name(code)
+        results = []
+        for strategy, (sdf, bt) in _fan_out(df, code, strategies).items():
+            result = {
+                "code": code,
+                "name": name,
+                "df": sdf,
+                "bt": bt,
+                "summary": summary(bt),
+                "latest": latest_signals(sdf),
+            }
+            if not keep_df:
+                result.pop("df")
+            results.append((strategy, code, result))
+        return results
+
+    for results in bounded_map(run, queries, jobs, max_pending):
+        yield from results
+
+
+def run_batch(
+    queries: list[str],
+    strategies: dict[str, dict],
+    start: str | None = None,
+    end: str | None = None,
+    adjusted: bool = True,
+    jobs: int = 1,
+) -> pd.DataFrame:
+    """다중 전략 배치 스크리닝 결과 표.
+
+    Args:
+        queries: 종목명 또는 코드 리스트
+        strategies: {전략명: 전략 설정} (모듈 설명 참조)
+        start, end, adjusted: analyze()와 동일
+        jobs: 동시 처리 스레드 수
+
+    Returns:
+        (strategy, code) MultiIndex DataFrame
+        컬럼: name, trades, avg_ret, cum_ret, win_rate (summary),
+        date, Close, MA, CMF, FG, Buy, Sell, InPos (latest_signals)
+    """
+    rows = [
+        {
+            "strategy": strategy,
+            "code": code,
+            "name": r["name"],
+            **r["summary"],
+            **r["latest"],
+        }
+        for strategy, code, r in iter_batch(
+            queries, strategies, start, end, adjusted, keep_df=False, jobs=jobs
+        )
+    ]
+    if not rows:
+        return pd.DataFrame(
+            index=pd.MultiIndex.from_arrays([[], []], names=["strategy", "code"])
+        )
+
+    # 전략은 입력 순서, 종목은 코드 순
+    order = {name: i for i, name in enumerate(strategies)}
+    table = pd.DataFrame(rows)
+    table = table.sort_values(
+        ["strategy", "code"],
+        key=lambda s: s.map(order) if s.name == "strategy" else s,
+        kind="stable",
+    )
+    return table.set_index(["strategy", "code"])
@@ -0,0 +1,181 @@
+"""디스크 캐시: 일봉 OHLCV, 종목 마스터.
+
+캐시 디렉터리는 set_cache_dir() 또는 환경변수 TREND_SIGNAL_CACHE로 지정하며,
+지정하지 않으면 캐시를 사용하지 않습니다.
+
+    {cache_dir}/ohlcv/{code}.pkl             일반주가 일봉 + 조정 계수 + 조회 완료 구간
+    {cache_dir}/stock_list.pkl               종목 마스터
+    {cache_dir}/names.json                   종목코드 → 종목명
+    {cache_dir}/calendar.pkl                 KRX 거래일 캘린더
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import pandas as pd
+
+_cache_dir: str | None = os.environ.get("TREND_SIGNAL_CACHE") or None
+
+# 이 시각 이후 조회한 당일 일봉은 확정 데이터로 간주
+CLOSE_HOUR = 18
+
+# 최근 사용한 일봉 캐시를 메모리에 유지 (파일 mtime이 같으면 재사용)
+MEMORY_SIZE = 512
+_memory: OrderedDict = OrderedDict()
+_lock = threading.Lock()
+_names_lock = threading.Lock()  # names.json 읽기-수정-쓰기
+
+
+def set_cache_dir(path: str | None) -> None:
+    """캐시 디렉터리 지정 (None이면 캐시 끔)."""
+    global _cache_dir
+    _cache_dir = path
+
+
+def get_cache_dir() -> str | None:
+    """현재 캐시 디렉터리."""
+    return _cache_dir
+
+
+def _path(*parts: str) -> str:
+    path = os.path.join(_cache_dir, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def _dump(obj, path: str) -> None:
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    pd.to_pickle(obj, tmp)
+    os.replace(tmp, path)
+
+
+def settled_through(end: pd.Timestamp) -> pd.Timestamp:
+    """조회 종료일 중 확정된 마지막 날짜 (당일 장중 데이터는 제외)."""
+    now = datetime.now()
+    today = pd.Timestamp(now.date())
+    if end < today:
+        return end
+    return today if now.hour >= CLOSE_HOUR else today - pd.Timedelta(days=1)
+
+
+def load_ohlcv(code: str) -> dict | None:
+    """캐시된 일봉 로드.
+
+    Returns:
+        {"df": 일반주가 일봉, "factors": 조정 계수, "start": 조회 시작일,
+        "end": 확정 종료일} 또는 None
+    """
+    if not _cache_dir:
+        return None
+    path = os.path.join(_cache_dir, "ohlcv", f"{code}.pkl")
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        with _lock:
+            hit = _memory.get(path)
+            if hit and hit[0] == mtime:
+                _memory.move_to_end(path)
+                return hit[1]
+        entry = pd.read_pickle(path)
+    except (OSError, ValueError, EOFError):
+        return None
+    _remember(path, mtime, entry)
+    return entry
+
+
+def _remember(path: str, mtime: int, entry: dict) -> None:
+    with _lock:
+        _memory[path] = (mtime, entry)
+        _memory.move_to_end(path)
+        while len(_memory) > MEMORY_SIZE:
+            _memory.popitem(last=False)
+
+
+def save_ohlcv(
+    code: str,
+    df: pd.DataFrame,
+    factors: pd.Series,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> None:
+    """일봉 캐시 저장 ([start, end] 구간 조회 완료 표시)."""
+    if not _cache_dir:
+        return
+    path = _path("ohlcv", f"{code}.pkl")
+    entry = {"df": df, "factors": factors, "start": start, "end": end}
+    _dump(entry, path)
+    _remember(path, os.stat(path).st_mtime_ns, entry)
+
+
+def load_stock_list(max_age_days: int | None = None) -> pd.DataFrame | None:
+    """캐시된 종목 마스터 로드.
+
+    Args:
+        max_age_days: 허용 경과일 (None이면 기간 무관)
+    """
+    if not _cache_dir:
+        return None
+    path = os.path.join(_cache_dir, "stock_list.pkl")
+    try:
+        mtime = datetime.fromtimestamp(os.path.getmtime(path))
+        if max_age_days is not None:
+            if (datetime.now().date() - mtime.date()).days > max_age_days:
+                return None
+        return pd.read_pickle(path)
+    except (OSError, ValueError, EOFError):
+        return None
+
+
+def save_stock_list(df: pd.DataFrame) -> None:
+    """종목 마스터 캐시 저장."""
+    if not _cache_dir:
+        return
+    _dump(df, _path("stock_list.pkl"))
+
+
+def load_name(code: str) -> str | None:
+    """캐시된 종목명."""
+    if not _cache_dir:
+        return None
+    try:
+        with open(os.path.join(_cache_dir, "names.json"), encoding="utf-8") as f:
+            return json.load(f).get(code)
+    except (OSError, ValueError):
+        return None
+
+
+def save_name(code: str, name: str) -> None:
+    """종목명 캐시 저장."""
+    if not _cache_dir:
+        return
+    path = _path("names.json")
+    with _names_lock:
+        try:
+            with open(path, encoding="utf-8") as f:
+                names = json.load(f)
+        except (OSError, ValueError):
+            names = {}
+        names[code] = name
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(names, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+
+def load_calendar() -> dict | None:
+    """캐시된 거래일 캘린더."""
+    if not _cache_dir:
+        return None
+    try:
+        return pd.read_pickle(os.path.join(_cache_dir, "calendar.pkl"))
+    except (OSError, ValueError, EOFError):
+        return None
+
+
+def save_calendar(state: dict) -> None:
+    """거래일 캘린더 캐시 저장."""
+    if not _cache_dir:
+        return
+    _dump(state, _path("calendar.pkl"))
@@ -1,13 +1,57 @@
 """차트 시각화."""
 
+import math
+
 import matplotlib as mpl
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.collections import LineCollection
 
 # 기본 설정
 mpl.rcParams.update(mpl.rcParamsDefault)
 mpl.rcParams["axes.unicode_minus"] = False
 
+# 신호 마커 스타일 (plot_strategy, LiveChart 공용)
+STRATEGY_MARKERS = {
+    "extra_buy": {
+        "marker": "^",
+        "s": 60,
+        "alpha": 0.4,
+        "color": "red",
+        "label": "보조 매수",
+    },
+    "primary_buy": {
+        "marker": "^",
+        "s": 100,
+        "alpha": 1.0,
+        "color": "darkred",
+        "label": "매수",
+    },
+    "extra_sell": {
+        "marker": "v",
+        "s": 60,
+        "alpha": 0.4,
+        "color": "blue",
+        "label": "보조 매도",
+    },
+    "primary_sell": {
+        "marker": "v",
+        "s": 100,
+        "alpha": 1.0,
+        "color": "darkblue",
+        "label": "매도",
+    },
+}
+
+# Impulse 마커 스타일 (plot_elder_impulse, LiveChart 공용)
+IMPULSE_MARKERS = {
+    "neutral": {"s": 30, "alpha": 0.7, "color": "gray", "label": "Neutral"},
+    "bull": {"s": 40, "alpha": 0.9, "color": "green", "label": "Bullish"},
+    "bear": {"s": 40, "alpha": 0.9, "color": "red", "label": "Bearish"},
+}
+
 
 def plot_strategy(
     df: pd.DataFrame,
@@ -48,13 +92,7 @@ def plot_strategy(
         # 보조 매수 (연한 빨강)
         if len(extra_buy):
             ax1.scatter(
-                extra_buy,
-                df.loc[extra_buy, "Close"],
-                marker="^",
-                s=60,
-                alpha=0.4,
-                color="red",
-                label="보조 매수",
+                extra_buy, df.loc[extra_buy, "Close"], **STRATEGY_MARKERS["extra_buy"]
             )
 
         # 주요 매수 (진한 빨강)
@@ -62,11 +100,7 @@ def plot_strategy(
             ax1.scatter(
                 primary_buy,
                 df.loc[primary_buy, "Close"],
-                marker="^",
-                s=100,
-                alpha=1.0,
-                color="darkred",
-                label="매수",
+                **STRATEGY_MARKERS["primary_buy"],
             )
 
     if "ActualSell" in df.columns:
@@ -79,11 +113,7 @@ def plot_strategy(
             ax1.scatter(
                 extra_sell,
                 df.loc[extra_sell, "Close"],
-                marker="v",
-                s=60,
-                alpha=0.4,
-                color="blue",
-                label="보조 매도",
+                **STRATEGY_MARKERS["extra_sell"],
             )
 
         # 주요 매도 (진한 파랑)
@@ -91,11 +121,7 @@ def plot_strategy(
             ax1.scatter(
                 primary_sell,
                 df.loc[primary_sell, "Close"],
-                marker="v",
-                s=100,
-                alpha=1.0,
-                color="darkblue",
-                label="매도",
+                **STRATEGY_MARKERS["primary_sell"],
             )
 
     ax1.set_title(title or "주간 추세 전략")
@@ -179,7 +205,7 @@ def plot_elder_impulse(
     """Elder Impulse System 차트.
 
     Args:
-        df: EMA, Impulse 컬럼이 포함된 DataFrame
+        df: EMA, ImpulseCode(또는 Impulse 라벨) 컬럼이 포함된 DataFrame
         title: 차트 제목
         figsize: 그림 크기
         show: plt.show() 호출 여부
@@ -202,38 +228,11 @@ def plot_elder_impulse(
         )
 
     # Impulse 색상 표시
-    if "Impulse" in df.columns:
-        bull_idx = df.index[df["Impulse"] == "bull"]
-        bear_idx = df.index[df["Impulse"] == "bear"]
-        neutral_idx = df.index[df["Impulse"] == "neutral"]
-
-        if len(neutral_idx):
-            ax.scatter(
-                neutral_idx,
-                df.loc[neutral_idx, "Close"],
-                s=30,
-                alpha=0.7,
-                color="gray",
-                label="Neutral",
-            )
-        if len(bull_idx):
-            ax.scatter(
-                bull_idx,
-                df.loc[bull_idx, "Close"],
-                s=40,
-                alpha=0.9,
-                color="green",
-                label="Bullish",
-            )
-        if len(bear_idx):
-            ax.scatter(
-                bear_idx,
-                df.loc[bear_idx, "Close"],
-                s=40,
-                alpha=0.9,
-                color="red",
-                label="Bearish",
-            )
+    masks = _impulse_masks(df)
+    for key in ("neutral", "bull", "bear"):
+        idx = df.index[masks[key]]
+        if len(idx):
+            ax.scatter(idx, df.loc[idx, "Close"], **IMPULSE_MARKERS[key])
 
     ax.set_title(title or "Elder Impulse System")
     ax.set_xlabel("날짜")
@@ -249,17 +248,28 @@ def plot_elder_impulse(
     return fig, ax
 
 
-def plot_multi(results: dict, figsize: tuple = (16, 4), show: bool = True) -> list:
+def plot_multi(
+    results: dict,
+    figsize: tuple = (16, 4),
+    show: bool = True,
+    dashboard: bool = False,
+    cols: int = 5,
+) -> list:
     """다중 종목 차트.
 
     Args:
         results: {종목명: {"df": DataFrame, "bt": bt_df}} 딕셔너리
         figsize: 개별 차트 크기
         show: plt.show() 호출 여부
+        dashboard: True면 plot_dashboard()로 한 그림에 격자 배치
+        cols: 대시보드 열 수
 
     Returns:
-        (fig, ax1, ax2) 튜플 리스트
+        (fig, ax1, ax2) 튜플 리스트 (dashboard면 [(fig, ax)])
     """
+    if dashboard:
+        return [plot_dashboard(results, cols=cols, show=show)]
+
     figs = []
     for name, data in results.items():
         df = data.get("df")
@@ -267,3 +277,345 @@ def plot_multi(results: dict, figsize: tuple = (16, 4), show: bool = True) -> li
         if df is not None:
             figs.append(plot_strategy(df, bt, title=name, figsize=figsize, show=show))
     return figs
+
+
+# 대시보드 셀 안 여백 (셀 크기 1 기준): 좌우, 아래, 제목 영역
+_CELL_PAD_X = 0.04
+_CELL_PAD_BOTTOM = 0.06
+_CELL_TITLE = 0.2
+
+
+def plot_dashboard(
+    results: dict,
+    cols: int = 5,
+    cell_size: tuple = (3.2, 1.8),
+    title: str = "",
+    show: bool = True,
+) -> tuple:
+    """다중 종목 대시보드 (한 그림에 격자 배치).
+
+    종목마다 figure/축을 만드는 plot_multi와 달리 축 하나에 셀 좌표로
+    모든 종목을 그립니다. 종가/MA는 계열마다 LineCollection 하나,
+    매수/매도는 scatter 하나로 모으고(래스터화), 레이아웃은 한 번만
+    계산하므로 종목 수백 개도 수 초 안에 그립니다.
+
+    Args:
+        results: {종목명: {"df": DataFrame, "bt": bt_df}} 딕셔너리
+        cols: 열 수
+        cell_size: 셀 하나의 크기 (인치)
+        title: 전체 제목
+        show: plt.show() 호출 여부
+
+    Returns:
+        (fig, ax) 튜플
+    """
+    items = [
+        (name, data["df"], data.get("bt"))
+        for name, data in results.items()
+        if data.get("df") is not None and not data["df"].empty
+    ]
+    cols = max(1, min(cols, len(items)))
+    rows = max(1, math.ceil(len(items) / cols))
+
+    top = 0.4 if title else 0.0
+    fig = plt.figure(figsize=(cols * cell_size[0], rows * cell_size[1] + top))
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.set_axis_off()
+    ax.set_xlim(0, cols)
+    ax.set_ylim(-rows, top / cell_size[1])
+
+    closes, mas, frames, buys, sells = [], [], [], [], []
+    width = 1 - 2 * _CELL_PAD_X
+    height = 1 - _CELL_PAD_BOTTOM - _CELL_TITLE
+
+    for k, (name, df, bt) in enumerate(items):
+        r, c = divmod(k, cols)
+        x0, y0 = c + _CELL_PAD_X, -(r + 1) + _CELL_PAD_BOTTOM
+
+        # 1) 셀 좌표로 정규화 (x: 바 순서, y: 셀 안 최저~최고)
+        close = df["Close"].to_numpy(dtype=float)
+        ma = df["MA"].to_numpy(dtype=float) if "MA" in df.columns else None
+        lo = np.nanmin(close if ma is None else np.fmin(close, ma))
+        hi = np.nanmax(close if ma is None else np.fmax(close, ma))
+        x = x0 + np.arange(len(df)) * (width / max(len(df) - 1, 1))
+        y = y0 + (close - lo) * (height / ((hi - lo) or 1))
+
+        closes.append(np.column_stack([x, y]))
+        if ma is not None:
+            ok = ~np.isnan(ma)
+            y_ma = y0 + (ma[ok] - lo) * (height / ((hi - lo) or 1))
+            mas.append(np.column_stack([x[ok], y_ma]))
+        frames.append([(c, -r), (c + 1, -r), (c + 1, -r - 1), (c, -r - 1), (c, -r)])
+
+        # 2) 주요 매수(진입)/매도(실제 매도) 위치
+        if bt is not None and not bt.empty:
+            pos = df.index.get_indexer(pd.DatetimeIndex(bt["EntryDate"]))
+            pos = pos[pos >= 0]
+            buys.append(np.column_stack([x[pos], y[pos]]))
+        if "ActualSell" in df.columns:
+            pos = np.flatnonzero(df["ActualSell"].to_numpy() == 1)
+            sells.append(np.column_stack([x[pos], y[pos]]))
+
+        # 3) 셀 제목 (종목명 + 누적 수익률)
+        label = name
+        if bt is not None and not bt.empty:
+            label += f"  {bt['CumRet'].iloc[-1] - 1:+.1%}"
+        ax.text(c + _CELL_PAD_X, -r - 0.03, label, va="top", fontsize=8)
+
+    # 계열별 컬렉션 하나씩
+    ax.add_collection(LineCollection(frames, colors="lightgray", linewidths=0.5))
+    ax.add_collection(
+        LineCollection(closes, colors="black", linewidths=0.7, rasterized=True)
+    )
+    ax.add_collection(
+        LineCollection(
+            mas, colors="gray", linewidths=0.6, linestyles="--", rasterized=True
+        )
+    )
+    for points, marker, color in [(buys, "^", "darkred"), (sells, "v", "darkblue")]:
+        xy = np.vstack(points) if points else np.empty((0, 2))
+        ax.scatter(
+            xy[:, 0], xy[:, 1], marker=marker, s=14, color=color, rasterized=True
+        )
+
+    if title:
+        ax.text(cols / 2, top / cell_size[1] / 2, title, ha="center", va="center")
+
+    if show:
+        plt.show()
+
+    return fig, ax
+
+
+def _strategy_masks(df: pd.DataFrame, bt_df: pd.DataFrame | None) -> dict:
+    """STRATEGY_MARKERS 키별 바 마스크.
+
+    bt_df가 없으면 주요 매수(진입)를 신호 상태 머신으로 구합니다.
+    """
+    n = len(df)
+    buy = df["Buy"].to_numpy() == 1 if "Buy" in df.columns else np.zeros(n, bool)
+    sell = df["Sell"].to_numpy() == 1 if "Sell" in df.columns else np.zeros(n, bool)
+    actual = (
+        df["ActualSell"].to_numpy() == 1
+        if "ActualSell" in df.columns
+        else np.zeros(n, bool)
+    )
+
+    if bt_df is not None:
+        entry = df.index.isin(pd.DatetimeIndex(bt_df["EntryDate"]))
+    else:
+        entry = np.zeros(n, bool)
+        in_pos = False
+        for i in np.flatnonzero(buy | actual):
+            if i == 0:
+                continue
+            if not in_pos and buy[i]:
+                entry[i] = in_pos = True
+            elif in_pos and actual[i]:
+                in_pos = False
+
+    return {
+        "extra_buy": buy & ~entry,
+        "primary_buy": entry,
+        "extra_sell": sell & ~actual,
+        "primary_sell": actual,
+    }
+
+
+def _impulse_masks(df: pd.DataFrame, bt_df=None) -> dict:
+    """IMPULSE_MARKERS 키별 바 마스크."""
+    if "ImpulseCode" in df.columns:
+        code = df["ImpulseCode"].to_numpy()
+        return {"neutral": code == 0, "bull": code == 1, "bear": code == -1}
+    if "Impulse" in df.columns:
+        imp = df["Impulse"].to_numpy()
+        return {k: imp == k for k in IMPULSE_MARKERS}
+    return {k: np.zeros(len(df), bool) for k in IMPULSE_MARKERS}
+
+
+class LiveChart:
+    """스트리밍 바용 실시간 차트 (plot_strategy / plot_elder_impulse 기반).
+
+    처음 한 번 plot_*로 그린 뒤 선/산점도 아티스트를 그대로 두고,
+    update()마다 데이터만 교체해 블리팅(배경 복원 + 변경 아티스트만 그리기)
+    으로 축 영역만 다시 그립니다. 새 바가 현재 x/y 범위를 벗어날 때만
+    여유(margin)를 두고 축을 넓혀 그림 전체를 다시 그립니다.
+
+    Args:
+        df: 초기 DataFrame (plot_strategy / plot_elder_impulse 입력)
+        kind: 'strategy' 또는 'elder'
+        bt_df: 백테스트 결과 (strategy, 없으면 주요 매수를 신호로 계산)
+        title: 차트 제목
+        figsize: 그림 크기
+        margin: 축을 넓힐 때 남길 여유 (현재 데이터 범위 대비 비율)
+        show: 대화형 창 표시 여부 (plt.show(block=False))
+
+    사용 예시:
+        live = LiveChart(df, title="삼성전자")
+        for df in stream():  # 새 바가 붙은(또는 마지막 바가 갱신된) DataFrame
+            live.update(df)
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        kind: str = "strategy",
+        bt_df: pd.DataFrame | None = None,
+        title: str = "",
+        figsize: tuple = (16, 5),
+        margin: float = 0.1,
+        show: bool = False,
+    ):
+        if kind not in ("strategy", "elder"):
+            raise ValueError(f"kind 오류: {kind}")
+        self.kind = kind
+        self.margin = margin
+
+        # 1) 기존 차트 함수로 한 번 그림
+        if kind == "strategy":
+            self.fig, self.ax, self.ax2 = plot_strategy(
+                df, bt_df, title=title, figsize=figsize, show=False
+            )
+            styles, self._masks = STRATEGY_MARKERS, _strategy_masks
+            columns = {self.ax: {"종가": "Close", "MA": "MA"}, self.ax2: {"F&G": "FG"}}
+        else:
+            self.fig, self.ax = plot_elder_impulse(
+                df, title=title, figsize=figsize, show=False
+            )
+            self.ax2 = None
+            styles, self._masks = IMPULSE_MARKERS, _impulse_masks
+            columns = {self.ax: {"종가": "Close", "EMA13": "EMA"}}
+
+        # 2) 갱신할 선 (축, 아티스트, 컬럼)
+        self._lines = [
+            (ax, line, cols[line.get_label()])
+            for ax, cols in columns.items()
+            if ax is not None
+            for line in ax.get_lines()
+            if line.get_label() in cols
+        ]
+
+        # 3) 마커 산점도 (신호가 없어 안 그려진 종류는 빈 산점도로 추가)
+        found = {c.get_label(): c for c in self.ax.collections}
+        self._markers = {}
+        for key, style in styles.items():
+            coll = found.get(style["label"])
+            if coll is None:
+                coll = self.ax.scatter([], [], **style)
+            self._markers[key] = coll
+        if len(found) < len(styles):
+            self.ax.legend(loc="upper left")
+
+        artists = [line for _, line, _ in self._lines] + list(self._markers.values())
+        canvas = self.fig.canvas
+        self._blit = canvas.supports_blit
+        for a in artists if self._blit else []:
+            a.set_animated(True)
+        self._artists = artists
+        self._background = None
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+        # 4) 여유를 둔 x축 범위 + 첫 전체 그리기 (배경 저장)
+        self.update(df, bt_df, redraw=True)
+        if show:
+            plt.show(block=False)
+            plt.pause(0.01)
+
+    # ------------------------------------------------------------------ 그리기
+
+    def _on_draw(self, event) -> None:
+        """전체 그리기 후 배경 저장 + 동적 아티스트 그리기."""
+        if not self._blit:
+            return
+        canvas = self.fig.canvas
+        self._background = canvas.copy_from_bbox(self.ax.bbox)
+        for a in self._artists:
+            self.fig.draw_artist(a)
+
+    def _blit_update(self) -> None:
+        """배경 복원 후 동적 아티스트만 그려 축 영역만 갱신."""
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw()
+            return
+        canvas.restore_region(self._background)
+        for a in self._artists:
+            self.fig.draw_artist(a)
+        canvas.blit(self.ax.bbox)
+        canvas.flush_events()
+
+    def _fits(self, x: np.ndarray) -> bool:
+        """데이터가 현재 축 범위 안에 있는지 여부."""
+        if x[0] < self.ax.get_xlim()[0] or x[-1] > self.ax.get_xlim()[1]:
+            return False
+        for ax, line, _ in self._lines:
+            y = np.asarray(line.get_ydata(), dtype=float)
+            if np.isnan(y).all():
+                continue
+            lo, hi = ax.get_ylim()
+            if np.nanmin(y) < lo or np.nanmax(y) > hi:
+                return False
+        return True
+
+    def _expand(self, x: np.ndarray) -> None:
+        """데이터를 덮도록 축 범위 확장 (줄이지 않음, 끝쪽에 여유)."""
+        lo, hi = self.ax.get_xlim()
+        pad = (x[-1] - x[0]) * self.margin
+        self.ax.set_xlim(min(lo, x[0]), max(hi, x[-1] + pad))
+
+        for ax in {ax for ax, _, _ in self._lines}:
+            ys = [
+                np.asarray(line.get_ydata(), dtype=float)
+                for a, line, _ in self._lines
+                if a is ax
+            ]
+            y = np.concatenate(ys)
+            if np.isnan(y).all():
+                continue
+            y_lo, y_hi = np.nanmin(y), np.nanmax(y)
+            pad = (y_hi - y_lo) * self.margin
+            lo, hi = ax.get_ylim()
+            ax.set_ylim(min(lo, y_lo - pad), max(hi, y_hi + pad))
+
+    # ------------------------------------------------------------------ 갱신
+
+    def update(
+        self,
+        df: pd.DataFrame,
+        bt_df: pd.DataFrame | None = None,
+        redraw: bool = False,
+    ) -> None:
+        """최신 DataFrame으로 차트 갱신.
+
+        새 바 추가와 마지막(진행 중) 바 갱신 모두 전체 DataFrame을 넘기면
+        됩니다. 아티스트 데이터만 바꾸므로 비용은 그리는 점 수에 비례합니다.
+
+        Args:
+            df: 지표/신호가 포함된 최신 DataFrame
+            bt_df: 최신 백테스트 결과 (strategy, 옵션)
+            redraw: 범위와 관계없이 그림 전체 다시 그리기
+        """
+        if df.empty:
+            return
+        x = mdates.date2num(df.index)
+        close = df["Close"].to_numpy(dtype=float)
+
+        # 1) 선/마커 데이터 교체
+        for _, line, col in self._lines:
+            if col in df.columns:
+                line.set_data(x, df[col].to_numpy(dtype=float))
+        for key, mask in self._masks(df, bt_df).items():
+            self._markers[key].set_offsets(np.column_stack([x[mask], close[mask]]))
+
+        # 2) 범위를 벗어나면 축 확장 후 전체, 아니면 블리팅
+        if redraw or not self._fits(x):
+            self._expand(x)
+            self.fig.canvas.draw()
+        elif self._blit:
+            self._blit_update()
+        else:
+            self.fig.canvas.draw_idle()
+
+    def close(self) -> None:
+        """그림 닫기."""
+        plt.close(self.fig)
@@ -0,0 +1,168 @@
+"""결과 내보내기: 분석 결과를 컬럼형(Parquet) 파일로 저장/로드.
+
+종목 하나가 끝날 때마다 바로 기록하며, 종목코드와 봉 주기로 파티션합니다.
+
+    {root}/{table}/timeframe={daily|weekly|monthly}/code={code}/part-0.parquet
+
+table:
+    indicators: 지표/신호 프레임 (df, daily/weekly/monthly)
+    trades: 백테스트 거래 내역 (bt)
+    summary: 요약 통계 1행
+
+pyarrow가 필요합니다 (pip install pyarrow).
+"""
+
+import os
+
+import pandas as pd
+
+TABLES = ("indicators", "trades", "summary")
+TIMEFRAMES = ("daily", "weekly", "monthly")
+
+# 빈 거래 내역도 같은 스키마로 기록하기 위한 dtype
+TRADE_DTYPES = {
+    "EntryDate": "datetime64[ns]",
+    "EntryPrice": "float64",
+    "ExitDate": "datetime64[ns]",
+    "ExitPrice": "float64",
+    "Return": "float64",
+    "CumRet": "float64",
+}
+
+# 거래가 없는 종목의 요약(정수 0)도 다른 종목과 같은 스키마로 기록
+SUMMARY_DTYPES = {
+    "trades": "int64",
+    "avg_ret": "float64",
+    "cum_ret": "float64",
+    "win_rate": "float64",
+}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet 내보내기에는 pyarrow가 필요합니다: pip install pyarrow"
+        ) from e
+    return pa, pq
+
+
+def _path(root: str, table: str, timeframe: str, code: str) -> str:
+    return os.path.join(
+        root, table, f"timeframe={timeframe}", f"code={code}", "part-0.parquet"
+    )
+
+
+class ResultWriter:
+    """분석 결과 스트리밍 기록기.
+
+    사용 예시:
+        writer = ResultWriter("out")
+        for q in queries:
+            writer.write(analyze(q, plot=False, verbose=False))
+
+    같은 종목을 다시 기록하면 해당 파티션 파일을 덮어씁니다.
+    """
+
+    def __init__(self, root: str, compression: str = "zstd"):
+        self.root = root
+        self.compression = compression
+        self.written = 0
+        self._pa, self._pq = _require_pyarrow()
+
+    def _write(self, table: str, timeframe: str, code: str, df: pd.DataFrame):
+        path = _path(self.root, table, timeframe, code)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tbl = self._pa.Table.from_pandas(df, preserve_index=False)
+        tmp = f"{path}.tmp"
+        self._pq.write_table(tbl, tmp, compression=self.compression)
+        os.replace(tmp, path)
+
+    def write(self, result: dict | None) -> None:
+        """analyze()/analyze_full() 결과 1건 기록.
+
+        Args:
+            result: {"code", "name", "df" 또는 "daily"/"weekly"/"monthly",
+                     "bt", "summary"} 딕셔너리 (None이면 무시)
+        """
+        if not result:
+            return
+
+        code = result["code"]
+
+        # 지표 프레임 (analyze의 df는 주봉)
+        frames = {tf: result[tf] for tf in TIMEFRAMES if tf in result}
+        if result.get("df") is not None:
+            frames["weekly"] = result["df"]
+        for tf, df in frames.items():
+            self._write("indicators", tf, code, df.rename_axis("Date").reset_index())
+
+        # 거래 내역 / 요약 (주봉 전략)
+        if result.get("bt") is not None:
+            bt = result["bt"].astype(TRADE_DTYPES)
+            self._write("trades", "weekly", code, bt)
+        if result.get("summary") is not None:
+            row = {"name": result.get("name", ""), **result["summary"]}
+            summary = pd.DataFrame([row]).astype(SUMMARY_DTYPES)
+            self._write("summary", "weekly", code, summary)
+
+        self.written += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def list_codes(root: str, table: str = "indicators", timeframe: str = "weekly"):
+    """저장된 종목코드 목록."""
+    base = os.path.join(root, table, f"timeframe={timeframe}")
+    if not os.path.isdir(base):
+        return []
+    return sorted(d.split("=", 1)[1] for d in os.listdir(base) if d.startswith("code="))
+
+
+def load_results(
+    root: str,
+    table: str = "indicators",
+    columns: list[str] | None = None,
+    codes: list[str] | None = None,
+    timeframe: str = "weekly",
+) -> pd.DataFrame:
+    """저장된 결과 로드 (필요한 컬럼/종목만 읽음).
+
+    종목 선택은 파티션 경로로, 컬럼 선택은 Parquet 컬럼 프로젝션으로
+    처리하므로 큰 결과 집합에서도 요청한 부분만 디스크에서 읽습니다.
+
+    Args:
+        root: ResultWriter 루트 디렉터리
+        table: 'indicators', 'trades', 'summary'
+        columns: 읽을 컬럼 (None이면 전체)
+        codes: 읽을 종목코드 (None이면 전체)
+        timeframe: 'daily', 'weekly', 'monthly'
+
+    Returns:
+        code 컬럼이 앞에 추가된 DataFrame
+    """
+    pa, pq = _require_pyarrow()
+
+    if table not in TABLES:
+        raise ValueError(f"table은 {TABLES} 중 하나여야 합니다: {table}")
+
+    tables = []
+    for code in codes if codes is not None else list_codes(root, table, timeframe):
+        path = _path(root, table, timeframe, code)
+        if not os.path.exists(path):
+            continue
+        names = pq.read_schema(path).names
+        cols = names if columns is None else [c for c in columns if c in names]
+        tbl = pq.read_table(path, columns=cols)
+        tables.append(tbl.add_column(0, "code", pa.array([code] * tbl.num_rows)))
+
+    if not tables:
+        return pd.DataFrame(columns=["code", *(columns or [])])
+
+    return pa.concat_tables(tables, promote_options="default").to_pandas()
@@ -1,11 +1,160 @@
 """데이터 수집: pykrx 기반 OHLCV 조회."""
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 import pandas as pd
+from adjustments import SPLIT_TOL, adjust_ohlcv, split_factors
+from align import index_maps
+from cache import load_ohlcv, save_ohlcv, settled_through
+from quality import validate_ohlcv
+from ratelimit import krx_call
+from trading_calendar import is_cached, last_trading_day, trading_days, uncovered
 from utils import resample_monthly, resample_weekly, to_code
 
-from pykrx import stock
+COL_MAP = {
+    "시가": "Open",
+    "고가": "High",
+    "저가": "Low",
+    "종가": "Close",
+    "거래량": "Volume",
+}
+
+OHLCV = list(COL_MAP.values())
+
+# 과거 구간 수정주가: 종료일 이후 누적 계수를 구하는 KRX 수정주가 조회 기간 (일)
+LATER_FACTOR_DAYS = 14
+
+
+def _fetch_daily(code: str, start: str, end: str) -> pd.DataFrame:
+    """pykrx 일반주가 일봉 조회 (컬럼명 정리, 조정 계수용 등락률 포함).
+
+    요청 조절기를 거치며, 재시도 후에도 실패하면 RequestError가 발생합니다.
+    구간에 확정된 거래일이 있는데 빈 응답이면 조회 제한으로 보고 재시도합니다
+    (상장 전 구간처럼 실제로 데이터가 없어도 재시도 후 RequestError).
+    """
+
+    def expect_data():
+        return len(trading_days(start, settled_through(pd.Timestamp(end)))) > 0
+
+    df = krx_call(
+        "get_market_ohlcv_by_date",
+        start,
+        end,
+        code,
+        adjusted=False,
+        expect_data=expect_data,
+    )
+    if df is None or df.empty:
+        return pd.DataFrame(columns=OHLCV + ["Change"])
+    return df.rename(columns={**COL_MAP, "등락률": "Change"})[OHLCV + ["Change"]]
+
+
+def _load_raw(code: str, start: str, end: str) -> tuple[pd.DataFrame, pd.Series]:
+    """일반주가 일봉 + 조정 계수 (디스크 캐시 사용 시 캐시에 없는 거래일만 조회).
+
+    캐시는 조회를 마친 연속 구간 [start, end]를 보관하며, 거래일 캘린더로
+    요청 구간 중 그 밖에 있는 거래일만 골라 조회합니다. 당일 장중 데이터는
+    확정 전이므로 캐시 구간에 포함하지 않습니다.
+
+    Returns:
+        ([start, end] 일봉, 캐시된 전 구간의 조정 계수)
+    """
+    start_dt, end_dt = pd.Timestamp(start), pd.Timestamp(end)
+    entry = load_ohlcv(code)
+
+    if entry is None:
+        df = _fetch_daily(code, start, end)
+        factors = split_factors(df)
+        if not df.empty:
+            save_ohlcv(code, df, factors, start_dt, settled_through(end_dt))
+        return df, factors
+
+    df, factors = entry["df"], entry["factors"]
+    c_start, c_end = entry["start"], entry["end"]
+
+    # 캐시 구간과 떨어진 요청은 따로 조회 (캐시는 빈틈 없는 한 구간만 보관,
+    # 더 최근 구간이면 캐시를 교체)
+    hole = (
+        trading_days(end_dt + pd.Timedelta(days=1), c_start - pd.Timedelta(days=1))
+        if end_dt < c_start
+        else trading_days(c_end + pd.Timedelta(days=1), start_dt - pd.Timedelta(days=1))
+    )
+    if len(hole):
+        df = _fetch_daily(code, start, end)
+        factors = split_factors(df)
+        if end_dt > c_end and not df.empty:
+            save_ohlcv(code, df, factors, start_dt, settled_through(end_dt))
+        return df, factors
+
+    gaps = uncovered(start_dt, end_dt, c_start, c_end)
+
+    if gaps:
+        parts = [df] + [
+            _fetch_daily(code, s.strftime("%Y%m%d"), e.strftime("%Y%m%d"))
+            for s, e in gaps
+        ]
+        df = pd.concat([p for p in parts if not p.empty])
+        df = df[~df.index.duplicated(keep="last")].sort_index()
+        factors = split_factors(df)
+        c_start = min(c_start, start_dt)
+        c_end = max(c_end, settled_through(end_dt))
+        save_ohlcv(code, df, factors, c_start, c_end)
+
+    return df[(df.index >= start_dt) & (df.index <= end_dt)], factors
+
+
+def _later_factor(code: str, raw: pd.DataFrame, end: str) -> float:
+    """종료일 이후 분할/병합의 누적 계수 (종료일 부근 수정주가 / 일반주가).
+
+    종료일 직전 LATER_FACTOR_DAYS일만 KRX 수정주가로 조회해, 같은 날의
+    일반주가 종가와 비교합니다.
+    """
+    start = (pd.Timestamp(end) - timedelta(days=LATER_FACTOR_DAYS)).strftime("%Y%m%d")
+    adj = krx_call("get_market_ohlcv_by_date", start, end, code, adjusted=True)
+    if adj is None or adj.empty or raw.empty:
+        return 1.0
+    close = pd.concat([raw["Close"], adj["종가"]], axis=1, join="inner").astype(float)
+    close = close[(close > 0).all(axis=1)]
+    if close.empty:
+        return 1.0
+    ratio = close.iloc[-1, 1] / close.iloc[-1, 0]
+    return 1.0 if abs(ratio - 1) <= SPLIT_TOL else float(ratio)
+
+
+def _load_daily(code: str, start: str, end: str, adjusted: bool) -> pd.DataFrame:
+    """일봉 조회 (수정주가는 일반주가에 조정 계수를 곱해 로컬 계산).
+
+    수정주가는 종료일 이후의 분할/병합도 반영해야 합니다. 종료일이 최근이거나
+    캐시가 마지막 거래일까지 덮고 있으면 일반주가를 마지막 거래일까지 이어
+    조회하고 (캐시 사용 시 보통 추가 조회 없음), 과거 구간이면 요청 구간만
+    조회한 뒤 종료일 이후 누적 계수는 _later_factor의 짧은 조회로 구합니다.
+    """
+    if not adjusted:
+        df, _ = _load_raw(code, start, end)
+        return df[OHLCV]
+
+    end_dt = pd.Timestamp(end)
+    last = last_trading_day()
+    entry = load_ohlcv(code)
+    covered = entry is not None and is_cached(
+        end_dt + pd.Timedelta(days=1), last, entry["start"], entry["end"]
+    )
+
+    if covered or end_dt + timedelta(days=LATER_FACTOR_DAYS) >= last:
+        df, factors = _load_raw(code, start, max(end, last.strftime("%Y%m%d")))
+        df = df.loc[df.index <= end_dt, OHLCV]
+    else:
+        df, factors = _load_raw(code, start, end)
+        df = df[OHLCV]
+        if not factors.empty:  # 빈 계수는 RangeIndex라 날짜 비교 불가
+            factors = factors[factors.index <= end_dt]
+        later = _later_factor(code, df, end)
+        if later != 1.0:
+            after = pd.Series(
+                [later], index=[end_dt + pd.Timedelta(days=1)], name="Factor"
+            )
+            factors = pd.concat([factors, after]) if len(factors) else after
+    return adjust_ohlcv(df, factors)
 
 
 def fetch_ohlcv(
@@ -14,6 +163,7 @@ def fetch_ohlcv(
     end: str | None = None,
     period: str = "weekly",
     adjusted: bool = True,
+    validate: bool = False,
 ) -> tuple[pd.DataFrame | None, str | None]:
     """종목 OHLCV 데이터 수집.
 
@@ -22,22 +172,29 @@ def fetch_ohlcv(
         start: 시작일 (YYYYMMDD 또는 YYYY-MM-DD)
         end: 종료일
         period: 'daily', 'weekly', 'monthly'
-        adjusted: True=수정주가(네이버), False=일반주가(KRX)
+        adjusted: True=수정주가, False=일반주가(KRX)
+        validate: 일봉 품질 검사 후 보정 (quality.validate_ohlcv,
+            문제가 있으면 건수 출력)
 
     Note:
-        pykrx의 수정주가는 액면분할만 반영하며,
-        yfinance와 달리 배당 재투자는 미반영됩니다.
+        수정주가는 KRX 일반주가와 등락률(기준가)에서 구한 분할/병합 등
+        권리 변동 계수로 계산하며, yfinance와 달리 배당 재투자는 미반영됩니다.
+        두 주가 모두 같은 일반주가 캐시에서 만들어지므로 조회는 한 번입니다.
 
     Returns:
         (DataFrame, 종목코드) 또는 (None, None)
+
+    Raises:
+        ratelimit.RequestError: pykrx 조회가 재시도 후에도 실패한 경우
+            (데이터 없음과 구분)
     """
     code = to_code(query)
     if not code:
         print(f"[오류] '{query}' 종목을 찾을 수 없습니다.")
         return None, None
 
-    # 날짜 기본값
-    end_dt = datetime.now()
+    # 날짜 기본값 (종료일은 마지막 거래일)
+    end_dt = last_trading_day()
     start_dt = end_dt - timedelta(days=365 * 3)  # 기본 3년
 
     if start:
@@ -50,22 +207,20 @@ def fetch_ohlcv(
     else:
         end = end_dt.strftime("%Y%m%d")
 
-    # pykrx로 데이터 조회
-    df = stock.get_market_ohlcv_by_date(start, end, code, adjusted=adjusted)
+    # pykrx로 데이터 조회 (캐시 사용 시 부족분만)
+    df = _load_daily(code, start, end, adjusted)
 
     if df.empty:
         print(f"[오류] '{query}'({code}) 데이터 없음")
         return None, None
 
-    # 컬럼명 정리
-    col_map = {
-        "시가": "Open",
-        "고가": "High",
-        "저가": "Low",
-        "종가": "Close",
-        "거래량": "Volume",
-    }
-    df = df.rename(columns=col_map)[["Open", "High", "Low", "Close", "Volume"]]
+    # 품질 검사/보정 (리샘플링 전 일봉 기준)
+    if validate:
+        report, df = validate_ohlcv(df, code, repair=True)
+        if not report.empty:
+            counts = report["issue"].value_counts()
+            detail = ", ".join(f"{k} {v}" for k, v in counts[counts > 0].items())
+            print(f"[경고] '{query}'({code}) 품질 문제 {len(report)}건 보정: {detail}")
 
     # 유효 데이터 필터
     df = df[(df[["Open", "High", "Low", "Close"]] > 0).all(axis=1)]
@@ -85,7 +240,11 @@ def fetch_ohlcv(
 
 
 def fetch_multi_period(
-    query: str, start: str | None = None, end: str | None = None, adjusted: bool = True
+    query: str,
+    start: str | None = None,
+    end: str | None = None,
+    adjusted: bool = True,
+    validate: bool = False,
 ) -> dict | None:
     """일봉/주봉/월봉 데이터 동시 조회.
 
@@ -94,15 +253,25 @@ def fetch_multi_period(
         start: 시작일
         end: 종료일
         adjusted: 수정주가 여부
+        validate: 일봉 품질 검사 후 보정 (fetch_ohlcv 참조)
 
     Returns:
-        {"daily": df, "weekly": df, "monthly": df, "code": str} 또는 None
+        {"daily": df, "weekly": df, "monthly": df, "code": str, "maps": dict} 또는 None
+        (maps: align.index_maps() 결과, 일봉→주봉/월봉, 주봉→월봉 위치)
     """
-    daily, code = fetch_ohlcv(query, start, end, period="daily", adjusted=adjusted)
+    daily, code = fetch_ohlcv(
+        query, start, end, period="daily", adjusted=adjusted, validate=validate
+    )
     if daily is None:
         return None
 
     weekly = resample_weekly(daily)
     monthly = resample_monthly(daily)
 
-    return {"daily": daily, "weekly": weekly, "monthly": monthly, "code": code}
+    return {
+        "daily": daily,
+        "weekly": weekly,
+        "monthly": monthly,
+        "code": code,
+        "maps": index_maps(daily.index, weekly.index, monthly.index),
+    }
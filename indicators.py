@@ -2,6 +2,18 @@
 
 import numpy as np
 import pandas as pd
+from backend import use_polars
+
+# 지표별 워밍업 (윈도 시작 전 필요한 바 수)
+FG_WARMUP = 52 + 7  # 52주 포지션 + 7주 스무딩
+TD_WARMUP = 4 + 9  # 4봉 전 비교 + 셋업 완성(9카운트)
+
+# Elder Impulse 코드 ↔ 라벨
+IMPULSE_CODES = {"bear": -1, "neutral": 0, "bull": 1}
+_IMPULSE_LABELS = np.array(["bear", "neutral", "bull"], dtype=object)
+
+# Elder Impulse 기울기를 0(보합)으로 보는 가격 대비 상대 허용 오차
+_SLOPE_TOL = 1e-13
 
 
 def calc_ma(s: pd.Series, n: int) -> pd.Series:
@@ -14,6 +26,48 @@ def calc_ema(s: pd.Series, n: int) -> pd.Series:
     return s.ewm(span=n, adjust=False).mean()
 
 
+def calc_ema_batch(values, spans) -> np.ndarray:
+    """여러 기간 EMA를 패널 단위로 계산 (calc_ema와 같은 재귀).
+
+    종목별 루프 대신 (T, N) 패널 전체에 DataFrame.ewm을 기간마다 한 번씩
+    적용합니다.
+
+    앞쪽 결측(상장 전)은 calc_ema처럼 첫 유효 값부터 시작하고,
+    중간 결측은 직전 값으로 채워 계산합니다.
+
+    Args:
+        values: (T,) 시계열 또는 (T, N) 패널 (Series, DataFrame, 배열)
+        spans: EMA 기간 리스트
+
+    Returns:
+        (len(spans), T) 또는 (len(spans), T, N) float64 배열
+    """
+    x = np.asarray(values, dtype=np.float64)
+    squeeze = x.ndim == 1
+    panel = pd.DataFrame(x[:, None] if squeeze else x).ffill()
+    out = np.full((len(spans),) + panel.shape, np.nan)
+    for i, span in enumerate(spans):
+        # span <= 1은 alpha = 1 (EMA = 원계열)
+        alpha = min(2 / (span + 1), 1.0)
+        out[i] = panel.ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    return out[:, :, 0] if squeeze else out
+
+
+def ema_warmup(n: int, tol: float = 1e-2) -> int:
+    """EMA 수렴에 필요한 워밍업 바 수.
+
+    초기값의 잔여 가중치 (1 - alpha)^k 가 tol 이하가 되는 최소 k.
+
+    Args:
+        n: EMA 기간
+        tol: 수렴 허용 오차
+    """
+    if n <= 1:
+        return 0
+    alpha = 2 / (n + 1)
+    return int(np.ceil(np.log(tol) / np.log(1 - alpha)))
+
+
 def calc_cmf(df: pd.DataFrame, n: int = 4) -> pd.Series:
     """Chaikin Money Flow.
 
@@ -107,44 +161,97 @@ def calc_td_setup(df: pd.DataFrame, col: str = "Close") -> pd.DataFrame:
     return df
 
 
-def calc_elder_impulse(df: pd.DataFrame, ema_period: int = 13) -> pd.DataFrame:
+def _flat_to_zero(slope: np.ndarray, tol: np.ndarray) -> np.ndarray:
+    return np.where(np.abs(slope) <= tol, 0.0, slope)
+
+
+def _impulse(close, ema_period: int) -> dict[str, np.ndarray]:
+    """Elder Impulse 배열 계산 ((T,) 또는 (T, N) 종가)."""
+    ema, ema12, ema26 = calc_ema_batch(close, [ema_period, 12, 26])
+    macd = ema12 - ema26
+    signal = calc_ema_batch(macd, [9])[0]
+    hist = macd - signal
+
+    # 기울기 (첫 바는 NaN → neutral). 반올림 오차(가격 대비 ~1e-14)로
+    # 보합 구간(거래정지, 상/하한가 고정)이 bull/bear로 흔들리지 않도록
+    # 가격 대비 _SLOPE_TOL 이하의 기울기는 0으로 봄
+    tol = _SLOPE_TOL * np.abs(ema)
+    ema_slope = _flat_to_zero(np.diff(ema, axis=0, prepend=np.nan), tol)
+    hist_slope = _flat_to_zero(np.diff(hist, axis=0, prepend=np.nan), tol)
+    code = ((ema_slope > 0) & (hist_slope > 0)).astype(np.int8)
+    code -= ((ema_slope < 0) & (hist_slope < 0)).astype(np.int8)
+    return {
+        "EMA": ema,
+        "MACD": macd,
+        "MACD_Signal": signal,
+        "MACD_Hist": hist,
+        "ImpulseCode": code,
+    }
+
+
+def impulse_labels(codes):
+    """Impulse 코드(-1/0/1) → 라벨('bear'/'neutral'/'bull').
+
+    Args:
+        codes: 코드 배열, Series 또는 DataFrame
+
+    Returns:
+        같은 형태의 라벨 (object dtype)
+    """
+    labels = _IMPULSE_LABELS[np.asarray(codes, dtype=np.int64) + 1]
+    if isinstance(codes, pd.DataFrame):
+        return pd.DataFrame(labels, index=codes.index, columns=codes.columns)
+    if isinstance(codes, pd.Series):
+        return pd.Series(labels, index=codes.index, name=codes.name)
+    return labels
+
+
+def calc_elder_impulse(
+    df: pd.DataFrame, ema_period: int = 13, labels: bool = False
+) -> pd.DataFrame:
     """Elder Impulse System 계산.
 
     - EMA 기울기와 MACD 히스토그램 기울기로 추세 판별
-    - bull: 둘 다 상승
-    - bear: 둘 다 하락
-    - neutral: 혼조
+    - bull(1): 둘 다 상승
+    - bear(-1): 둘 다 하락
+    - neutral(0): 혼조
 
     Args:
         df: OHLCV DataFrame
         ema_period: EMA 기간 (기본 13)
+        labels: 문자열 Impulse 라벨 컬럼도 추가할지 여부 (기본은 ImpulseCode만,
+            라벨은 필요할 때 impulse_labels로 변환)
 
     Returns:
-        EMA13, MACD, Impulse 컬럼이 추가된 DataFrame
+        EMA, MACD, MACD_Signal, MACD_Hist, ImpulseCode(int8),
+        Impulse(labels=True) 컬럼이 추가된 DataFrame
     """
     df = df.copy()
-    close = df["Close"]
-
-    # EMA
-    df["EMA"] = calc_ema(close, ema_period)
+    for col, values in _impulse(df["Close"].to_numpy(), ema_period).items():
+        df[col] = values
+    if labels:
+        df["Impulse"] = impulse_labels(df["ImpulseCode"])
+    return df
 
-    # MACD (12, 26, 9)
-    ema12 = calc_ema(close, 12)
-    ema26 = calc_ema(close, 26)
-    df["MACD"] = ema12 - ema26
-    df["MACD_Signal"] = calc_ema(df["MACD"], 9)
-    df["MACD_Hist"] = df["MACD"] - df["MACD_Signal"]
 
-    # Impulse 판정
-    ema_slope = df["EMA"].diff()
-    hist_slope = df["MACD_Hist"].diff()
+def calc_elder_impulse_panel(
+    close: pd.DataFrame, ema_period: int = 13
+) -> dict[str, pd.DataFrame]:
+    """다중 종목 Elder Impulse (EMA를 종목 루프 없이 패널 단위로 계산).
 
-    impulse = pd.Series("neutral", index=df.index)
-    impulse[(ema_slope > 0) & (hist_slope > 0)] = "bull"
-    impulse[(ema_slope < 0) & (hist_slope < 0)] = "bear"
-    df["Impulse"] = impulse
+    Args:
+        close: 날짜 × 종목코드 종가 패널 (상장 전 등 결측은 NaN)
+        ema_period: EMA 기간
 
-    return df
+    Returns:
+        {"EMA", "MACD", "MACD_Signal", "MACD_Hist", "ImpulseCode"} →
+        close와 같은 모양의 DataFrame (종가가 없는 칸의 ImpulseCode는 0)
+    """
+    arrays = _impulse(close.to_numpy(dtype=np.float64), ema_period)
+    return {
+        col: pd.DataFrame(values, index=close.index, columns=close.columns)
+        for col, values in arrays.items()
+    }
 
 
 def add_indicators(
@@ -160,6 +267,11 @@ def add_indicators(
     Returns:
         지표가 추가된 DataFrame
     """
+    if use_polars() and not df.empty:
+        import backend
+
+        return backend.add_indicators(df, ma_period, cmf_period)
+
     df = df.copy()
     df["MA"] = calc_ma(df["Close"], ma_period)
     df["CMF"] = calc_cmf(df, cmf_period)
@@ -169,6 +281,44 @@ def add_indicators(
     return df
 
 
+def indicator_warmup(
+    ma_period: int = 10,
+    cmf_period: int = 4,
+    include_td: bool = False,
+    include_elder: bool = False,
+    ema_period: int = 13,
+    tol: float = 1e-2,
+) -> int:
+    """지표 계산에 필요한 워밍업 바 수.
+
+    윈도 시작 전 이 만큼의 바를 함께 계산하면 윈도 구간의 지표 값이
+    전체 이력으로 계산한 값과 같아집니다 (EMA는 tol 이내로 수렴).
+    TD Setup은 연속 카운트이므로 TD_WARMUP보다 긴 연속 구간은 잘릴 수 있습니다.
+
+    Args:
+        ma_period: 이동평균 기간
+        cmf_period: CMF 기간
+        include_td: DeMark TD Setup 포함 여부
+        include_elder: Elder Impulse 포함 여부
+        ema_period: Elder EMA 기간
+        tol: EMA 수렴 허용 오차
+
+    Returns:
+        워밍업 바 수
+    """
+    warmup = max(ma_period, cmf_period, FG_WARMUP)
+
+    if include_td:
+        warmup = max(warmup, TD_WARMUP)
+
+    if include_elder:
+        # MACD 시그널은 MACD(EMA26) 수렴 후 다시 EMA9로 수렴, 기울기용 +1
+        macd = ema_warmup(26, tol) + ema_warmup(9, tol)
+        warmup = max(warmup, ema_warmup(ema_period, tol), macd) + 1
+
+    return warmup
+
+
 def add_all_indicators(
     df: pd.DataFrame,
     ma_period: int = 10,
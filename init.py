@@ -13,22 +13,55 @@
 
     # DeMark/Elder 포함 전체 분석
     result = analyze_full("삼성전자")
+
+    # 전체 시장 스캔 (완료 순 스트리밍, 일정 메모리)
+    for code, result in analyze_iter(codes, keep_df=False, jobs=8):
+        ...
+
+    # 여러 전략 설정을 한 번의 조회로 ((strategy, code) 결과 표)
+    table = run_batch(codes, {"base": {}, "fast": {"ma_period": 5}}, jobs=8)
 """
 
-from chart import plot_elder_impulse, plot_multi, plot_strategy, plot_td_setup
+from collections.abc import Iterator
+
+import pandas as pd
+from align import broadcast, execute_daily, index_maps
+from backend import get_backend, set_backend
+from batch import iter_batch, run_batch
+from cache import set_cache_dir
+from export import ResultWriter, load_results
 from fetcher import fetch_multi_period, fetch_ohlcv
 from indicators import (
+    TD_WARMUP,
     add_all_indicators,
     add_indicators,
     calc_cmf,
     calc_elder_impulse,
+    calc_elder_impulse_panel,
     calc_ema,
+    calc_ema_batch,
     calc_fear_greed,
     calc_ma,
     calc_td_setup,
+    ema_warmup,
+    impulse_labels,
+    indicator_warmup,
 )
-from signals import backtest, generate_signals, print_summary, summary
+from quality import summarize as summarize_quality
+from quality import validate_ohlcv, validate_panel
+from ratelimit import RequestError, RequestGovernor
+from ratelimit import configure as configure_requests
+from ratelimit import metrics as request_metrics
+from robustness import monte_carlo, print_robustness, robustness, robustness_table
+from runs import RunManager, load_journal, run_market
+from screener import SignalTable
+from search import search
+from shm import analyze_panel, analyze_shared
+from signals import backtest, generate_signals, in_position, print_summary, summary
+from trading_calendar import is_trading_day, last_trading_day, trading_days
 from utils import (
+    bars_to_days,
+    bounded_map,
     filter_period,
     get_stock_list,
     resample_monthly,
@@ -68,28 +101,47 @@ def analyze(
     if df is None:
         return None
 
-    name = f"{to_name(code)} ({code})"
+    # 2) 지표 → 신호 → 백테스트
+    result = run_strategy(df, code, ma_period, cmf_period)
+    name = f"{result['name']} ({code})"
 
-    # 2) 지표 계산
-    df = add_indicators(df, ma_period, cmf_period)
+    # 3) 출력
+    if verbose:
+        print_summary(result["bt"], name)
 
-    # 3) 신호 생성
-    df = generate_signals(df)
+    # 4) 차트
+    if plot:
+        from chart import plot_strategy
 
-    # 4) 백테스트
-    bt = backtest(df)
+        plot_strategy(result["df"], result["bt"], title=name)
 
-    # 5) 출력
-    if verbose:
-        print_summary(bt, name)
+    return result
 
-    # 6) 차트
-    if plot:
-        plot_strategy(df, bt, title=name)
 
+def run_strategy(
+    df: pd.DataFrame,
+    code: str,
+    ma_period: int = 10,
+    cmf_period: int = 4,
+    name: str | None = None,
+) -> dict:
+    """조회된 주봉으로 analyze()의 계산 단계 실행 (지표 → 신호 → 백테스트).
+
+    Args:
+        df: OHLCV 주봉
+        code: 종목코드
+        ma_period: 이동평균 기간
+        cmf_period: CMF 기간
+        name: 종목명 (기본 to_name(code), 조회가 필요할 수 있음)
+
+    Returns:
+        {"code", "name", "df", "bt", "summary"}
+    """
+    df = generate_signals(add_indicators(df, ma_period, cmf_period))
+    bt = backtest(df)
     return {
         "code": code,
-        "name": to_name(code),
+        "name": name or to_name(code),
         "df": df,
         "bt": bt,
         "summary": summary(bt),
@@ -105,12 +157,18 @@ def analyze_full(
     adjusted: bool = True,
     plot: bool = True,
     verbose: bool = True,
+    window_years: int | None = None,
+    tol: float = 1e-2,
 ) -> dict | None:
     """전체 분석 (기본 전략 + DeMark + Elder Impulse).
 
     일봉/주봉/월봉 데이터에 대해 모든 지표를 계산하고
     차트를 생성합니다.
 
+    window_years를 지정하면 종료일 기준 최근 N년 윈도만 평가합니다.
+    각 지표의 워밍업 구간만큼만 더 조회/계산한 뒤 윈도로 잘라내므로
+    이력이 긴 종목에서 조회량과 계산량이 줄어듭니다 (start는 무시).
+
     Args:
         query: 종목명 또는 코드
         start: 시작일
@@ -120,10 +178,27 @@ def analyze_full(
         adjusted: 수정주가 여부
         plot: 차트 표시 여부
         verbose: 결과 출력 여부
+        window_years: 평가 윈도 (년), None이면 전체 기간
+        tol: EMA 워밍업 수렴 허용 오차
 
     Returns:
-        {"code", "name", "daily", "weekly", "monthly", "bt", "summary"} 또는 None
+        {"code", "name", "daily", "weekly", "monthly", "maps", "bt", "summary"} 또는 None
     """
+    # 0) 윈도 모드: 워밍업을 포함한 조회 시작일 계산
+    window_start = None
+    if window_years is not None:
+        end_dt = pd.Timestamp(end) if end else pd.Timestamp.now().normalize()
+        window_start = end_dt - pd.DateOffset(years=window_years)
+        weekly_warmup = indicator_warmup(
+            ma_period, cmf_period, include_td=True, include_elder=True, tol=tol
+        )
+        warmup_days = max(
+            bars_to_days(TD_WARMUP, "daily"),
+            bars_to_days(weekly_warmup, "weekly"),
+            bars_to_days(TD_WARMUP, "monthly"),
+        )
+        start = (window_start - pd.Timedelta(days=warmup_days)).strftime("%Y%m%d")
+
     # 1) 다중 기간 데이터 수집
     data = fetch_multi_period(query, start, end, adjusted)
     if data is None:
@@ -135,11 +210,10 @@ def analyze_full(
     daily = data["daily"]
     weekly = data["weekly"]
     monthly = data["monthly"]
+    maps = data["maps"]
 
-    # 2) 주봉 기본 지표 + 신호
+    # 2) 주봉 기본 지표
     weekly = add_indicators(weekly, ma_period, cmf_period)
-    weekly = generate_signals(weekly)
-    bt = backtest(weekly)
 
     # 3) DeMark TD Setup (일봉/주봉/월봉)
     daily = calc_td_setup(daily)
@@ -149,12 +223,25 @@ def analyze_full(
     # 4) Elder Impulse (주봉)
     weekly = calc_elder_impulse(weekly)
 
-    # 5) 출력
+    # 5) 윈도 모드: 워밍업 구간 제거
+    if window_start is not None:
+        daily = daily[daily.index >= window_start]
+        weekly = weekly[weekly.index >= window_start]
+        monthly = monthly[monthly.index >= window_start]
+        maps = index_maps(daily.index, weekly.index, monthly.index)
+
+    # 6) 주봉 신호 + 백테스트
+    weekly = generate_signals(weekly)
+    bt = backtest(weekly)
+
+    # 7) 출력
     if verbose:
         print_summary(bt, name)
 
-    # 6) 차트
+    # 8) 차트
     if plot:
+        from chart import plot_elder_impulse, plot_strategy, plot_td_setup
+
         # 기본 전략 차트
         plot_strategy(weekly, bt, title=f"{name} 주간 전략")
 
@@ -182,11 +269,68 @@ def analyze_full(
         "daily": daily,
         "weekly": weekly,
         "monthly": monthly,
+        "maps": maps,
         "bt": bt,
         "summary": summary(bt),
     }
 
 
+def analyze_iter(
+    queries: list[str],
+    start: str | None = None,
+    end: str | None = None,
+    ma_period: int = 10,
+    cmf_period: int = 4,
+    adjusted: bool = True,
+    verbose: bool = False,
+    keep_df: bool = True,
+    jobs: int = 1,
+    max_pending: int | None = None,
+) -> Iterator[tuple[str, dict]]:
+    """다중 종목 전략 분석 (완료되는 종목부터 순차 생성).
+
+    결과를 모아두지 않으므로 전체 시장 스캔도 일정한 메모리로 처리합니다.
+    소비자가 다음 결과를 요청할 때만 새 작업을 제출하므로, 동시에 존재하는
+    결과는 최대 max_pending개로 제한됩니다 (느린 소비자 배압).
+
+    사용 예시:
+        with ResultWriter("out") as writer:
+            for code, result in analyze_iter(codes, keep_df=False, jobs=8):
+                writer.write(result)
+
+    Args:
+        queries: 종목명 또는 코드 리스트
+        start, end, ma_period, cmf_period, adjusted: analyze()와 동일
+        verbose: 결과 출력 여부
+        keep_df: False면 무거운 df를 버리고 bt/summary만 유지
+        jobs: 동시 분석 스레드 수 (1이면 입력 순서대로 순차 실행)
+        max_pending: 동시 진행/대기 결과 상한 (기본 jobs * 2)
+
+    Yields:
+        (종목코드, 분석결과) 튜플 (실패 종목은 건너뜀)
+    """
+
+    def run(q):
+        result = analyze(
+            q,
+            start,
+            end,
+            ma_period,
+            cmf_period,
+            adjusted,
+            plot=False,
+            verbose=False,
+        )
+        if result and not keep_df:
+            result.pop("df")
+        return result
+
+    for result in bounded_map(run, queries, jobs, max_pending):
+        if verbose:
+            print_summary(result["bt"], f"{result['name']} ({result['code']})")
+        yield result["code"], result
+
+
 def analyze_multi(
     queries: list[str],
     start: str | None = None,
@@ -196,6 +340,8 @@ def analyze_multi(
     adjusted: bool = True,
     plot: bool = True,
     verbose: bool = True,
+    export_dir: str | None = None,
+    jobs: int = 1,
 ) -> dict:
     """다중 종목 전략 분석.
 
@@ -205,33 +351,88 @@ def analyze_multi(
         adjusted: True=수정주가, False=일반주가
         plot: 차트 표시 여부
         verbose: 결과 출력 여부
+        export_dir: 지정 시 종목별 결과를 완료 즉시 Parquet로 기록
+        jobs: 동시 분석 스레드 수 (analyze_iter 참고)
 
     Returns:
         {종목명: 분석결과} 딕셔너리
     """
+    writer = ResultWriter(export_dir) if export_dir else None
+
     results = {}
-    for q in queries:
-        result = analyze(
-            q, start, end, ma_period, cmf_period, adjusted, plot=False, verbose=verbose
-        )
-        if result:
-            results[result["name"]] = result
+    for _, result in analyze_iter(
+        queries,
+        start,
+        end,
+        ma_period,
+        cmf_period,
+        adjusted,
+        verbose=verbose,
+        jobs=jobs,
+    ):
+        results[result["name"]] = result
+        if writer:
+            writer.write(result)
 
     if plot and results:
+        from chart import plot_multi
+
         plot_multi({k: {"df": v["df"], "bt": v["bt"]} for k, v in results.items()})
 
     print(f"\n=== 분석 완료: {len(results)}/{len(queries)} 종목 ===")
     return results
 
 
+# 차트 모듈은 matplotlib 로드 비용이 커서 처음 사용할 때 불러옴
+_CHART_NAMES = {
+    "plot_strategy",
+    "plot_multi",
+    "plot_dashboard",
+    "LiveChart",
+    "plot_td_setup",
+    "plot_elder_impulse",
+}
+
+
+def __getattr__(name: str):
+    if name in _CHART_NAMES:
+        import chart
+
+        return getattr(chart, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # 통합 API
     "analyze",
     "analyze_full",
     "analyze_multi",
+    "analyze_iter",
+    "analyze_shared",
+    "analyze_panel",
+    "run_strategy",
+    "iter_batch",
+    "run_batch",
+    "run_market",
+    "RunManager",
+    "load_journal",
+    "set_backend",
+    "get_backend",
     # 데이터 수집
     "fetch_ohlcv",
     "fetch_multi_period",
+    "validate_panel",
+    "validate_ohlcv",
+    "summarize_quality",
+    "RequestGovernor",
+    "RequestError",
+    "configure_requests",
+    "request_metrics",
+    # 스크리너
+    "SignalTable",
+    # 내보내기
+    "ResultWriter",
+    "load_results",
     # 지표
     "add_indicators",
     "add_all_indicators",
@@ -239,23 +440,47 @@ __all__ = [
     "calc_fear_greed",
     "calc_ma",
     "calc_ema",
+    "calc_ema_batch",
     "calc_td_setup",
     "calc_elder_impulse",
+    "calc_elder_impulse_panel",
+    "impulse_labels",
+    "ema_warmup",
+    "indicator_warmup",
+    # 기간 정렬
+    "index_maps",
+    "broadcast",
+    "execute_daily",
     # 신호
     "generate_signals",
     "backtest",
+    "in_position",
     "summary",
     "print_summary",
+    # 강건성
+    "monte_carlo",
+    "robustness",
+    "robustness_table",
+    "print_robustness",
     # 차트
     "plot_strategy",
     "plot_multi",
+    "plot_dashboard",
+    "LiveChart",
     "plot_td_setup",
     "plot_elder_impulse",
     # 유틸
     "to_code",
     "to_name",
+    "search",
     "get_stock_list",
     "resample_weekly",
     "resample_monthly",
     "filter_period",
+    "bars_to_days",
+    # 캐시 / 거래일
+    "set_cache_dir",
+    "trading_days",
+    "last_trading_day",
+    "is_trading_day",
 ]
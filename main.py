@@ -1,5 +1,276 @@
-def main():
-    print("Hello from trend-pkg!")
+"""trend-signal CLI: 배치 스크리닝/분석/백테스트.
+
+사용 예시:
+    trend-signal scan -f watchlist.txt --jobs 8 --cache-dir ~/.cache/trend-signal
+    cat codes.txt | trend-signal backtest --format json
+    trend-signal analyze 삼성전자 --period 1y
+    trend-signal watch -f watchlist.txt --state-dir .trend_state
+    trend-signal run -f all_codes.txt --run-dir runs/20261019 --jobs 8
+    trend-signal batch -f codes.txt --strategies strategies.json --jobs 8
+
+무거운 모듈(pandas, pykrx, matplotlib)은 인자 파싱 이후 필요할 때만 불러오므로
+--help나 캐시된 단일 종목 조회는 빠르게 끝납니다.
+"""
+
+import argparse
+import json
+import re
+import sys
+from datetime import date, timedelta
+
+_PERIOD_DAYS = {"d": 1, "w": 7, "m": 31, "y": 365}
+
+
+def _period_start(period: str) -> str:
+    """'3y', '6m', '12w', '90d' → 시작일 (YYYYMMDD)."""
+    m = re.fullmatch(r"(\d+)([dwmy])", period.strip().lower())
+    if not m:
+        raise argparse.ArgumentTypeError(f"기간 형식 오류: {period} (예: 3y, 6m, 90d)")
+    days = int(m.group(1)) * _PERIOD_DAYS[m.group(2)]
+    return (date.today() - timedelta(days=days)).strftime("%Y%m%d")
+
+
+def _read_symbols(args) -> list[str]:
+    """위치 인자, -f 파일, 또는 표준입력에서 종목 목록 읽기."""
+    symbols = list(args.symbols)
+    if args.file:
+        if args.file == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.file, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        symbols += [q.split("#", 1)[0].strip() for q in lines]
+    elif not symbols and not sys.stdin.isatty():
+        symbols = [q.split("#", 1)[0].strip() for q in sys.stdin.read().splitlines()]
+    return [q for q in symbols if q]
+
+
+def _iter_results(args, keep_df: bool):
+    from init import analyze_iter
+
+    return analyze_iter(
+        _read_symbols(args),
+        start=args.period or args.start,
+        end=args.end,
+        ma_period=args.ma_period,
+        cmf_period=args.cmf_period,
+        adjusted=not args.raw,
+        keep_df=keep_df,
+        jobs=args.jobs,
+    )
+
+
+def _emit(args, rows: list[dict]) -> None:
+    """표/JSON/Parquet 출력."""
+    import pandas as pd
+
+    if args.format == "json":
+        text = json.dumps(rows, ensure_ascii=False, indent=1)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(text)
+        else:
+            print(text)
+    elif args.format == "parquet":
+        pd.DataFrame(rows).to_parquet(args.output, index=False)
+    elif rows:
+        print(pd.DataFrame(rows).to_string(index=False))
+    else:
+        print("결과 없음")
+
+
+def cmd_scan(args) -> None:
+    """최신 바 신호 스크리닝."""
+    from signals import latest_signals
+    from utils import json_value
+
+    rows = []
+    for code, r in _iter_results(args, keep_df=True):
+        row = {"code": code, "name": r["name"], **latest_signals(r["df"])}
+        if args.signal == "buy" and row["Buy"] != 1:
+            continue
+        if args.signal == "sell" and row["Sell"] != 1:
+            continue
+        rows.append({k: json_value(v) for k, v in row.items()})
+    _emit(args, rows)
+
+
+def cmd_analyze(args) -> None:
+    """종목별 전략 요약 (+ 차트)."""
+    from utils import json_value
+
+    plot = not args.no_plot
+    writer = _writer(args)
+    rows = []
+    for code, r in _iter_results(args, keep_df=plot or writer is not None):
+        rows.append({"code": code, "name": r["name"], **r["summary"]})
+        if writer:
+            writer.write(r)
+        if plot:
+            from chart import plot_strategy
+
+            plot_strategy(r["df"], r["bt"], title=f"{r['name']} ({code})")
+    if writer is None:
+        _emit(args, [{k: json_value(v) for k, v in row.items()} for row in rows])
+
+
+def cmd_backtest(args) -> None:
+    """종목별 거래 내역."""
+    from signals import print_summary
+    from utils import json_records, json_value
+
+    writer = _writer(args)
+    out = []
+    for code, r in _iter_results(args, keep_df=False):
+        if writer:
+            writer.write(r)
+        elif args.format == "table":
+            print_summary(r["bt"], f"{r['name']} ({code})")
+        else:
+            out.append(
+                {
+                    "code": code,
+                    "name": r["name"],
+                    "summary": {k: json_value(v) for k, v in r["summary"].items()},
+                    "trades": json_records(r["bt"]),
+                }
+            )
+    if out:
+        _emit(args, out)
+
+
+def cmd_watch(args) -> None:
+    """워치리스트 일일 업데이트 (runner.run_watchlist)."""
+    from runner import run_watchlist
+
+    run_watchlist(
+        _read_symbols(args),
+        state_dir=args.state_dir,
+        ma_period=args.ma_period,
+        cmf_period=args.cmf_period,
+        adjusted=not args.raw,
+        jobs=args.jobs,
+        table_path=args.table,
+    )
+
+
+def cmd_run(args) -> None:
+    """체크포인트 기반 전체 실행 (runs.RunManager)."""
+    from runs import run_market
+
+    run_market(
+        _read_symbols(args),
+        args.run_dir,
+        start=args.period or args.start,
+        end=args.end,
+        ma_period=args.ma_period,
+        cmf_period=args.cmf_period,
+        adjusted=not args.raw,
+        jobs=args.jobs,
+        retries=args.retries,
+        export=not args.no_export,
+    )
+
+
+def cmd_batch(args) -> None:
+    """여러 전략 설정 배치 스크리닝 (batch.run_batch, 종목당 조회 1회)."""
+    from batch import run_batch
+    from utils import json_value
+
+    with open(args.strategies, encoding="utf-8") as f:
+        strategies = json.load(f)
+
+    table = run_batch(
+        _read_symbols(args),
+        strategies,
+        start=args.period or args.start,
+        end=args.end,
+        adjusted=not args.raw,
+        jobs=args.jobs,
+    )
+    rows = table.reset_index().to_dict("records")
+    _emit(args, [{k: json_value(v) for k, v in row.items()} for row in rows])
+
+
+def _writer(args):
+    """analyze/backtest의 Parquet 출력은 종목별 파티션으로 스트리밍 기록."""
+    if args.format != "parquet":
+        return None
+    from export import ResultWriter
+
+    return ResultWriter(args.output)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("symbols", nargs="*", help="종목명 또는 코드")
+    common.add_argument("-f", "--file", help="종목 리스트 파일 ('-'는 표준입력)")
+    common.add_argument("-j", "--jobs", type=int, default=4, help="동시 처리 수")
+    common.add_argument("--cache-dir", help="OHLCV 디스크 캐시 디렉터리")
+    common.add_argument(
+        "--period", type=_period_start, help="조회 기간 (예: 3y, 6m, 90d)"
+    )
+    common.add_argument("--start", help="시작일 (YYYYMMDD), --period가 우선")
+    common.add_argument("--end", help="종료일 (YYYYMMDD)")
+    common.add_argument("--ma-period", type=int, default=10)
+    common.add_argument("--cmf-period", type=int, default=4)
+    common.add_argument("--raw", action="store_true", help="일반주가 사용")
+    common.add_argument(
+        "--format", choices=["table", "json", "parquet"], default="table"
+    )
+    common.add_argument("-o", "--output", help="출력 경로 (parquet는 필수)")
+
+    parser = argparse.ArgumentParser(
+        prog="trend-signal", description="KRX 주간 추세 전략 배치 도구"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("scan", parents=[common], help="최신 바 신호 스크리닝")
+    p.add_argument("--signal", choices=["any", "buy", "sell"], default="any")
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser("analyze", parents=[common], help="전략 요약 및 차트")
+    p.add_argument("--no-plot", action="store_true", help="차트 생략")
+    p.set_defaults(func=cmd_analyze)
+
+    p = sub.add_parser("backtest", parents=[common], help="거래 내역")
+    p.set_defaults(func=cmd_backtest)
+
+    p = sub.add_parser("watch", parents=[common], help="워치리스트 일일 업데이트")
+    p.add_argument("--state-dir", default=".trend_state")
+    p.add_argument("--table", help="신호 테이블(screener) 저장 경로")
+    p.set_defaults(func=cmd_watch)
+
+    p = sub.add_parser("run", parents=[common], help="체크포인트/재개 전체 실행")
+    p.add_argument("--run-dir", required=True, help="저널/결과 디렉터리")
+    p.add_argument("--retries", type=int, default=3, help="실패 시 재시도 횟수")
+    p.add_argument("--no-export", action="store_true", help="Parquet 결과 생략")
+    p.set_defaults(func=cmd_run)
+
+    p = sub.add_parser("batch", parents=[common], help="여러 전략 설정 배치 스크리닝")
+    p.add_argument(
+        "--strategies",
+        required=True,
+        help='전략 설정 JSON ({"이름": {"ma_period": 5, ...}}, batch 모듈 참조)',
+    )
+    p.set_defaults(func=cmd_batch)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.format == "parquet" and not args.output:
+        parser.error("--format parquet에는 --output이 필요합니다")
+
+    if args.cache_dir:
+        from cache import set_cache_dir
+
+        set_cache_dir(args.cache_dir)
+
+    args.func(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,214 @@
+"""데이터 품질 검사: 거래일 누락, OHLC 불일치, 거래량 0, 수익률 이상치.
+
+여러 종목을 (code, date) 프레임 하나로 이어 붙여 모든 검사를 벡터 연산
+한 번으로 처리하고, 문제 바를 한 행씩 담은 리포트를 돌려줍니다.
+
+    issue            의미                                   보정(repair=True)
+    bad_price        가격 결측 또는 0 이하                    행 제거
+    ohlc             High < max(Open, Close) 등 OHLC 불일치   High/Low를 OHLC 최대/최소로
+    zero_volume      거래량 0 (거래정지 등)                   행 제거
+    outlier          로그 수익률 robust z-score 초과          유지 (실제 급등락일 수 있음)
+    spike            다음 바에 되돌아가는 이상치 (오류 데이터)   행 제거
+    missing          거래일 캘린더 대비 누락 구간 (value=일수)   보정 안 함
+    off_calendar     거래일이 아닌 날짜의 바                   보정 안 함
+
+    report, fixed = validate_panel(frames, repair=True)
+    summarize(report)  # 종목 × 문제 종류 건수
+"""
+
+import numpy as np
+import pandas as pd
+from trading_calendar import trading_days
+
+ISSUES = [
+    "bad_price",
+    "ohlc",
+    "zero_volume",
+    "outlier",
+    "spike",
+    "missing",
+    "off_calendar",
+]
+PRICE_COLS = ["Open", "High", "Low", "Close"]
+
+# 로그 수익률 robust z-score 기준 (중앙값/MAD, 일봉 기준)
+Z_THRESH = 8.0
+_MAD_SCALE = 1.4826
+
+
+def _stack(frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """{종목코드: DataFrame} → (code, date) MultiIndex 프레임."""
+    frames = {c: df for c, df in frames.items() if not df.empty}
+    if not frames:
+        return pd.DataFrame(
+            columns=PRICE_COLS + ["Volume"],
+            index=pd.MultiIndex.from_arrays([[], pd.DatetimeIndex([])]),
+        )
+    return pd.concat(frames, names=["code", "date"]).sort_index(kind="stable")
+
+
+def _issues(codes, dates, mask, issue: str, value=np.nan) -> pd.DataFrame:
+    value = np.broadcast_to(np.asarray(value, dtype=float), mask.shape)
+    return pd.DataFrame(
+        {
+            "code": codes[mask],
+            "date": dates[mask],
+            "issue": issue,
+            "value": value[mask],
+        }
+    )
+
+
+def _check(
+    long: pd.DataFrame, z_thresh: float, calendar: pd.DatetimeIndex | None
+) -> tuple[pd.DataFrame, dict[str, np.ndarray]]:
+    """(code, date) 프레임 검사 → (리포트, 보정용 행 마스크)."""
+    codes = long.index.get_level_values(0).to_numpy()
+    dates = long.index.get_level_values(1)
+    n = len(long)
+    first = np.ones(n, dtype=bool)
+    first[1:] = codes[1:] != codes[:-1]
+    last = np.roll(first, -1)
+
+    o, h, l, c = (long[col].to_numpy(dtype=float) for col in PRICE_COLS)
+    vol = long["Volume"].to_numpy(dtype=float)
+
+    # 1) 가격/거래량
+    bad = ~((o > 0) & (h > 0) & (l > 0) & (c > 0))
+    ohlc = ~bad & ((h < np.fmax(o, c)) | (l > np.fmin(o, c)) | (h < l))
+    zero = ~bad & ~(vol > 0)
+
+    # 2) 로그 수익률 robust z-score (종목별 중앙값/MAD)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lc = np.log(np.where(bad, np.nan, c))
+    ret = np.full(n, np.nan)
+    ret[1:] = lc[1:] - lc[:-1]
+    ret[first] = np.nan
+    r = pd.Series(ret)
+    med = r.groupby(codes).transform("median").to_numpy()
+    mad = (r - med).abs().groupby(codes).transform("median").to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (ret - med) / np.where(mad > 0, _MAD_SCALE * mad, np.nan)
+    outlier = np.abs(z) > z_thresh
+
+    # 이상치 직후 반대 방향 이상치로 되돌아가면 그 바는 오류 데이터(spike)
+    next_z = np.full(n, np.nan)
+    next_z[:-1] = z[1:]
+    next_z[last] = np.nan
+    spike = outlier & (np.abs(next_z) > z_thresh) & (np.sign(next_z) != np.sign(z))
+    reverted = np.roll(spike, 1) & ~first  # spike 다음 바의 되돌림 수익률
+    outlier &= ~(spike | reverted)
+
+    parts = [
+        _issues(codes, dates, bad, "bad_price"),
+        _issues(codes, dates, ohlc, "ohlc"),
+        _issues(codes, dates, zero, "zero_volume", vol),
+        _issues(codes, dates, outlier, "outlier", z),
+        _issues(codes, dates, spike, "spike", z),
+    ]
+
+    # 3) 거래일 캘린더 대비 누락/비거래일
+    if n and calendar is None:
+        calendar = trading_days(dates.min(), dates.max())
+    if n and len(calendar):
+        pos = calendar.searchsorted(dates)
+        on_cal = calendar[np.minimum(pos, len(calendar) - 1)] == dates
+        on_cal &= pos < len(calendar)
+        parts.append(_issues(codes, dates, ~on_cal, "off_calendar"))
+
+        # 거래일 위치가 2 이상 뛰면 그 사이가 누락 (거래일 바만 비교)
+        idx = np.flatnonzero(on_cal)
+        gap = np.zeros(len(idx), dtype=np.int64)
+        same = codes[idx[1:]] == codes[idx[:-1]]
+        gap[1:] = np.where(same, pos[idx[1:]] - pos[idx[:-1]] - 1, 0)
+        hit = gap > 0
+        parts.append(
+            pd.DataFrame(
+                {
+                    "code": codes[idx[hit]],
+                    "date": calendar[pos[idx[hit]] - gap[hit]],  # 첫 누락일
+                    "issue": "missing",
+                    "value": gap[hit].astype(float),
+                }
+            )
+        )
+
+    report = pd.concat(parts, ignore_index=True)
+    report["issue"] = pd.Categorical(report["issue"], categories=ISSUES)
+    report = report.sort_values(["code", "date", "issue"], kind="stable")
+    masks = {"bad_price": bad, "ohlc": ohlc, "zero_volume": zero, "spike": spike}
+    return report.reset_index(drop=True), masks
+
+
+def _repair(long: pd.DataFrame, masks: dict, drop_zero_volume: bool) -> pd.DataFrame:
+    """문제 바 제거 + OHLC 불일치 보정."""
+    drop = masks["bad_price"] | masks["spike"]
+    if drop_zero_volume:
+        drop |= masks["zero_volume"]
+
+    fixed = long.copy()
+    ohlc = masks["ohlc"]
+    if ohlc.any():
+        prices = fixed.loc[ohlc, PRICE_COLS]
+        fixed.loc[ohlc, "High"] = prices.max(axis=1).astype(fixed["High"].dtype)
+        fixed.loc[ohlc, "Low"] = prices.min(axis=1).astype(fixed["Low"].dtype)
+    return fixed[~drop]
+
+
+def validate_panel(
+    frames: dict[str, pd.DataFrame],
+    z_thresh: float = Z_THRESH,
+    calendar: pd.DatetimeIndex | None = None,
+    repair: bool = False,
+    drop_zero_volume: bool = True,
+) -> tuple[pd.DataFrame, dict[str, pd.DataFrame] | None]:
+    """다중 종목 일봉 품질 검사 (한 번의 벡터 연산).
+
+    Args:
+        frames: {종목코드: OHLCV 일봉}
+        z_thresh: 로그 수익률 robust z-score 이상치 기준
+        calendar: 거래일 (기본: trading_calendar.trading_days)
+        repair: 보정된 데이터도 반환할지 여부
+        drop_zero_volume: 보정 시 거래량 0 바 제거 여부
+
+    Returns:
+        (리포트, 보정 데이터 또는 None)
+        리포트: code, date, issue, value 컬럼 (문제 1건당 1행,
+        value는 z-score / 누락 거래일 수 / 거래량)
+    """
+    long = _stack(frames)
+    report, masks = _check(long, z_thresh, calendar)
+    if not repair:
+        return report, None
+
+    fixed = _repair(long, masks, drop_zero_volume)
+    groups = dict(tuple(fixed.groupby(level=0, sort=False)))
+    # 이어 붙이며 바뀐 dtype은 종목별 원래 dtype으로 복원
+    repaired = {
+        code: (
+            groups[code].droplevel(0).rename_axis(df.index.name).astype(df.dtypes)
+            if code in groups
+            else df.iloc[:0]
+        )
+        for code, df in frames.items()
+    }
+    return report, repaired
+
+
+def validate_ohlcv(
+    df: pd.DataFrame, code: str = "", **kwargs
+) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+    """단일 종목 품질 검사 (validate_panel 참조).
+
+    Returns:
+        (리포트, 보정 DataFrame 또는 None)
+    """
+    report, repaired = validate_panel({code: df}, **kwargs)
+    return report, None if repaired is None else repaired[code]
+
+
+def summarize(report: pd.DataFrame) -> pd.DataFrame:
+    """리포트 요약: 종목 × 문제 종류 건수."""
+    return pd.crosstab(report["code"], report["issue"], dropna=False).rename_axis(
+        columns=None
+    )
@@ -0,0 +1,224 @@
+"""pykrx 요청 조절: 토큰 버킷 + 적응형 백오프 + 재시도 + 지표.
+
+모든 pykrx 네트워크 요청은 프로세스 공용 RequestGovernor를 거칩니다.
+
+- 토큰 버킷: 초당 rate개, 최대 burst개까지 몰아서 요청
+- AIMD: 성공하면 rate를 조금씩 올리고, 예외(HTTP 오류 포함)면 절반으로 줄여
+  지속 가능한 최대 처리량을 찾아감. 빈 응답은 휴장일/상장 전 구간 등 정상
+  결과일 수 있으므로, 호출자가 expect_data로 데이터가 있어야 한다고 알린
+  경우에만 제한 신호로 봄 (pykrx는 조회 제한/HTML 응답을 빈 프레임으로 바꿈)
+- 재시도: 예외는 retries회, 기대한 데이터가 빈 응답이면 empty_retries회까지
+  지수 백오프 후 재시도하고, 그래도 실패하면 RequestError를 발생
+  (조용히 버리지 않음)
+- 지표: 요청/오류/재시도/빈 응답/제한 이벤트 수, 지연 p50/p90/p99, 현재 rate
+
+    from ratelimit import krx_call, metrics
+    df = krx_call("get_market_ohlcv_by_date", "20240101", "20241231", "005930")
+"""
+
+import random
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+
+class RequestError(RuntimeError):
+    """재시도 후에도 실패한 pykrx 요청."""
+
+
+def _is_empty(result) -> bool:
+    if result is None:
+        return True
+    if hasattr(result, "empty"):
+        return bool(result.empty)
+    if isinstance(result, (list, tuple, dict)):
+        return not result
+    return False
+
+
+class RequestGovernor:
+    """공유 요청 조절기 (스레드 안전).
+
+    Args:
+        rate: 시작 초당 요청 수
+        burst: 토큰 버킷 크기
+        min_rate, max_rate: rate 조절 범위
+        increase: 성공 1건당 rate 증가량 (가산 증가)
+        decrease: 제한 감지 시 rate 배율 (승산 감소)
+        retries: 예외 재시도 횟수
+        empty_retries: 기대한 데이터가 빈 응답일 때 재시도 횟수
+        backoff: 첫 재시도 대기 (초), 이후 2배씩 증가
+        max_backoff: 재시도 대기 상한 (초)
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        min_rate: float = 0.5,
+        max_rate: float = 30.0,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        retries: int = 4,
+        empty_retries: int = 2,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.retries = retries
+        self.empty_retries = empty_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._last_throttle = 0.0
+        self._latency: deque = deque(maxlen=2048)
+        self._counts = dict.fromkeys(
+            ["requests", "errors", "empty", "retries", "throttle_events", "failures"], 0
+        )
+
+    # ------------------------------------------------------------------ 버킷
+
+    def acquire(self) -> None:
+        """토큰 1개 예약 후 차례가 될 때까지 대기."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._stamp) * self.rate
+            )
+            self._stamp = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def _success(self, latency: float) -> None:
+        with self._lock:
+            self._latency.append(latency)
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def _throttle(self) -> None:
+        """제한 감지: rate 절반, 남은 토큰 비움 (초당 1회까지만 감소)."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_throttle < 1.0:
+                return
+            self._last_throttle = now
+            self._counts["throttle_events"] += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = min(self._tokens, 0.0)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+
+    def _sleep(self, attempt: int) -> None:
+        delay = min(self.backoff * 2**attempt, self.max_backoff)
+        time.sleep(delay * random.uniform(0.5, 1.0))
+
+    # ------------------------------------------------------------------ 호출
+
+    def call(self, fn, *args, expect_data=None, **kwargs):
+        """요청 1건 실행 (버킷 대기, 재시도, 지표 기록).
+
+        Args:
+            fn: 요청 함수 (args, kwargs로 호출)
+            expect_data: 빈 응답일 때 호출해 참이면 (데이터가 있어야 하는 요청)
+                제한으로 보고 재시도 (None이면 빈 응답을 그대로 반환)
+
+        Returns:
+            fn 결과
+
+        Raises:
+            RequestError: 예외가 retries회, 또는 기대한 데이터의 빈 응답이
+                empty_retries회 재시도 후에도 계속된 경우
+        """
+        errors = empties = 0
+        while True:
+            self.acquire()
+            self._count("requests")
+            t0 = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                self._count("errors")
+                self._throttle()
+                if errors >= self.retries:
+                    self._count("failures")
+                    name = getattr(fn, "__name__", str(fn))
+                    raise RequestError(
+                        f"{name}{args} 요청 실패 ({errors + 1}회): {e}"
+                    ) from e
+                self._sleep(errors)
+                errors += 1
+                self._count("retries")
+                continue
+
+            if _is_empty(result):
+                self._count("empty")
+                if expect_data is not None and expect_data():
+                    self._throttle()
+                    if empties >= self.empty_retries:
+                        self._count("failures")
+                        name = getattr(fn, "__name__", str(fn))
+                        raise RequestError(
+                            f"{name}{args} 빈 응답 ({empties + 1}회, 조회 제한 의심)"
+                        )
+                    self._sleep(empties)
+                    empties += 1
+                    self._count("retries")
+                    continue
+            self._success(time.perf_counter() - t0)
+            return result
+
+    def metrics(self) -> dict:
+        """요청 지표 (카운트, 지연 백분위(초), 현재 rate)."""
+        with self._lock:
+            lat = np.array(self._latency)
+            m = {**self._counts, "rate": round(self.rate, 3)}
+        for p in (50, 90, 99):
+            m[f"p{p}"] = float(np.percentile(lat, p)) if len(lat) else None
+        return m
+
+
+_governor = RequestGovernor()
+
+
+def get_governor() -> RequestGovernor:
+    """프로세스 공용 요청 조절기."""
+    return _governor
+
+
+def configure(**kwargs) -> RequestGovernor:
+    """공용 요청 조절기 재설정 (RequestGovernor 인자, 지표 초기화)."""
+    global _governor
+    _governor = RequestGovernor(**kwargs)
+    return _governor
+
+
+def krx_call(name: str, *args, expect_data=None, **kwargs):
+    """pykrx stock 함수 호출 (공용 요청 조절기 경유).
+
+    Args:
+        name: pykrx.stock 함수 이름 (예: 'get_market_ohlcv_by_date')
+        expect_data: RequestGovernor.call 참조
+    """
+    from utils import krx
+
+    return _governor.call(
+        getattr(krx(), name), *args, expect_data=expect_data, **kwargs
+    )
+
+
+def metrics() -> dict:
+    """공용 요청 조절기 지표."""
+    return _governor.metrics()
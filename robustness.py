@@ -0,0 +1,211 @@
+"""강건성 분석: 거래 수익률 부트스트랩/순열 Monte Carlo.
+
+backtest() 결과(또는 여러 종목의 거래 수익률 행렬)로부터 수만 회의
+재표본을 NumPy 배치 연산으로 생성해 최종 자산, 승률, 최대 낙폭의
+분포와 신뢰구간을 계산합니다. 재표본 단위의 Python 루프는 없고,
+메모리 상한을 위해 재표본 축만 청크로 나눕니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+# 청크 하나의 최대 원소 수 (n_sims x 종목 x 거래)
+_CHUNK_ELEMS = 4_000_000
+
+
+def trade_matrix(bts: dict | list) -> tuple[np.ndarray, list]:
+    """여러 백테스트 결과 → 거래 수익률 행렬.
+
+    Args:
+        bts: {이름: bt_df 또는 analyze 결과} 딕셔너리 또는 bt_df 리스트
+
+    Returns:
+        (종목 x 최대거래수 행렬 (빈 칸 NaN), 이름 리스트)
+    """
+    if isinstance(bts, dict):
+        names = list(bts)
+        items = list(bts.values())
+    else:
+        names = list(range(len(bts)))
+        items = list(bts)
+
+    rets = [
+        np.asarray((b["bt"] if isinstance(b, dict) else b)["Return"], dtype=float)
+        for b in items
+    ]
+    width = max((len(r) for r in rets), default=0)
+    mat = np.full((len(rets), width), np.nan)
+    for i, r in enumerate(rets):
+        mat[i, : len(r)] = r
+    return mat, names
+
+
+def _simulate(r, valid, counts, n, method, rng):
+    """청크 1개 시뮬레이션 → (최종 자산, 승률, 최대 낙폭), 각 (n, m)."""
+    m, k = r.shape
+
+    if method == "bootstrap":
+        # 종목별 거래 수 안에서 복원 추출
+        u = rng.random((n, m, k))
+        idx = (u * np.maximum(counts, 1)[None, :, None]).astype(np.intp)
+    else:
+        # 유효 거래만 섞고 빈 칸은 뒤로 보냄
+        keys = rng.random((n, m, k))
+        keys[:, ~valid] = np.inf
+        idx = np.argsort(keys, axis=-1)
+
+    sampled = np.take_along_axis(r[None], idx, axis=-1)
+    sampled = np.where(valid[None], sampled, 0.0)
+
+    equity = np.cumprod(1 + sampled, axis=-1)
+    peak = np.maximum(np.maximum.accumulate(equity, axis=-1), 1.0)
+    max_dd = (equity / peak - 1).min(axis=-1, initial=0.0)
+    final = equity[..., -1] if k else np.ones((n, m))
+    wins = (sampled > 0).sum(axis=-1) / np.maximum(counts, 1)
+    return final, wins, max_dd
+
+
+def monte_carlo(
+    returns,
+    n_sims: int = 10000,
+    method: str = "bootstrap",
+    seed: int | None = None,
+) -> dict:
+    """거래 수익률 Monte Carlo 시뮬레이션.
+
+    Args:
+        returns: bt_df, 1차원 수익률 배열, 또는 종목 x 거래 행렬 (빈 칸 NaN)
+        n_sims: 재표본 횟수
+        method: 'bootstrap' (복원 추출) 또는 'permutation' (거래 순서 섞기)
+        seed: 난수 시드
+
+    Note:
+        순열은 거래 집합이 같으므로 최종 자산/승률은 고정이고
+        경로 의존 지표인 최대 낙폭만 분포를 가집니다.
+
+    Returns:
+        {"final", "win_rate", "max_dd"} 배열 딕셔너리
+        (1차원 입력은 (n_sims,), 행렬 입력은 (n_sims, 종목수))
+    """
+    if method not in ("bootstrap", "permutation"):
+        raise ValueError(f"method는 'bootstrap' 또는 'permutation': {method}")
+
+    if isinstance(returns, pd.DataFrame):
+        returns = returns["Return"]
+    r = np.asarray(returns, dtype=float)
+    single = r.ndim == 1
+    r = np.atleast_2d(r)
+
+    valid = ~np.isnan(r)
+    # 유효 거래를 앞으로 정렬 (부트스트랩 인덱스가 앞쪽 counts개를 가리키도록)
+    order = np.argsort(~valid, axis=1, kind="stable")
+    r = np.take_along_axis(r, order, axis=1)
+    valid = np.take_along_axis(valid, order, axis=1)
+    counts = valid.sum(axis=1)
+
+    rng = np.random.default_rng(seed)
+    chunk = max(1, _CHUNK_ELEMS // max(r.size, 1))
+    parts = [
+        _simulate(r, valid, counts, min(chunk, n_sims - s), method, rng)
+        for s in range(0, n_sims, chunk)
+    ]
+    final, wins, max_dd = (np.concatenate(p) for p in zip(*parts))
+
+    if single:
+        final, wins, max_dd = final[:, 0], wins[:, 0], max_dd[:, 0]
+    return {"final": final, "win_rate": wins, "max_dd": max_dd}
+
+
+def _max_drawdown(returns: np.ndarray) -> float:
+    equity = np.cumprod(1 + returns)
+    if not len(equity):
+        return 0.0
+    peak = np.maximum(np.maximum.accumulate(equity), 1.0)
+    return float(min((equity / peak - 1).min(), 0.0))
+
+
+def robustness(
+    bt_df: pd.DataFrame,
+    n_sims: int = 10000,
+    method: str = "bootstrap",
+    ci: float = 0.95,
+    seed: int | None = None,
+) -> dict:
+    """백테스트 강건성 요약 (신뢰구간).
+
+    Args:
+        bt_df: backtest() 결과
+        n_sims: 재표본 횟수
+        method: 'bootstrap' 또는 'permutation'
+        ci: 신뢰수준
+        seed: 난수 시드
+
+    Returns:
+        trades, cum_ret/win_rate/max_dd 관측값과 각 지표의 _lo/_med/_hi 딕셔너리
+    """
+    rets = bt_df["Return"].to_numpy(dtype=float) if not bt_df.empty else np.array([])
+    s = {
+        "trades": len(rets),
+        "cum_ret": float(np.prod(1 + rets) - 1),
+        "win_rate": float((rets > 0).mean()) if len(rets) else 0.0,
+        "max_dd": _max_drawdown(rets),
+    }
+    sims = monte_carlo(rets, n_sims, method, seed)
+    sims["cum_ret"] = sims.pop("final") - 1
+    qs = [(1 - ci) / 2, 0.5, (1 + ci) / 2]
+    for key in ("cum_ret", "win_rate", "max_dd"):
+        lo, med, hi = np.quantile(sims[key], qs)
+        s.update({f"{key}_lo": lo, f"{key}_med": med, f"{key}_hi": hi})
+    return s
+
+
+def robustness_table(
+    results: dict,
+    n_sims: int = 10000,
+    method: str = "bootstrap",
+    ci: float = 0.95,
+    seed: int | None = None,
+) -> pd.DataFrame:
+    """다중 종목 강건성 요약 (종목 전체를 한 번에 배치 계산).
+
+    Args:
+        results: analyze_multi() 결과 또는 {이름: bt_df}
+        n_sims, method, ci, seed: robustness()와 동일
+
+    Returns:
+        종목별 trades 및 cum_ret/win_rate/max_dd 신뢰구간 DataFrame
+    """
+    mat, names = trade_matrix(results)
+    sims = monte_carlo(mat, n_sims, method, seed)
+    sims["cum_ret"] = sims.pop("final") - 1
+
+    qs = [(1 - ci) / 2, 0.5, (1 + ci) / 2]
+    table = pd.DataFrame({"trades": (~np.isnan(mat)).sum(axis=1)}, index=names)
+    for key in ("cum_ret", "win_rate", "max_dd"):
+        lo, med, hi = np.quantile(sims[key], qs, axis=0)
+        table[f"{key}_lo"], table[f"{key}_med"], table[f"{key}_hi"] = lo, med, hi
+    return table
+
+
+def print_robustness(
+    bt_df: pd.DataFrame, name: str = "", n_sims: int = 10000, ci: float = 0.95
+) -> None:
+    """강건성 분석 결과 출력."""
+    s = robustness(bt_df, n_sims=n_sims, ci=ci)
+    title = f" {name} 강건성 " if name else " 강건성 "
+    print(f"\n{'=' * 20}{title}{'=' * 20}")
+
+    if s["trades"] == 0:
+        print("거래 없음")
+        return
+
+    print(f"부트스트랩 {n_sims:,}회, 신뢰수준 {ci:.0%}")
+    for key, label in [
+        ("cum_ret", "누적 수익률"),
+        ("win_rate", "승률"),
+        ("max_dd", "최대 낙폭"),
+    ]:
+        print(
+            f"{label}: {s[key]:.2%} "
+            f"[{s[f'{key}_lo']:.2%} ~ {s[f'{key}_hi']:.2%}, 중앙값 {s[f'{key}_med']:.2%}]"
+        )
@@ -0,0 +1,338 @@
+"""일일 워치리스트 러너: 신규 바만 처리하는 주간 전략 증분 실행.
+
+종목별 상태(마지막 일봉 날짜, 지표 계산용 주봉 꼬리, 보유 포지션)를
+JSON 파일로 저장하고, 매 실행마다 마지막 확정 주봉 이후의 일봉만 조회해
+상태를 전진시킨 뒤 새 매수(Buy)/실제 매도(ActualSell) 이벤트를 출력합니다.
+
+실행: python runner.py watchlist.txt --state-dir .trend_state
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from adjustments import PRICE_COLS, SPLIT_TOL
+from fetcher import fetch_ohlcv
+from indicators import add_indicators, indicator_warmup
+from ratelimit import RequestError
+from screener import SignalTable
+from signals import generate_signals
+from trading_calendar import trading_days
+from utils import resample_weekly, to_code, to_name
+
+OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def read_watchlist(path: str) -> list[str]:
+    """워치리스트 파일 읽기 (한 줄에 종목 하나, '#' 주석 허용)."""
+    with open(path, encoding="utf-8") as f:
+        lines = [line.split("#", 1)[0].strip() for line in f]
+    return [q for q in lines if q]
+
+
+def load_state(state_dir: str, code: str) -> dict | None:
+    """종목 상태 로드 (없거나 손상 시 None)."""
+    path = os.path.join(state_dir, f"{code}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_state(state_dir: str, state: dict) -> None:
+    """종목 상태 저장 (임시 파일 후 교체로 원자적 기록)."""
+    os.makedirs(state_dir, exist_ok=True)
+    path = os.path.join(state_dir, f"{state['code']}.json")
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _bars_to_json(df: pd.DataFrame) -> dict:
+    return {
+        "index": [d.strftime("%Y-%m-%d") for d in df.index],
+        **{c: df[c].tolist() for c in OHLCV},
+    }
+
+
+def _bars_from_json(bars: dict) -> pd.DataFrame:
+    return pd.DataFrame(
+        {c: bars[c] for c in OHLCV}, index=pd.to_datetime(bars["index"])
+    )
+
+
+def _split_scale(tail: pd.DataFrame, new: pd.DataFrame) -> float:
+    """저장된 꼬리 → 새 조회의 가격 배율 (그 사이 분할/병합이 있으면 1이 아님).
+
+    수정주가는 조회 시점까지의 분할/병합을 과거 가격에 반영하므로, 두 조회에
+    모두 있는 마지막 확정 주봉의 종가를 비교합니다.
+    """
+    ts = tail.index[-1]
+    if ts not in new.index:
+        return 1.0
+    old, cur = float(tail.at[ts, "Close"]), float(new.at[ts, "Close"])
+    if old <= 0 or cur <= 0:
+        return 1.0
+    scale = cur / old
+    return 1.0 if abs(scale - 1) <= SPLIT_TOL else scale
+
+
+def _rescale(tail: pd.DataFrame, scale: float) -> pd.DataFrame:
+    """꼬리 주봉을 새 가격 기준으로 환산 (가격 × scale, 거래량 ÷ scale)."""
+    tail = tail.copy()
+    tail[PRICE_COLS] = tail[PRICE_COLS].to_numpy(dtype=float) * scale
+    volume = tail["Volume"].to_numpy(dtype=float) / scale
+    tail["Volume"] = np.round(volume).astype("int64")
+    return tail
+
+
+def _step(state: dict, df: pd.DataFrame, rows: pd.Index, confirmed: bool) -> list:
+    """포지션 상태 머신 전진 (generate_signals/backtest와 동일 규칙).
+
+    Returns:
+        발생한 이벤트 리스트
+    """
+    events = []
+    for ts in rows:
+        row = df.loc[ts]
+        event = {
+            "code": state["code"],
+            "name": state["name"],
+            "date": ts.strftime("%Y-%m-%d"),
+            "confirmed": confirmed,
+        }
+        if not state["in_pos"] and row["Buy"] == 1:
+            state["in_pos"] = True
+            state["entry_date"] = event["date"]
+            state["entry_price"] = float(row["Open"])
+            events.append({**event, "event": "Buy", "price": state["entry_price"]})
+        elif state["in_pos"] and row["Sell"] == 1:
+            price = float(row["Close"])
+            ret = (price - state["entry_price"]) / state["entry_price"]
+            state["in_pos"] = False
+            state["entry_date"], state["entry_price"] = None, None
+            events.append(
+                {**event, "event": "ActualSell", "price": price, "return": ret}
+            )
+    return events
+
+
+def update_symbol(
+    query: str,
+    state_dir: str = ".trend_state",
+    ma_period: int = 10,
+    cmf_period: int = 4,
+    adjusted: bool = True,
+    as_of: str | None = None,
+    table: SignalTable | None = None,
+) -> list[dict]:
+    """단일 종목 상태 전진.
+
+    상태가 없거나 파라미터가 바뀌었으면 기본 기간(3년)으로 시드하고
+    이벤트 없이 상태만 저장합니다. 이후 실행은 마지막 확정 주봉의 주부터
+    일봉을 조회하므로 실행을 며칠 건너뛰어도 그대로 복구됩니다. 겹치는 주봉의
+    종가가 달라졌으면 (그 사이 분할/병합) 저장된 꼬리와 진입가를 새 수정주가
+    기준으로 환산한 뒤 이어 붙입니다.
+
+    주봉은 라벨(금요일)이 as_of 이하일 때 확정으로 보고 상태에 반영합니다.
+    진행 중인 주는 상태를 바꾸지 않고 confirmed=False 이벤트로만 보고합니다.
+
+    Args:
+        query: 종목명 또는 코드
+        state_dir: 상태 저장 디렉터리
+        ma_period: 이동평균 기간
+        cmf_period: CMF 기간
+        adjusted: 수정주가 여부
+        as_of: 기준일 (장 마감 후 실행 가정, 기본 오늘)
+        table: 지정 시 확정 주봉 기준 최신 신호로 행 갱신
+
+    Returns:
+        이벤트 딕셔너리 리스트
+        {"code", "name", "date", "event", "price", "confirmed"[, "return"]}
+    """
+    code = to_code(query)
+    if not code:
+        print(f"[오류] '{query}' 종목을 찾을 수 없습니다.")
+        return []
+
+    as_of_dt = pd.Timestamp(as_of) if as_of else pd.Timestamp.now().normalize()
+    params = {"ma_period": ma_period, "cmf_period": cmf_period, "adjusted": adjusted}
+    # 신호 테이블의 TD/Impulse도 꼬리로 계산하므로 워밍업에 포함
+    tail_len = indicator_warmup(ma_period, cmf_period, True, True) + 1
+
+    state = load_state(state_dir, code)
+    seed = state is None or state.get("params") != params
+
+    # 1) 신규 일봉 조회 (시드 시 기본 기간 전체)
+    if seed:
+        daily, _ = fetch_ohlcv(
+            code,
+            start=(as_of_dt - pd.DateOffset(years=3)).strftime("%Y%m%d"),
+            end=as_of_dt.strftime("%Y%m%d"),
+            period="daily",
+            adjusted=adjusted,
+        )
+        tail = pd.DataFrame(columns=OHLCV, index=pd.DatetimeIndex([]))
+        state = {
+            "code": code,
+            "name": to_name(code),
+            "params": params,
+            "last_date": None,
+            "in_pos": False,
+            "entry_date": None,
+            "entry_price": None,
+        }
+    else:
+        tail = _bars_from_json(state["bars"])
+        # 새 거래일이 없으면 (주말/휴장일 재실행) 조회 없이 상태 유지
+        if trading_days(tail.index[-1] + pd.Timedelta(days=1), as_of_dt).empty:
+            return []
+        # 분할/병합 확인용으로 마지막 확정 주봉의 주(토~금)부터 조회
+        daily, _ = fetch_ohlcv(
+            code,
+            start=(tail.index[-1] - pd.Timedelta(days=6)).strftime("%Y%m%d"),
+            end=as_of_dt.strftime("%Y%m%d"),
+            period="daily",
+            adjusted=adjusted,
+        )
+
+    if daily is None:
+        return []
+
+    # 2) 주봉 꼬리 + 신규 주봉으로 지표/신호 계산 (꼬리 길이 = 워밍업)
+    new = resample_weekly(daily)
+    if len(tail):
+        scale = _split_scale(tail, new)
+        if scale != 1.0:
+            tail = _rescale(tail, scale)
+            if state["entry_price"] is not None:
+                state["entry_price"] *= scale
+        new = new[new.index > tail.index[-1]]
+    df = pd.concat([tail, new]) if len(tail) else new
+    df = generate_signals(add_indicators(df, ma_period, cmf_period))
+
+    done = new.index[new.index <= as_of_dt]
+    open_ = new.index[new.index > as_of_dt]
+
+    # 3) 확정 주봉으로 상태 전진 (시드는 첫 바 제외, 이벤트 미출력)
+    if seed:
+        _step(state, df, done[1:], confirmed=True)
+        events = []
+    else:
+        events = _step(state, df, done, confirmed=True)
+
+    # 4) 진행 중인 주는 상태 복사본으로 잠정 이벤트만 계산
+    events += _step(dict(state), df, open_, confirmed=False)
+
+    # 5) 상태 저장
+    committed = df.loc[df.index <= as_of_dt]
+    if len(committed):
+        last = committed.iloc[-1]
+        state["bars"] = _bars_to_json(committed[OHLCV].iloc[-tail_len:])
+        state["last"] = {
+            "date": committed.index[-1].strftime("%Y-%m-%d"),
+            **{
+                c: None if pd.isna(last[c]) else float(last[c])
+                for c in ["MA", "CMF", "FG"]
+            },
+        }
+        if table is not None:
+            table.update(code, committed, state["name"], in_pos=state["in_pos"])
+    state["last_date"] = daily.index[-1].strftime("%Y-%m-%d")
+    if "bars" in state:
+        save_state(state_dir, state)
+
+    return events
+
+
+def run_watchlist(
+    queries: list[str],
+    state_dir: str = ".trend_state",
+    ma_period: int = 10,
+    cmf_period: int = 4,
+    adjusted: bool = True,
+    as_of: str | None = None,
+    jobs: int = 8,
+    verbose: bool = True,
+    table_path: str | None = None,
+) -> list[dict]:
+    """워치리스트 일일 실행.
+
+    Args:
+        queries: 종목명 또는 코드 리스트
+        state_dir: 상태 저장 디렉터리
+        ma_period, cmf_period, adjusted: analyze()와 동일
+        as_of: 기준일 (기본 오늘)
+        jobs: 동시 조회 스레드 수
+        verbose: 이벤트 출력 여부
+        table_path: 지정 시 screener.SignalTable을 증분 갱신해 저장
+
+    Returns:
+        전체 이벤트 리스트 (종목 입력 순서)
+    """
+    table = None
+    if table_path:
+        table = (
+            SignalTable.load(table_path)
+            if os.path.exists(table_path)
+            else SignalTable()
+        )
+
+    def run(q):
+        try:
+            return update_symbol(
+                q, state_dir, ma_period, cmf_period, adjusted, as_of, table=table
+            )
+        except RequestError as e:
+            print(f"[오류] '{q}' 조회 실패: {e}")
+            return []
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        events = [e for evs in pool.map(run, queries) for e in evs]
+
+    if table is not None:
+        table.save(table_path)
+
+    if verbose:
+        for e in events:
+            mark = "" if e["confirmed"] else " (잠정)"
+            ret = f" {e['return']:.2%}" if "return" in e else ""
+            print(
+                f"{e['date']} {e['name']}({e['code']}) {e['event']}{mark}: {e['price']:,.0f}{ret}"
+            )
+        print(f"\n=== 업데이트 완료: {len(queries)} 종목, 이벤트 {len(events)}건 ===")
+
+    return events
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="워치리스트 일일 신호 업데이트")
+    parser.add_argument("watchlist", help="종목 리스트 파일 (한 줄에 하나)")
+    parser.add_argument("--state-dir", default=".trend_state")
+    parser.add_argument("--ma-period", type=int, default=10)
+    parser.add_argument("--cmf-period", type=int, default=4)
+    parser.add_argument("--raw", action="store_true", help="일반주가 사용")
+    parser.add_argument("--as-of", default=None, help="기준일 (YYYYMMDD)")
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--table", default=None, help="신호 테이블 저장 경로")
+    args = parser.parse_args(argv)
+
+    run_watchlist(
+        read_watchlist(args.watchlist),
+        state_dir=args.state_dir,
+        ma_period=args.ma_period,
+        cmf_period=args.cmf_period,
+        adjusted=not args.raw,
+        as_of=args.as_of,
+        jobs=args.jobs,
+        table_path=args.table,
+    )
+
+
+if __name__ == "__main__":
+    main()
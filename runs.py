@@ -0,0 +1,351 @@
+"""체크포인트/재개 가능한 전체 시장 실행 관리.
+
+종목별 완료 기록을 저널(JSONL)에 한 줄씩 추가하고 결과는 ResultWriter로
+종목별 파티션에 기록합니다. 중간에 죽거나 조회가 막혀도 같은 run_dir로
+다시 실행하면 저널에 완료된 종목은 건너뛰고 나머지만 처리합니다.
+예외로 실패한 종목은 지수 백오프로 재시도하며, 진행률과 처리량
+(종목/초, 조회 vs 계산 시간 비율)을 주기적으로 출력합니다.
+
+    {run_dir}/run.json        실행 파라미터 (조회 기간은 첫 실행 때 날짜로 고정,
+                              재개 시 저장된 기간 사용 + 나머지 일치 확인)
+    {run_dir}/journal.jsonl   종목별 기록 {"query", "code", "status", ...}
+    {run_dir}/results/        ResultWriter 출력 (export=True)
+
+실행: python runs.py all_codes.txt --run-dir runs/20261019 --jobs 8
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+
+import pandas as pd
+from fetcher import fetch_ohlcv
+from trading_calendar import last_trading_day
+from utils import json_value, to_name
+
+DONE, EMPTY, FAILED = "done", "empty", "failed"
+
+# 첫 실행 때 날짜로 고정되는 조회 기간 파라미터
+_PERIOD = ("start", "end")
+
+
+def load_journal(run_dir: str) -> pd.DataFrame:
+    """저널 로드 (질의별 마지막 기록).
+
+    Returns:
+        query 인덱스의 DataFrame (code, status, attempts, fetch_s, compute_s, ...)
+    """
+    path = os.path.join(run_dir, "journal.jsonl")
+    records = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue  # 기록 중 중단된 마지막 줄
+    except OSError:
+        pass
+    if not records:
+        return pd.DataFrame(columns=["code", "status"]).rename_axis("query")
+    return (
+        pd.DataFrame(records).drop_duplicates("query", keep="last").set_index("query")
+    )
+
+
+class RunManager:
+    """체크포인트 기반 다중 종목 실행 (주간 전략, analyze()와 같은 계산).
+
+    Args:
+        run_dir: 실행 디렉터리 (저널/결과 저장)
+        start, end, ma_period, cmf_period, adjusted: analyze()와 동일
+            (start/end 기본값은 첫 실행 때 날짜로 고정되고, 재개 시에는
+            run.json에 저장된 기간을 그대로 사용)
+        jobs: 동시 처리 스레드 수
+        retries: 예외 발생 시 재시도 횟수
+        backoff: 첫 재시도 대기 (초), 이후 2배씩 증가
+        max_backoff: 재시도 대기 상한 (초)
+        export: 결과를 {run_dir}/results에 Parquet로 기록 (pyarrow 필요)
+        verbose: 진행률 출력 여부
+        report_every: 진행률 출력 간격 (초)
+    """
+
+    def __init__(
+        self,
+        run_dir: str,
+        start: str | None = None,
+        end: str | None = None,
+        ma_period: int = 10,
+        cmf_period: int = 4,
+        adjusted: bool = True,
+        jobs: int = 4,
+        retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        export: bool = True,
+        verbose: bool = True,
+        report_every: float = 10.0,
+    ):
+        self.run_dir = run_dir
+        self.params = {
+            "start": start,
+            "end": end,
+            "ma_period": ma_period,
+            "cmf_period": cmf_period,
+            "adjusted": adjusted,
+        }
+        self.jobs = max(1, jobs)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.verbose = verbose
+        self.report_every = report_every
+
+        os.makedirs(run_dir, exist_ok=True)
+        self._check_params()
+
+        self.writer = None
+        if export:
+            from export import ResultWriter
+
+            self.writer = ResultWriter(os.path.join(run_dir, "results"))
+
+        self._lock = threading.Lock()
+        self._journal = open(
+            os.path.join(run_dir, "journal.jsonl"), "a", encoding="utf-8"
+        )
+        self._reset_stats()
+
+    def _check_params(self) -> None:
+        """처음 실행이면 조회 기간을 날짜로 고정해 기록, 재개면 저장된 기간 사용.
+
+        '--period 3y'나 end=None은 실행한 날에 따라 날짜가 달라지므로 비교하지
+        않고 첫 실행 때의 기간을 그대로 씁니다 (종목마다 같은 기간).
+        """
+        path = os.path.join(self.run_dir, "run.json")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+            strategy = {k: v for k, v in self.params.items() if k not in _PERIOD}
+            if {k: saved.get(k) for k in strategy} != strategy:
+                raise ValueError(
+                    f"run_dir의 실행 파라미터가 다릅니다: {saved} != {self.params}"
+                )
+            self.params = saved
+            return
+
+        # fetch_ohlcv와 같은 기본값 (종료일은 마지막 거래일, 시작일은 3년 전)
+        p = self.params
+        last = last_trading_day()
+        if p["end"]:
+            p["end"] = p["end"].replace("-", "")
+        else:
+            p["end"] = last.strftime("%Y%m%d")
+        if p["start"]:
+            p["start"] = p["start"].replace("-", "")
+        else:
+            p["start"] = (last - timedelta(days=365 * 3)).strftime("%Y%m%d")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(p, f, ensure_ascii=False)
+
+    def _reset_stats(self) -> None:
+        self.stats = {
+            "total": 0,
+            "skipped": 0,
+            DONE: 0,
+            EMPTY: 0,
+            FAILED: 0,
+            "retries": 0,
+            "fetch_s": 0.0,
+            "compute_s": 0.0,
+        }
+        self._t0 = time.perf_counter()
+        self._last_report = self._t0
+
+    # ------------------------------------------------------------------ 종목 1개
+
+    def _analyze(self, query: str) -> tuple[dict | None, float, float]:
+        """조회/계산 시간을 나눠 잰 analyze() 계산 (종목명 조회는 조회 시간)."""
+        from init import run_strategy
+
+        p = self.params
+        t0 = time.perf_counter()
+        df, code = fetch_ohlcv(
+            query, p["start"], p["end"], period="weekly", adjusted=p["adjusted"]
+        )
+        if df is None:
+            return None, time.perf_counter() - t0, 0.0
+        name = to_name(code)
+        t1 = time.perf_counter()
+
+        result = run_strategy(df, code, p["ma_period"], p["cmf_period"], name)
+        return result, t1 - t0, time.perf_counter() - t1
+
+    def _process(self, query: str) -> dict:
+        """재시도를 포함한 종목 1개 처리 → 저널 기록."""
+        fetch_s = compute_s = 0.0
+        record = {"query": query, "code": None}
+
+        for attempt in range(1, self.retries + 2):
+            try:
+                result, f_s, c_s = self._analyze(query)
+                fetch_s += f_s
+                compute_s += c_s
+            except Exception as e:  # noqa: BLE001 - 조회 오류는 재시도 대상
+                record.update(status=FAILED, error=f"{type(e).__name__}: {e}")
+                if attempt > self.retries:
+                    break
+                with self._lock:
+                    self.stats["retries"] += 1
+                delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+                time.sleep(delay * random.uniform(0.5, 1.0))
+                continue
+
+            record.pop("error", None)
+            if result is None:
+                record["status"] = EMPTY
+            else:
+                if self.writer:
+                    self.writer.write(result)
+                record.update(
+                    code=result["code"],
+                    status=DONE,
+                    summary={k: json_value(v) for k, v in result["summary"].items()},
+                )
+            break
+
+        record.update(
+            attempts=attempt,
+            fetch_s=round(fetch_s, 4),
+            compute_s=round(compute_s, 4),
+            time=pd.Timestamp.now().isoformat(timespec="seconds"),
+        )
+        self._log(record)
+        return record
+
+    def _log(self, record: dict) -> None:
+        """저널에 한 줄 추가 (결과 기록 이후이므로 저널이 곧 체크포인트)."""
+        with self._lock:
+            self._journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+
+            s = self.stats
+            s[record["status"]] += 1
+            s["fetch_s"] += record["fetch_s"]
+            s["compute_s"] += record["compute_s"]
+
+            now = time.perf_counter()
+            if self.verbose and now - self._last_report >= self.report_every:
+                self._last_report = now
+                print(self.progress())
+
+    # ------------------------------------------------------------------ 실행
+
+    def progress(self) -> str:
+        """진행률/처리량 한 줄 요약."""
+        s = self.stats
+        done = s[DONE] + s[EMPTY] + s[FAILED]
+        todo = s["total"] - s["skipped"]
+        elapsed = time.perf_counter() - self._t0
+        rate = done / elapsed if elapsed > 0 else 0.0
+        busy = s["fetch_s"] + s["compute_s"]
+        fetch_pct = s["fetch_s"] / busy if busy else 0.0
+        eta = (todo - done) / rate if rate else float("nan")
+        return (
+            f"[{done}/{todo}] {rate:.2f} 종목/s, "
+            f"조회 {fetch_pct:.0%} / 계산 {1 - fetch_pct:.0%}, "
+            f"실패 {s[FAILED]}, 재시도 {s['retries']}, 남은 시간 {eta:.0f}s"
+        )
+
+    def run(self, queries: list[str]) -> dict:
+        """저널에 완료로 기록되지 않은 종목만 처리.
+
+        데이터 없음(empty)은 조회 제한으로 빈 응답을 받은 경우일 수 있으므로
+        재개 시 다시 시도합니다.
+
+        Args:
+            queries: 종목명 또는 코드 리스트
+
+        Returns:
+            실행 통계 딕셔너리 (total, skipped, done, empty, failed, retries,
+            fetch_s, compute_s, elapsed_s, rate)
+        """
+        self._reset_stats()
+        journal = load_journal(self.run_dir)
+        finished = set(journal.index[journal["status"] == DONE])
+        todo = [q for q in dict.fromkeys(queries) if q not in finished]
+        self.stats["total"] = len(dict.fromkeys(queries))
+        self.stats["skipped"] = self.stats["total"] - len(todo)
+
+        if self.verbose and self.stats["skipped"]:
+            print(f"재개: 완료 {self.stats['skipped']}개 건너뜀, 남은 {len(todo)}개")
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            for fut in as_completed([pool.submit(self._process, q) for q in todo]):
+                fut.result()
+
+        elapsed = time.perf_counter() - self._t0
+        self.stats["elapsed_s"] = elapsed
+        self.stats["rate"] = len(todo) / elapsed if elapsed > 0 else 0.0
+        if self.verbose:
+            print(self.progress())
+            print(
+                f"\n=== 실행 완료: 성공 {self.stats[DONE]}, 데이터 없음 {self.stats[EMPTY]}, "
+                f"실패 {self.stats[FAILED]} ({elapsed:.1f}s) ==="
+            )
+        return self.stats
+
+    def close(self) -> None:
+        self._journal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def run_market(queries: list[str], run_dir: str, **kwargs) -> dict:
+    """RunManager(run_dir, **kwargs).run(queries) 단축 함수."""
+    with RunManager(run_dir, **kwargs) as manager:
+        return manager.run(queries)
+
+
+def main(argv: list[str] | None = None) -> None:
+    from runner import read_watchlist
+
+    parser = argparse.ArgumentParser(description="체크포인트 기반 전체 시장 실행")
+    parser.add_argument("symbols", help="종목 리스트 파일 (한 줄에 하나)")
+    parser.add_argument("--run-dir", required=True, help="실행 디렉터리")
+    parser.add_argument("--start", default=None)
+    parser.add_argument("--end", default=None)
+    parser.add_argument("--ma-period", type=int, default=10)
+    parser.add_argument("--cmf-period", type=int, default=4)
+    parser.add_argument("--raw", action="store_true", help="일반주가 사용")
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--no-export", action="store_true", help="Parquet 결과 생략")
+    args = parser.parse_args(argv)
+
+    run_market(
+        read_watchlist(args.symbols),
+        args.run_dir,
+        start=args.start,
+        end=args.end,
+        ma_period=args.ma_period,
+        cmf_period=args.cmf_period,
+        adjusted=not args.raw,
+        jobs=args.jobs,
+        retries=args.retries,
+        export=not args.no_export,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""스크리너: 종목별 최신 바 신호 테이블 + 인덱스 질의.
+
+"이번 주 매수 신호가 나왔고 CMF > 0.1, Impulse가 bull인 종목"처럼 전체
+시장을 거르는 질의를 analyze_multi 재실행 없이 처리합니다. 종목마다 최신
+바의 지표/신호 값을 한 행으로 보관하는 열 단위 NumPy 테이블이며,
+
+- 수치 컬럼(날짜, 가격, 지표, TD 카운트)은 정렬 인덱스(argsort + searchsorted)
+- 범주 컬럼(Buy, Sell, InPos, Impulse)은 값별 비트맵(bool 배열)
+
+로 질의합니다. 인덱스는 update() 후 첫 질의 때 한 번만 다시 만듭니다.
+
+    table = SignalTable.from_results(analyze_multi(codes, plot=False))
+    table.query(Buy=1, CMF=(0.1, None), Impulse="bull")
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+from indicators import IMPULSE_CODES, calc_elder_impulse, calc_td_setup
+from signals import in_position
+
+# Impulse 정수 코드 → 라벨 (-128 = 값 없음)
+IMPULSE_LABELS = {v: k for k, v in IMPULSE_CODES.items()}
+_NA_CODE = -128
+
+# 컬럼 → dtype (값 없음: 실수는 NaN, TD 카운트는 -1)
+NUMERIC = {
+    "date": np.int64,
+    "Close": np.float64,
+    "MA": np.float64,
+    "CMF": np.float64,
+    "FG": np.float64,
+    "TD_Sell": np.int16,
+    "TD_Buy": np.int16,
+}
+CATEGORICAL = {
+    "Buy": np.int8,
+    "Sell": np.int8,
+    "InPos": np.int8,
+    "Impulse": np.int8,
+}
+COLUMNS = {**NUMERIC, **CATEGORICAL}
+
+
+def _key(col: str, value):
+    """질의 값 → 저장 형식 (날짜는 ns 정수, Impulse는 코드)."""
+    if value is None:
+        return None
+    if col == "date":
+        return pd.Timestamp(value).value
+    if col == "Impulse" and isinstance(value, str):
+        return IMPULSE_CODES[value]
+    return value
+
+
+class SignalTable:
+    """종목별 최신 바 신호 테이블.
+
+    Args:
+        capacity: 초기 행 용량 (부족하면 두 배로 늘림)
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self.codes: list[str] = []
+        self.names: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._cols = {c: self._empty(c, capacity) for c in COLUMNS}
+        self._sorted: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._bitmaps: dict[str, dict[int, np.ndarray]] = {}
+        self._dirty = True
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _empty(col: str, n: int) -> np.ndarray:
+        dtype = COLUMNS[col]
+        if np.dtype(dtype).kind == "f":
+            return np.full(n, np.nan, dtype=dtype)
+        return np.full(n, _NA_CODE if col == "Impulse" else -1, dtype=dtype)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._rows
+
+    # ------------------------------------------------------------------ 갱신
+
+    def update(
+        self, code: str, df: pd.DataFrame, name: str = "", in_pos: bool | None = None
+    ) -> None:
+        """종목의 최신 바로 행 갱신 (없으면 추가).
+
+        TD_Sell/TD_Buy, Impulse가 없는 df(add_indicators만 거친 결과)는
+        여기서 계산해 채웁니다.
+
+        Args:
+            code: 종목코드
+            df: 지표/신호가 포함된 DataFrame (마지막 바 사용)
+            name: 종목명
+            in_pos: 포지션 보유 여부 (None이면 df 신호로 계산)
+        """
+        if df is None or df.empty:
+            return
+        if "TD_Sell" not in df.columns:
+            df = calc_td_setup(df)
+        if "ImpulseCode" not in df.columns and "Impulse" not in df.columns:
+            df = calc_elder_impulse(df, labels=False)
+        last = df.iloc[-1]
+        if in_pos is None:
+            in_pos = in_position(df) if "ActualSell" in df.columns else False
+
+        values = {"date": df.index[-1].value, "InPos": int(in_pos)}
+        for c in ["Close", "MA", "CMF", "FG", "TD_Sell", "TD_Buy", "Buy", "Sell"]:
+            if c in df.columns and not pd.isna(last[c]):
+                values[c] = last[c]
+        if "ImpulseCode" in df.columns:
+            values["Impulse"] = last["ImpulseCode"]
+        elif "Impulse" in df.columns:
+            imp = last["Impulse"]
+            values["Impulse"] = IMPULSE_CODES.get(imp, imp) if pd.notna(imp) else None
+
+        with self._lock:
+            i = self._rows.get(code)
+            if i is None:
+                i = len(self.codes)
+                if i == len(self._cols["date"]):
+                    self._grow()
+                self._rows[code] = i
+                self.codes.append(code)
+                self.names.append(name)
+            elif name:
+                self.names[i] = name
+
+            for c, col in self._cols.items():
+                v = values.get(c)
+                col[i] = self._empty(c, 1)[0] if v is None else v
+            self._dirty = True
+
+    def _grow(self) -> None:
+        n = len(self._cols["date"])
+        for c, col in self._cols.items():
+            self._cols[c] = np.concatenate([col, self._empty(c, max(n, 1))])
+
+    @classmethod
+    def from_results(cls, results: dict) -> "SignalTable":
+        """analyze_multi()/analyze_full() 결과로 테이블 생성.
+
+        analyze_full 결과는 주봉(weekly)을 사용합니다.
+        """
+        table = cls(capacity=max(len(results), 1))
+        for r in results.values():
+            df = r.get("df", r.get("weekly"))
+            table.update(r["code"], df, r.get("name", ""))
+        return table
+
+    # ------------------------------------------------------------------ 인덱스
+
+    def _rebuild(self) -> None:
+        """정렬/비트맵 인덱스 재구성 (변경 후 첫 질의 때 한 번)."""
+        n = len(self.codes)
+        self._sorted = {}
+        for c in NUMERIC:
+            col = self._cols[c][:n]
+            order = np.argsort(col, kind="stable")  # NaN은 뒤로
+            self._sorted[c] = (order, col[order])
+        self._bitmaps = {}
+        for c in CATEGORICAL:
+            col = self._cols[c][:n]
+            self._bitmaps[c] = {int(v): col == v for v in np.unique(col)}
+        self._dirty = False
+
+    def _mask(self, col: str, cond) -> np.ndarray:
+        n = len(self.codes)
+
+        if col in CATEGORICAL:
+            values = cond if isinstance(cond, (list, set)) else [cond]
+            mask = np.zeros(n, dtype=bool)
+            for v in values:
+                hit = self._bitmaps[col].get(_key(col, v))
+                if hit is not None:
+                    mask |= hit
+            return mask
+
+        # 수치: 정렬 인덱스에서 구간 탐색 (양 끝 포함, 값 없음 제외)
+        order, vals = self._sorted[col]
+        first, end = 0, n
+        if vals.dtype.kind == "f":
+            end = n - int(np.isnan(vals).sum())
+        elif col != "date":
+            first = int(np.searchsorted(vals, 0, side="left"))
+
+        lo, hi = cond if isinstance(cond, tuple) else (cond, cond)
+        lo, hi = _key(col, lo), _key(col, hi)
+        a = first if lo is None else max(first, np.searchsorted(vals, lo, "left"))
+        b = end if hi is None else min(end, np.searchsorted(vals, hi, "right"))
+        mask = np.zeros(n, dtype=bool)
+        mask[order[a:b]] = True
+        return mask
+
+    # ------------------------------------------------------------------ 질의
+
+    def query(self, **conds) -> pd.DataFrame:
+        """다중 조건 스크리닝 (조건은 모두 AND).
+
+        값은 같음, (lo, hi) 튜플은 구간(양 끝 포함, None은 열린 끝),
+        리스트는 범주 컬럼의 OR 조건입니다.
+
+        사용 예시:
+            table.query(Buy=1, CMF=(0.1, None), Impulse="bull")
+            table.query(date=("2026-10-12", None), TD_Sell=(9, None))
+            table.query(Impulse=["bull", "neutral"], InPos=0)
+
+        Returns:
+            조건을 만족하는 종목 DataFrame (to_frame() 형식)
+        """
+        unknown = set(conds) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"알 수 없는 컬럼: {', '.join(sorted(unknown))}")
+
+        with self._lock:
+            if self._dirty:
+                self._rebuild()
+            mask = np.ones(len(self.codes), dtype=bool)
+            for col, cond in conds.items():
+                mask &= self._mask(col, cond)
+            return self._frame(np.flatnonzero(mask))
+
+    def to_frame(self) -> pd.DataFrame:
+        """전체 테이블 DataFrame (code 인덱스)."""
+        with self._lock:
+            return self._frame(np.arange(len(self.codes)))
+
+    def _frame(self, rows: np.ndarray) -> pd.DataFrame:
+        df = pd.DataFrame(
+            {c: self._cols[c][rows] for c in COLUMNS},
+            index=pd.Index([self.codes[i] for i in rows], name="code"),
+        )
+        df.insert(0, "name", np.array([self.names[i] for i in rows], dtype=object))
+        df["date"] = pd.to_datetime(df["date"])
+        df["InPos"] = df["InPos"].astype(bool)
+        df["Impulse"] = df["Impulse"].map(IMPULSE_LABELS)
+        return df
+
+    # ------------------------------------------------------------------ 저장
+
+    def save(self, path: str) -> None:
+        """테이블 저장 (pickle)."""
+        n = len(self.codes)
+        with self._lock:
+            state = {
+                "codes": list(self.codes),
+                "names": list(self.names),
+                "cols": {c: col[:n].copy() for c, col in self._cols.items()},
+            }
+        pd.to_pickle(state, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SignalTable":
+        """저장된 테이블 로드."""
+        state = pd.read_pickle(path)
+        table = cls(capacity=max(len(state["codes"]), 1))
+        n = len(state["codes"])
+        table.codes, table.names = state["codes"], state["names"]
+        table._rows = {c: i for i, c in enumerate(table.codes)}
+        for c, col in state["cols"].items():
+            if c in table._cols:
+                table._cols[c][:n] = col
+        return table
@@ -0,0 +1,219 @@
+"""종목명 검색 인덱스: n-gram + 초성 분해, 순위가 매겨진 후보 반환.
+
+입력 중 검색(search-as-you-type)용으로, 종목 마스터를 한 번 분해해
+1/2-gram 역색인(종목명, 초성 문자열)을 만들고 질의마다 역색인 교집합으로
+후보를 줄인 뒤 검증/정렬합니다. 초성만("ㅅㅅㅈㅈ"), 초성과 음절을 섞은
+질의("삼ㅅ전"), 마지막 글자를 입력 중인 질의("삼성저")도 처리합니다.
+
+순위: 정확 일치 > 접두 > 부분 > 초성 접두 > 초성 부분 > 유사(2-gram 겹침)
+(같은 순위는 짧은 이름, 종목 마스터 순서)
+
+to_code()의 동작은 바꾸지 않습니다.
+"""
+
+import time
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from utils import get_stock_list
+
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+_JAMO_FIRST, _JAMO_LAST = 0x3131, 0x314E
+
+EXACT, PREFIX, SUBSTRING, CHOSUNG_PREFIX, CHOSUNG_SUBSTRING, FUZZY = range(6)
+MATCH_LABELS = ["exact", "prefix", "substring", "chosung_prefix", "chosung", "fuzzy"]
+
+# 유사 검색 최소 2-gram 겹침 (Dice 계수)
+FUZZY_MIN = 0.3
+
+
+def _is_syllable(ch: str) -> bool:
+    return _HANGUL_FIRST <= ord(ch) <= _HANGUL_LAST
+
+
+def _is_jamo(ch: str) -> bool:
+    return _JAMO_FIRST <= ord(ch) <= _JAMO_LAST
+
+
+def chosung(text: str) -> str:
+    """한글 음절을 초성으로 변환 (그 외 문자는 그대로)."""
+    return "".join(
+        CHOSUNG[(ord(ch) - _HANGUL_FIRST) // 588] if _is_syllable(ch) else ch
+        for ch in text
+    )
+
+
+def _grams(text: str) -> set[str]:
+    return set(text) | {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+def _char_match(q: str, name_ch: str, cho_ch: str, last: bool) -> bool:
+    """질의 글자 1개 일치 여부 (초성, 음절, 입력 중인 마지막 음절)."""
+    if q == name_ch:
+        return True
+    if _is_jamo(q):
+        return q == cho_ch
+    if last and _is_syllable(q) and _is_syllable(name_ch):
+        # 받침 없는 음절은 같은 초성+중성의 받침 있는 음절과 일치 (저 → 전)
+        qo = ord(q) - _HANGUL_FIRST
+        return qo % 28 == 0 and qo // 28 == (ord(name_ch) - _HANGUL_FIRST) // 28
+    return False
+
+
+def _find_mixed(q: str, name: str, cho: str) -> int:
+    """초성/음절 혼합 질의가 일치하는 첫 위치 (없으면 -1)."""
+    k = len(q)
+    for i in range(len(name) - k + 1):
+        if all(
+            _char_match(q[j], name[i + j], cho[i + j], j == k - 1) for j in range(k)
+        ):
+            return i
+    return -1
+
+
+class SearchIndex:
+    """종목 마스터 검색 인덱스.
+
+    Args:
+        stocks: code, name 컬럼의 종목 마스터 (get_stock_list() 결과)
+    """
+
+    def __init__(self, stocks: pd.DataFrame):
+        self.codes = stocks["code"].astype(str).to_numpy()
+        self.names = stocks["name"].astype(str).to_numpy()
+        self._lower = [n.lower() for n in self.names]
+        self._cho = [chosung(n) for n in self._lower]
+        self._lengths = np.array([len(n) for n in self.names])
+
+        # 1) 역색인: 1/2-gram → 행 번호 배열
+        self._name_index = self._build(self._lower)
+        self._cho_index = self._build(self._cho)
+
+        # 2) 코드 접두 검색용 정렬
+        self._code_order = np.argsort(self.codes, kind="stable")
+        self._sorted_codes = self.codes[self._code_order]
+
+    @staticmethod
+    def _build(texts: list[str]) -> dict[str, np.ndarray]:
+        postings: dict[str, list[int]] = {}
+        for i, text in enumerate(texts):
+            for g in _grams(text):
+                postings.setdefault(g, []).append(i)
+        return {g: np.array(rows, dtype=np.int64) for g, rows in postings.items()}
+
+    def _candidates(self, index: dict, key: str) -> np.ndarray:
+        """key의 모든 2-gram(1글자면 1-gram)을 포함하는 행."""
+        grams = (
+            [key] if len(key) == 1 else [key[i : i + 2] for i in range(len(key) - 1)]
+        )
+        rows = None
+        for g in sorted(set(grams), key=lambda g: len(index.get(g, ()))):
+            hit = index.get(g)
+            if hit is None:
+                return np.empty(0, dtype=np.int64)
+            rows = (
+                hit if rows is None else np.intersect1d(rows, hit, assume_unique=True)
+            )
+            if not len(rows):
+                break
+        return rows
+
+    def _fuzzy(self, key: str, exclude: set) -> list[tuple]:
+        """2-gram 겹침(Dice) 기반 유사 후보."""
+        grams = {key[i : i + 2] for i in range(len(key) - 1)} or {key}
+        hits = [self._name_index[g] for g in grams if g in self._name_index]
+        if not hits:
+            return []
+        counts = np.bincount(np.concatenate(hits), minlength=len(self.names))
+        rows = np.flatnonzero(counts)
+        name_grams = np.maximum(self._lengths[rows] - 1, 1)
+        dice = 2 * counts[rows] / (len(grams) + name_grams)
+        keep = dice >= FUZZY_MIN
+        return [
+            (FUZZY, -float(d), int(r))
+            for r, d in zip(rows[keep], dice[keep])
+            if int(r) not in exclude
+        ]
+
+    def search(self, query: str, limit: int = 10, budget_ms: float = 20.0) -> list:
+        """종목 검색.
+
+        Args:
+            query: 종목명 일부, 초성, 초성/음절 혼합, 또는 코드 앞자리
+            limit: 최대 후보 수
+            budget_ms: 키 입력당 지연 예산, 앞 단계에서 초과하면 유사 검색 생략
+
+        Returns:
+            [{"code", "name", "match"}] 순위순 리스트
+        """
+        t0 = time.perf_counter()
+        q = query.strip().lower()
+        if not q:
+            return []
+
+        ranked: list[tuple] = []  # (순위, 보조키, 행)
+
+        # 1) 코드 접두
+        if q.isdigit():
+            a = np.searchsorted(self._sorted_codes, q, side="left")
+            b = np.searchsorted(self._sorted_codes, q + "\uffff", side="left")
+            rows = self._code_order[a:b]
+            ranked += [(EXACT if len(q) == 6 else PREFIX, 0, int(r)) for r in rows]
+
+        # 2) 종목명 (음절/영문만 있는 질의)
+        has_jamo = any(_is_jamo(ch) for ch in q)
+        if not has_jamo:
+            for r in self._candidates(self._name_index, q):
+                pos = self._lower[r].find(q)
+                if pos < 0:
+                    continue
+                tier = (
+                    EXACT if self._lower[r] == q else PREFIX if pos == 0 else SUBSTRING
+                )
+                ranked.append((tier, int(self._lengths[r]), int(r)))
+
+        # 3) 초성 / 초성 혼합 / 입력 중인 마지막 음절 (받침 없는 음절)
+        last = q[-1]
+        partial = _is_syllable(last) and (ord(last) - _HANGUL_FIRST) % 28 == 0
+        seen = {r for _, _, r in ranked}
+        key = chosung(q) if has_jamo or partial else ""
+        for r in self._candidates(self._cho_index, key) if key else []:
+            r = int(r)
+            if r in seen:
+                continue
+            pos = _find_mixed(q, self._lower[r], self._cho[r])
+            if pos >= 0:
+                tier = CHOSUNG_PREFIX if pos == 0 else CHOSUNG_SUBSTRING
+                ranked.append((tier, int(self._lengths[r]), r))
+
+        # 4) 유사 검색 (후보 부족 + 예산 여유 시)
+        elapsed = (time.perf_counter() - t0) * 1000
+        if len(ranked) < limit and not has_jamo and elapsed < budget_ms:
+            ranked += self._fuzzy(q, {r for _, _, r in ranked})
+
+        ranked.sort()
+        return [
+            {
+                "code": self.codes[r],
+                "name": self.names[r],
+                "match": MATCH_LABELS[tier],
+            }
+            for tier, _, r in ranked[:limit]
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_search_index() -> SearchIndex:
+    """종목 마스터 검색 인덱스 (프로세스당 한 번 생성)."""
+    return SearchIndex(get_stock_list())
+
+
+def search(query: str, limit: int = 10, budget_ms: float = 20.0) -> list:
+    """종목 검색 (SearchIndex.search 참조).
+
+    사용 예시:
+        search("ㅅㅅㅈㅈ")  # [{"code": "005930", "name": "삼성전자", ...}]
+    """
+    return get_search_index().search(query, limit, budget_ms)
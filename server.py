@@ -0,0 +1,369 @@
+"""로컬 분석 서버: 종목 마스터/OHLCV/분석 결과를 메모리에 유지하는 HTTP 서버.
+
+스크립트마다 반복되던 콜드 비용(pandas/matplotlib/pykrx import, 종목 마스터
+구성, OHLCV 재조회)을 서버 프로세스 한 곳에서 한 번만 치르고, 최근 분석
+결과와 응답(JSON/PNG)을 TTL 캐시로 재사용합니다.
+
+엔드포인트 (GET):
+    /analyze?q=삼성전자[&start=&end=&ma_period=&cmf_period=&adjusted=]
+    /analyze_full?q=005930[&window_years=1]
+    /screen?q=005930,000660[&signal=buy|sell]
+    /chart/strategy.png?q=005930
+    /chart/elder.png?q=005930
+    /chart/td.png?q=005930[&timeframe=daily|weekly|monthly]
+    /search?q=ㅅㅅㅈㅈ[&limit=10]
+    /health
+
+실행: python server.py --port 8765 --workers 8 --cache-dir ~/.cache/trend-signal
+"""
+
+import argparse
+import io
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import init
+from cache import get_cache_dir, set_cache_dir
+from ratelimit import RequestError
+from ratelimit import metrics as krx_metrics
+from search import get_search_index
+from signals import latest_signals
+from utils import filter_period, get_stock_list, json_records, json_value
+
+# 유휴 keep-alive 연결 유지 시간 (초)
+KEEPALIVE_TIMEOUT = 30.0
+
+# 응답 캐시를 쓰지 않는 경로 (상태/지표는 매번 현재 값)
+UNCACHED = {"/health"}
+
+# matplotlib(pyplot)은 스레드 안전하지 않으므로 렌더링은 직렬화
+_plot_lock = threading.Lock()
+
+
+class TTLCache:
+    """크기 제한 + 만료 시간이 있는 스레드 안전 LRU 캐시."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None or time.monotonic() - hit[0] > self.ttl:
+                return None
+            self._data.move_to_end(key)
+            return hit[1]
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+_analysis = TTLCache(maxsize=512)
+_responses = TTLCache(maxsize=1024)
+
+
+def _int(p: dict, key: str, default: int) -> int:
+    try:
+        return int(p.get(key, default))
+    except ValueError:
+        raise ValueError(f"{key}는 정수여야 합니다: {p[key]}") from None
+
+
+def _common(p: dict) -> dict:
+    return {
+        "start": p.get("start"),
+        "end": p.get("end"),
+        "ma_period": _int(p, "ma_period", 10),
+        "cmf_period": _int(p, "cmf_period", 4),
+        "adjusted": p.get("adjusted", "1") not in ("0", "false"),
+    }
+
+
+def _query(p: dict) -> str:
+    q = p.get("q", "").strip()
+    if not q:
+        raise ValueError("q 파라미터가 필요합니다")
+    return q
+
+
+def _cached_analysis(fn: str, q: str, **kwargs) -> dict:
+    """analyze/analyze_full 결과 (메모리 캐시)."""
+    key = (fn, q, tuple(sorted(kwargs.items())))
+    result = _analysis.get(key)
+    if result is None:
+        result = getattr(init, fn)(q, plot=False, verbose=False, **kwargs)
+        if result is None:
+            raise LookupError(f"'{q}' 데이터 없음")
+        _analysis.put(key, result)
+    return result
+
+
+def _json(obj) -> tuple[bytes, str]:
+    return json.dumps(obj, ensure_ascii=False).encode(), "application/json"
+
+
+def _summary(r: dict) -> dict:
+    return {k: json_value(v) for k, v in r["summary"].items()}
+
+
+def route_analyze(p: dict):
+    r = _cached_analysis("analyze", _query(p), **_common(p))
+    latest = {k: json_value(v) for k, v in latest_signals(r["df"]).items()}
+    return _json(
+        {
+            "code": r["code"],
+            "name": r["name"],
+            "summary": _summary(r),
+            "latest": latest,
+            "trades": json_records(r["bt"]),
+        }
+    )
+
+
+def route_analyze_full(p: dict):
+    window = p.get("window_years")
+    r = _cached_analysis(
+        "analyze_full",
+        _query(p),
+        **_common(p),
+        window_years=int(window) if window else None,
+    )
+    latest = {
+        tf: {k: json_value(v) for k, v in r[tf].iloc[-1].items()}
+        for tf in ("daily", "weekly", "monthly")
+        if not r[tf].empty
+    }
+    return _json(
+        {
+            "code": r["code"],
+            "name": r["name"],
+            "summary": _summary(r),
+            "latest": latest,
+            "trades": json_records(r["bt"]),
+        }
+    )
+
+
+def route_screen(p: dict):
+    queries = [q for q in _query(p).split(",") if q.strip()]
+    signal = p.get("signal", "any")
+    kwargs = _common(p)
+
+    rows = []
+    for q in queries:
+        try:
+            r = _cached_analysis("analyze", q.strip(), **kwargs)
+        except LookupError:
+            continue
+        except RequestError as e:
+            # 한 종목의 조회 실패로 전체 스크리닝을 실패시키지 않음
+            print(f"[오류] '{q.strip()}' 조회 실패: {e}")
+            continue
+        row = {"code": r["code"], "name": r["name"], **latest_signals(r["df"])}
+        if signal == "buy" and row["Buy"] != 1:
+            continue
+        if signal == "sell" and row["Sell"] != 1:
+            continue
+        rows.append({k: json_value(v) for k, v in row.items()})
+    return _json(rows)
+
+
+def route_search(p: dict):
+    return _json(get_search_index().search(_query(p), limit=_int(p, "limit", 10)))
+
+
+def _png(fig) -> tuple[bytes, str]:
+    import matplotlib.pyplot as plt
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100)
+    plt.close(fig)
+    return buf.getvalue(), "image/png"
+
+
+def route_chart(kind: str):
+    def route(p: dict):
+        from chart import plot_elder_impulse, plot_strategy, plot_td_setup
+
+        q = _query(p)
+        if kind == "strategy":
+            r = _cached_analysis("analyze", q, **_common(p))
+            with _plot_lock:
+                fig, *_ = plot_strategy(r["df"], r["bt"], title=r["name"], show=False)
+                return _png(fig)
+
+        r = _cached_analysis("analyze_full", q, **_common(p), window_years=None)
+        if kind == "elder":
+            df = filter_period(r["weekly"], years=1)
+            with _plot_lock:
+                fig, _ = plot_elder_impulse(
+                    df, title=f"{r['name']} Elder Impulse", show=False
+                )
+                return _png(fig)
+
+        tf = p.get("timeframe", "weekly")
+        if tf not in ("daily", "weekly", "monthly"):
+            raise ValueError(f"timeframe 오류: {tf}")
+        df = r[tf] if tf == "monthly" else filter_period(r[tf], years=1)
+        with _plot_lock:
+            fig, *_ = plot_td_setup(
+                df, title=f"{r['name']} TD Setup ({tf})", show=False
+            )
+            return _png(fig)
+
+    return route
+
+
+ROUTES = {
+    "/analyze": route_analyze,
+    "/analyze_full": route_analyze_full,
+    "/screen": route_screen,
+    "/search": route_search,
+    "/chart/strategy.png": route_chart("strategy"),
+    "/chart/elder.png": route_chart("elder"),
+    "/chart/td.png": route_chart("td"),
+    "/health": lambda p: _json(
+        {"status": "ok", "cache_dir": get_cache_dir(), "krx": krx_metrics()}
+    ),
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "trend-signal"
+    protocol_version = "HTTP/1.1"
+    # 유휴 keep-alive 연결은 이 시간(초) 후 닫음
+    timeout = KEEPALIVE_TIMEOUT
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        route = ROUTES.get(url.path)
+        if route is None:
+            return self._send(404, *_json({"error": f"없는 경로: {url.path}"}))
+
+        key = (url.path, tuple(sorted(params.items())))
+        use_cache = url.path not in UNCACHED
+        cached = _responses.get(key) if use_cache else None
+        if cached is not None:
+            return self._send(200, *cached)
+
+        try:
+            body = self.server.pool.submit(route, params).result()
+        except ValueError as e:
+            return self._send(400, *_json({"error": str(e)}))
+        except LookupError as e:
+            return self._send(404, *_json({"error": str(e)}))
+        except RequestError as e:
+            return self._send(503, *_json({"error": str(e)}))
+        except Exception as e:  # noqa: BLE001 - 서버는 요청 단위로 오류를 보고
+            return self._send(500, *_json({"error": f"{type(e).__name__}: {e}"}))
+
+        if use_cache:
+            _responses.put(key, body)
+        self._send(200, *body)
+
+    def _send(self, status: int, body: bytes, ctype: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class AnalysisServer(ThreadingHTTPServer):
+    """연결마다 스레드, 분석/렌더링은 고정 크기 워커 풀에서 처리하는 HTTP 서버.
+
+    keep-alive 연결이 워커를 점유하지 않도록 연결 처리(가벼움)와 라우트
+    계산(무거움)을 분리합니다. 동시 분석 수는 workers로 제한됩니다.
+    """
+
+    # 동시 접속 폭주 시 SYN 재전송(1초) 지연을 피하도록 백로그 확대
+    request_queue_size = 128
+
+    def __init__(self, address, workers: int = 8, verbose: bool = False):
+        super().__init__(address, Handler)
+        self.verbose = verbose
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def warm_up() -> None:
+    """콜드 비용 선지불: 종목 마스터/검색 인덱스, pykrx/차트 모듈 로드."""
+    import chart  # noqa: F401
+    from utils import krx
+
+    krx()
+    get_stock_list()
+    get_search_index()
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    workers: int = 8,
+    cache_dir: str | None = None,
+    ttl: float = 300.0,
+    verbose: bool = False,
+) -> None:
+    """서버 실행 (Ctrl+C로 종료).
+
+    Args:
+        host, port: 바인드 주소
+        workers: 동시 분석(워커 스레드) 수
+        cache_dir: OHLCV 디스크 캐시 디렉터리
+        ttl: 분석 결과/응답 캐시 유지 시간 (초)
+        verbose: 요청 로그 출력 여부
+    """
+    if cache_dir:
+        set_cache_dir(cache_dir)
+    _analysis.ttl = _responses.ttl = ttl
+
+    warm_up()
+    httpd = AnalysisServer((host, port), workers=workers, verbose=verbose)
+    print(f"trend-signal 서버: http://{host}:{port} (워커 {workers})")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="trend-signal 로컬 분석 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--cache-dir", default=get_cache_dir())
+    parser.add_argument("--ttl", type=float, default=300.0)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    serve(args.host, args.port, args.workers, args.cache_dir, args.ttl, args.verbose)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""공유 메모리 패널: 프로세스 풀 워커에 OHLCV를 복사 없이 전달.
+
+프로세스 풀로 종목을 나눠 계산하면 종목마다 OHLCV와 지표 DataFrame을
+피클로 보냈다 다시 받아야 하고, 전체 시장 일봉에서는 이 직렬화 비용이
+지표 계산보다 큽니다. 여기서는 모든 종목의 OHLCV를 행 방향으로 이어 붙인
+패널과 결과 배열을 multiprocessing.shared_memory에 미리 할당하고, 워커는
+종목 인덱스만 받아 공유 배열의 뷰로 add_indicators → generate_signals →
+backtest를 실행한 뒤 결과를 출력 배열의 자기 구간에 직접 기록합니다.
+
+    offsets[i]:offsets[i+1]       종목 i의 행 구간
+    dates (rows,) int64           날짜 (ns)
+    ohlcv (rows, 5) float64       입력
+    indicators (rows, 5) float64  MA, CMF, FG, PrevHigh, PrevLow
+    signals (rows, 3) int8        Buy, Sell, ActualSell
+    summary (n, 4) float64        trades, avg_ret, cum_ret, win_rate
+    trade_dates (n, cap, 2) int64 / trade_values (n, cap, 4) float64 / trade_count (n,)
+    status (n,) int8              0=미완료, 1=완료, -1=오류
+
+공유 메모리 블록은 생성한 부모 프로세스만 해제(unlink)하며, 워커가
+비정상 종료(BrokenProcessPool)해도 finally와 atexit에서 정리됩니다.
+"""
+
+import atexit
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from fetcher import fetch_ohlcv
+from indicators import add_indicators
+from ratelimit import RequestError
+from signals import backtest, generate_signals, summary
+from utils import to_name
+
+INPUT_COLS = ["Open", "High", "Low", "Close", "Volume"]
+INDICATOR_COLS = ["MA", "CMF", "FG", "PrevHigh", "PrevLow"]
+SIGNAL_COLS = ["Buy", "Sell", "ActualSell"]
+SUMMARY_KEYS = ["trades", "avg_ret", "cum_ret", "win_rate"]
+TRADE_VALUE_COLS = ["EntryPrice", "ExitPrice", "Return", "CumRet"]
+
+DONE, FAILED = 1, -1
+
+
+class SharedArrays:
+    """이름 있는 공유 메모리 배열 묶음.
+
+    부모는 SharedArrays(specs)로 생성하고, 워커는 SharedArrays.attach(spec)로
+    같은 블록에 붙습니다. 생성한 쪽만 close() 시 블록을 해제합니다.
+
+    Args:
+        specs: {배열 이름: (shape, dtype)}
+    """
+
+    def __init__(self, specs: dict):
+        self._blocks: dict[str, shared_memory.SharedMemory] = {}
+        self._owner = True
+        self.arrays: dict[str, np.ndarray] = {}
+        atexit.register(self.close)
+        try:
+            for key, (shape, dtype) in specs.items():
+                nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+                shm = shared_memory.SharedMemory(create=True, size=nbytes)
+                self._blocks[key] = shm
+                self.arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+                self.arrays[key].fill(0)
+        except BaseException:
+            self.close()
+            raise
+
+    @classmethod
+    def attach(cls, spec: dict) -> "SharedArrays":
+        """spec(부모의 .spec)으로 기존 블록에 연결 (해제 책임 없음)."""
+        self = cls.__new__(cls)
+        self._blocks, self.arrays, self._owner = {}, {}, False
+        for key, (name, shape, dtype) in spec.items():
+            shm = shared_memory.SharedMemory(name=name, track=False)
+            self._blocks[key] = shm
+            self.arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        return self
+
+    @property
+    def spec(self) -> dict:
+        """워커에 전달할 블록 정보 {이름: (shm 이름, shape, dtype)}."""
+        return {
+            key: (self._blocks[key].name, a.shape, a.dtype.str)
+            for key, a in self.arrays.items()
+        }
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.arrays[key]
+
+    def close(self) -> None:
+        """블록 연결 해제 (생성한 쪽이면 unlink까지)."""
+        self.arrays = {}
+        for shm in self._blocks.values():
+            try:
+                shm.close()
+            except BufferError:
+                pass  # 내보낸 뷰가 남아 있으면 매핑은 뷰가 사라질 때 해제
+            # close 실패와 무관하게 이름은 항상 해제 (/dev/shm 누수 방지)
+            if self._owner:
+                try:
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
+        self._blocks = {}
+        if self._owner:
+            atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _panel_specs(lengths: list[int]) -> dict:
+    n, rows = len(lengths), sum(lengths)
+    # 거래 1건에 최소 2개 바 (매수 후 다음 바 이후 매도) + 마지막 강제 청산
+    cap = max(lengths, default=0) // 2 + 1
+    return {
+        "offsets": ((n + 1,), np.int64),
+        "dates": ((rows,), np.int64),
+        "ohlcv": ((rows, len(INPUT_COLS)), np.float64),
+        "indicators": ((rows, len(INDICATOR_COLS)), np.float64),
+        "signals": ((rows, len(SIGNAL_COLS)), np.int8),
+        "summary": ((n, len(SUMMARY_KEYS)), np.float64),
+        "trade_dates": ((n, cap, 2), np.int64),
+        "trade_values": ((n, cap, len(TRADE_VALUE_COLS)), np.float64),
+        "trade_count": ((n,), np.int64),
+        "status": ((n,), np.int8),
+    }
+
+
+# 워커 프로세스의 공유 배열 (initializer에서 한 번만 연결)
+_panel: SharedArrays | None = None
+_params: dict = {}
+
+
+def _init_worker(spec: dict, params: dict) -> None:
+    global _panel, _params
+    _panel = SharedArrays.attach(spec)
+    _params = params
+
+
+def _frame(p: SharedArrays, i: int) -> pd.DataFrame:
+    """종목 i의 OHLCV 뷰 (공유 배열을 복사 없이 감싼 DataFrame)."""
+    a, b = p["offsets"][i], p["offsets"][i + 1]
+    return pd.DataFrame(
+        p["ohlcv"][a:b],
+        index=pd.DatetimeIndex(p["dates"][a:b].view("datetime64[ns]")),
+        columns=INPUT_COLS,
+        copy=False,
+    )
+
+
+def _run(i: int) -> str | None:
+    """워커: 종목 i 계산 후 출력 배열에 기록.
+
+    Returns:
+        실패 시 오류 내용, 성공 시 None
+    """
+    p = _panel
+    a, b = p["offsets"][i], p["offsets"][i + 1]
+    try:
+        df = add_indicators(_frame(p, i), **_params)
+        df = generate_signals(df)
+        bt = backtest(df)
+    except Exception as e:
+        p["status"][i] = FAILED
+        return repr(e)
+
+    p["indicators"][a:b] = df[INDICATOR_COLS].to_numpy(dtype=np.float64)
+    p["signals"][a:b] = df[SIGNAL_COLS].to_numpy(dtype=np.int8)
+    p["summary"][i] = [summary(bt)[k] for k in SUMMARY_KEYS]
+
+    k = len(bt)
+    if k:
+        p["trade_dates"][i, :k, 0] = pd.DatetimeIndex(bt["EntryDate"]).asi8
+        p["trade_dates"][i, :k, 1] = pd.DatetimeIndex(bt["ExitDate"]).asi8
+        p["trade_values"][i, :k] = bt[TRADE_VALUE_COLS].to_numpy(dtype=np.float64)
+    p["trade_count"][i] = k
+    p["status"][i] = DONE
+
+
+def _collect(p: SharedArrays, i: int) -> dict:
+    """부모: 종목 i의 출력 배열 → analyze()와 같은 형태 (공유 메모리에서 복사)."""
+    a, b = p["offsets"][i], p["offsets"][i + 1]
+    df = pd.DataFrame(
+        p["ohlcv"][a:b].copy(),
+        index=pd.DatetimeIndex(p["dates"][a:b].copy()),
+        columns=INPUT_COLS,
+    )
+    df["Volume"] = df["Volume"].astype("int64")
+    df[INDICATOR_COLS] = p["indicators"][a:b].copy()
+    df[SIGNAL_COLS] = p["signals"][a:b].astype(int)
+
+    k = p["trade_count"][i]
+    dates = p["trade_dates"][i, :k].copy()
+    values = p["trade_values"][i, :k].copy()
+    bt = pd.DataFrame(
+        {
+            "EntryDate": pd.DatetimeIndex(dates[:, 0]),
+            "EntryPrice": values[:, 0],
+            "ExitDate": pd.DatetimeIndex(dates[:, 1]),
+            "ExitPrice": values[:, 1],
+            "Return": values[:, 2],
+            "CumRet": values[:, 3],
+        }
+    )
+    s = dict(zip(SUMMARY_KEYS, p["summary"][i].tolist()))
+    s["trades"] = int(s["trades"])
+    return {"df": df, "bt": bt, "summary": s}
+
+
+def analyze_panel(
+    frames: dict[str, pd.DataFrame],
+    ma_period: int = 10,
+    cmf_period: int = 4,
+    jobs: int | None = None,
+    chunksize: int | None = None,
+) -> dict[str, dict]:
+    """여러 종목 OHLCV를 공유 메모리로 프로세스 풀에서 분석.
+
+    Args:
+        frames: {종목코드: OHLCV DataFrame}
+        ma_period: 이동평균 기간
+        cmf_period: CMF 기간
+        jobs: 워커 프로세스 수 (기본 CPU 수)
+        chunksize: 워커에 한 번에 넘길 종목 수 (기본 종목수 / (jobs * 4))
+
+    Returns:
+        {종목코드: {"df", "bt", "summary"}} (실패/미완료 종목은 제외)
+    """
+    codes = [c for c, df in frames.items() if df is not None and not df.empty]
+    if not codes:
+        return {}
+
+    jobs = jobs or os.cpu_count() or 1
+    chunksize = chunksize or max(1, len(codes) // (jobs * 4))
+    lengths = [len(frames[c]) for c in codes]
+
+    with SharedArrays(_panel_specs(lengths)) as p:
+        # 1) 입력 패널 채우기 (부모에서 한 번만 복사)
+        p["offsets"][1:] = np.cumsum(lengths)
+        for i, c in enumerate(codes):
+            a, b = p["offsets"][i], p["offsets"][i + 1]
+            p["dates"][a:b] = pd.DatetimeIndex(frames[c].index).as_unit("ns").asi8
+            p["ohlcv"][a:b] = frames[c][INPUT_COLS].to_numpy(dtype=np.float64)
+
+        # 2) 워커 실행 (인덱스만 전달)
+        params = {"ma_period": ma_period, "cmf_period": cmf_period}
+        errors = {}
+        try:
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_worker, initargs=(p.spec, params)
+            ) as pool:
+                results = pool.map(_run, range(len(codes)), chunksize=chunksize)
+                for c, error in zip(codes, results):
+                    if error:
+                        errors[c] = error
+        except BrokenProcessPool:
+            lost = int((p["status"] == 0).sum())
+            print(f"[오류] 워커 프로세스 비정상 종료: {lost}개 종목 미완료")
+
+        # 3) 결과 수집 (블록 해제 전 복사)
+        for c, error in errors.items():
+            print(f"[오류] '{c}' 계산 실패: {error}")
+        return {
+            c: _collect(p, i) for i, c in enumerate(codes) if p["status"][i] == DONE
+        }
+
+
+def analyze_shared(
+    queries: list[str],
+    start: str | None = None,
+    end: str | None = None,
+    ma_period: int = 10,
+    cmf_period: int = 4,
+    adjusted: bool = True,
+    jobs: int | None = None,
+) -> dict[str, dict]:
+    """다중 종목 주봉 전략 분석 (조회는 부모, 계산은 공유 메모리 프로세스 풀).
+
+    Args:
+        queries: 종목명 또는 코드 리스트
+        start, end, ma_period, cmf_period, adjusted: analyze()와 동일
+        jobs: 워커 프로세스 수
+
+    Returns:
+        {종목코드: {"code", "name", "df", "bt", "summary"}}
+    """
+    frames = {}
+    for q in queries:
+        try:
+            df, code = fetch_ohlcv(q, start, end, period="weekly", adjusted=adjusted)
+        except RequestError as e:
+            print(f"[오류] '{q}' 조회 실패: {e}")
+            continue
+        if df is not None:
+            frames[code] = df
+
+    results = analyze_panel(frames, ma_period, cmf_period, jobs)
+    return {
+        code: {"code": code, "name": to_name(code), **r} for code, r in results.items()
+    }
@@ -1,6 +1,7 @@
 """신호 생성: 매수/매도 신호, 백테스트."""
 
 import pandas as pd
+from backend import use_polars
 
 
 def generate_signals(df: pd.DataFrame) -> pd.DataFrame:
@@ -15,6 +16,11 @@ def generate_signals(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         신호 컬럼이 추가된 DataFrame
     """
+    if use_polars() and not df.empty:
+        import backend
+
+        return backend.generate_signals(df)
+
     df = df.copy()
 
     # 기본 신호 (원본과 동일한 방식: .loc[] 사용으로 NaN 행 보존)
@@ -43,6 +49,39 @@ def generate_signals(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def in_position(df: pd.DataFrame) -> bool:
+    """마지막 바 기준 포지션 보유 여부 (generate_signals 상태 머신 결과).
+
+    Args:
+        df: 신호가 포함된 DataFrame
+
+    Returns:
+        마지막 실제 매도 이후 매수 신호가 있으면 True
+    """
+    sells = df.index[df["ActualSell"] == 1]
+    after = df.iloc[1:] if sells.empty else df[df.index > sells[-1]]
+    return bool((after["Buy"] == 1).any())
+
+
+def latest_signals(df: pd.DataFrame) -> dict:
+    """마지막 바의 지표/신호 값 (스크리닝용).
+
+    Returns:
+        date, Close, MA, CMF, FG, Buy, Sell, InPos 딕셔너리
+    """
+    last = df.iloc[-1]
+    return {
+        "date": df.index[-1],
+        "Close": last["Close"],
+        "MA": last["MA"],
+        "CMF": last["CMF"],
+        "FG": last["FG"],
+        "Buy": int(last["Buy"]),
+        "Sell": int(last["Sell"]),
+        "InPos": in_position(df),
+    }
+
+
 def backtest(df: pd.DataFrame, close_last: bool = True) -> pd.DataFrame:
     """백테스트 실행.
 
@@ -0,0 +1,123 @@
+"""테스트 공용 픽스처: 네트워크 없이 pykrx.stock을 대신하는 가짜 KRX."""
+
+import zlib
+
+import cache
+import numpy as np
+import pandas as pd
+import pytest
+import ratelimit
+import trading_calendar
+import utils
+
+FIRST_DAY = pd.Timestamp("2015-01-05")
+
+NAMES = {
+    "005930": "삼성전자",
+    "000660": "SK하이닉스",
+    "035420": "NAVER",
+    "035720": "카카오",
+    "005380": "현대차",
+}
+
+
+class FakeKRX:
+    """pykrx.stock 대역.
+
+    종목마다 결정적인 일반주가 일봉을 만들고, splits에 지정한 날짜에
+    분할/병합(계수 = 새 가격 / 기준 가격)을 반영합니다. today를 지정하면
+    그 날짜까지의 데이터만 있는 것처럼 동작합니다 (수정주가도 그때까지의
+    분할만 반영). splits는 첫 조회 전에 지정해야 합니다.
+    """
+
+    def __init__(self):
+        self.splits: dict[str, dict[str, float]] = {}
+        self.today: pd.Timestamp | None = None
+        self.calls: list[tuple] = []
+        self._raw: dict[str, pd.DataFrame] = {}
+
+    def raw(self, code: str) -> pd.DataFrame:
+        """전 구간 일반주가 일봉 (KRX 컬럼명, 등락률 포함)."""
+        if code not in self._raw:
+            rng = np.random.default_rng(zlib.crc32(code.encode()))
+            idx = pd.bdate_range(FIRST_DAY, pd.Timestamp.now().normalize())
+            n = len(idx)
+            value = 50000 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, n)))
+            scale = np.ones(n)
+            for day, factor in self.splits.get(code, {}).items():
+                scale[idx >= pd.Timestamp(day)] *= factor
+            close = np.round(value * scale)
+            open_ = np.round(close * (1 + rng.normal(0, 0.005, n)))
+            high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, n)))
+            low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, n)))
+            # 기준가 = 전일 종가 × 당일 계수 (분할일이 아니면 전일 종가)
+            base = np.append(close[0], close[:-1] * scale[1:] / scale[:-1])
+            self._raw[code] = pd.DataFrame(
+                {
+                    "시가": open_,
+                    "고가": np.round(high),
+                    "저가": np.round(low),
+                    "종가": close,
+                    "거래량": rng.integers(100_000, 1_000_000, n),
+                    "거래대금": close * 500_000,
+                    "등락률": np.round((close / base - 1) * 100, 2),
+                },
+                index=idx.rename("날짜"),
+            )
+        return self._raw[code]
+
+    def adjusted(self, code: str) -> pd.DataFrame:
+        """today까지 알려진 분할을 반영한 수정주가 일봉 (KRX 수정주가 조회 결과)."""
+        raw = self.raw(code)
+        factor = np.ones(len(raw))
+        for day, f in self.splits.get(code, {}).items():
+            day = pd.Timestamp(day)
+            if self.today is None or day <= self.today:
+                factor[raw.index < day] *= f
+        df = raw[["시가", "고가", "저가", "종가", "거래량"]].astype(float)
+        df[["시가", "고가", "저가", "종가"]] *= factor[:, None]
+        df["거래량"] = np.round(df["거래량"] / factor)
+        return df
+
+    def _window(self, df: pd.DataFrame, start: str, end: str) -> pd.DataFrame:
+        end = pd.Timestamp(end)
+        if self.today is not None:
+            end = min(end, self.today)
+        return df.loc[pd.Timestamp(start) : end]
+
+    # pykrx.stock 함수
+    def get_market_ohlcv_by_date(self, start, end, code, adjusted=True):
+        self.calls.append(("ohlcv", start, end, code, adjusted))
+        df = self.adjusted(code) if adjusted else self.raw(code)
+        return self._window(df, start, end)
+
+    def get_index_ohlcv_by_date(self, start, end, ticker, name_display=True):
+        self.calls.append(("index", start, end))
+        idx = pd.bdate_range(FIRST_DAY, pd.Timestamp.now().normalize())
+        df = pd.DataFrame({"종가": np.ones(len(idx))}, index=idx)
+        return df.loc[pd.Timestamp(start) : pd.Timestamp(end)]
+
+    def get_market_ticker_list(self, date, market="ALL"):
+        self.calls.append(("tickers", date))
+        return list(NAMES)
+
+    def get_market_ticker_name(self, code):
+        return NAMES.get(code, "")
+
+
+@pytest.fixture
+def krx(monkeypatch, tmp_path):
+    """가짜 KRX + 임시 캐시 디렉터리 + 대기 없는 요청 조절기."""
+    fake = FakeKRX()
+    monkeypatch.setattr(utils, "krx", lambda: fake)
+    monkeypatch.setattr(trading_calendar, "_state", None)
+    monkeypatch.setattr(trading_calendar, "_failed_at", None)
+    monkeypatch.setattr(
+        ratelimit,
+        "_governor",
+        ratelimit.RequestGovernor(rate=1e6, burst=10**6, backoff=0),
+    )
+    monkeypatch.setattr(cache, "_cache_dir", str(tmp_path / "cache"))
+    utils.get_stock_list.cache_clear()
+    yield fake
+    utils.get_stock_list.cache_clear()
@@ -0,0 +1,118 @@
+"""기간 간 정렬: 인덱스 맵과 완성 바 참조가 미래 데이터를 보지 않는지 확인."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from align import broadcast, completed, execute_daily, index_maps
+from utils import resample_monthly, resample_weekly
+
+
+def _daily(end: str = "2024-06-28") -> pd.DataFrame:
+    idx = pd.bdate_range("2023-01-02", end)
+    rng = np.random.default_rng(0)
+    # 휴장일: 임의 평일 + 금요일 휴장 + 한 주 전체 휴장
+    holidays = set(rng.choice(idx, 25, replace=False))
+    holidays |= {pd.Timestamp("2023-03-31"), pd.Timestamp("2023-12-29")}
+    holidays |= set(pd.bdate_range("2023-10-02", "2023-10-06"))
+    idx = idx[~idx.isin(list(holidays))]
+    close = 100 + np.cumsum(rng.normal(0, 1, len(idx)))
+    return pd.DataFrame(
+        {
+            "Open": close + rng.normal(0, 0.5, len(idx)),
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Volume": rng.integers(1, 1000, len(idx)),
+        },
+        index=idx,
+    )
+
+
+def _frames(end: str = "2024-06-28"):
+    daily = _daily(end)
+    weekly, monthly = resample_weekly(daily), resample_monthly(daily)
+    return daily, weekly, monthly, index_maps(daily.index, weekly.index, monthly.index)
+
+
+def _bar_days(daily: pd.DataFrame, rule: str) -> pd.Series:
+    """각 상위 바의 첫/마지막 일봉 날짜 (직접 리샘플링)."""
+    days = daily.index.to_series()
+    return days.resample(rule).agg(["first", "last"]).dropna()
+
+
+@pytest.mark.parametrize("end", ["2024-06-28", "2024-06-26", "2024-05-15"])
+def test_maps_point_to_containing_bar(end):
+    daily, weekly, monthly, maps = _frames(end)
+    for key, bars, rule in (
+        ("daily_weekly", weekly, "W-FRI"),
+        ("daily_monthly", monthly, "ME"),
+    ):
+        span = _bar_days(daily, rule)
+        pos = maps[key]
+        assert (pos >= 0).all()
+        assert (span["first"].to_numpy()[pos] <= daily.index).all()
+        assert (daily.index <= span["last"].to_numpy()[pos]).all()
+        assert bars.index[pos[-1]] == bars.index[-1]
+
+    # 주봉은 마지막 거래일이 속한 월봉에 대응 (월을 걸친 주 포함)
+    week_last = _bar_days(daily, "W-FRI")["last"]
+    expected = monthly.index.searchsorted(week_last.to_numpy())
+    np.testing.assert_array_equal(maps["weekly_monthly"], expected)
+
+
+@pytest.mark.parametrize("end", ["2024-06-28", "2024-06-26"])
+@pytest.mark.parametrize(
+    "rule, key", [("W-FRI", "daily_weekly"), ("ME", "daily_monthly")]
+)
+def test_completed_has_no_lookahead(end, rule, key):
+    daily, _, _, maps = _frames(end)
+    last = _bar_days(daily, rule)["last"].to_numpy()
+    pos = completed(maps[key])
+    for i, day in enumerate(daily.index[:-1]):
+        # 그날 종가까지 끝난 상위 바 중 가장 최근 것
+        done = np.flatnonzero(last <= day)
+        assert pos[i] == (done[-1] if len(done) else -1)
+    # 마지막 일봉은 진행 중인 바를 그 시점 값으로 완성된 것으로 봄
+    assert pos[-1] == maps[key][-1]
+
+
+def test_broadcast_matches_asof_join():
+    daily, weekly, _, maps = _frames()
+    got = broadcast(weekly["Close"], maps["daily_weekly"], daily.index)
+
+    # 기준: 각 주봉 값이 그 주 마지막 거래일에 공개된다고 보고 asof 조인
+    known = weekly["Close"].copy()
+    known.index = _bar_days(daily, "W-FRI")["last"].to_numpy()
+    expected = known.reindex(daily.index).ffill()
+    expected.iloc[-1] = weekly["Close"].iloc[-1]
+    pd.testing.assert_series_equal(got, expected, check_names=False)
+
+    # 미래 참조 허용 모드는 그 주의 최종 값
+    ahead = broadcast(weekly["Close"], maps["daily_weekly"], complete=False)
+    np.testing.assert_array_equal(
+        ahead, weekly["Close"].to_numpy()[maps["daily_weekly"]]
+    )
+
+
+def test_broadcast_int_fill():
+    mapping = np.array([0, 0, 1, 1])
+    out = broadcast(np.array([1, 0]), mapping)
+    assert np.isnan(out[0]) and out[1] == 1 and out[2] == 1 and out[3] == 0
+
+
+def test_execute_daily_fills_after_week_closes():
+    daily, weekly, _, maps = _frames()
+    weekly = weekly.assign(Buy=0, Sell=0)
+    weekly.iloc[[5, 30], weekly.columns.get_loc("Buy")] = 1
+    weekly.iloc[[12, len(weekly) - 1], weekly.columns.get_loc("Sell")] = 1
+
+    bt = execute_daily(weekly, daily, maps["daily_weekly"])
+    week_last = _bar_days(daily, "W-FRI")["last"]
+    for signal, entry in ((5, 0), (30, 1)):
+        assert bt["EntryDate"].iloc[entry] > week_last.iloc[signal]
+        nxt = daily.index[daily.index > week_last.iloc[signal]][0]
+        assert bt["EntryDate"].iloc[entry] == nxt
+        assert bt["EntryPrice"].iloc[entry] == daily.loc[nxt, "Open"]
+    # 마지막 주의 매도 신호는 다음 일봉이 없으므로 마지막 종가로 정리
+    assert bt["ExitDate"].iloc[-1] == daily.index[-1]
+    assert bt["ExitPrice"].iloc[-1] == daily["Close"].iloc[-1]
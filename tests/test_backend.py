@@ -0,0 +1,111 @@
+"""Polars 백엔드가 pandas 경로와 같은 결과를 내는지 확인 (parity)."""
+
+import zlib
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+pytest.importorskip("polars")
+
+import backend  # noqa: E402
+from indicators import add_indicators  # noqa: E402
+from signals import generate_signals  # noqa: E402
+from utils import resample_monthly, resample_weekly  # noqa: E402
+
+PRICES = ["Open", "High", "Low", "Close"]
+
+
+def _daily(
+    code: str,
+    n: int = 1500,
+    ints: bool = False,
+    zero_range: bool = False,
+    halt: bool = False,
+) -> pd.DataFrame:
+    """임의 일봉 (빠진 날, 거래량 0 구간 포함)."""
+    rng = np.random.default_rng(zlib.crc32(code.encode()))
+    idx = pd.bdate_range("2015-01-05", periods=n)
+    idx = idx[rng.random(n) > 0.05]
+    m = len(idx)
+    close = 10000 * np.exp(np.cumsum(rng.normal(0, 0.02, m)))
+    open_ = close * (1 + rng.normal(0, 0.005, m))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, m)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, m)))
+    volume = rng.integers(0, 1_000_000, m)
+    volume[:30] = 0  # 거래량 0
+    df = pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
+        index=idx.rename("날짜"),
+    )
+    if ints:
+        df[PRICES] = df[PRICES].round().astype("int64")
+    if zero_range:
+        df.iloc[100:110, :4] = df.iloc[100, 3]  # High == Low
+    if halt:
+        df = df.drop(df.index[300:330])  # 몇 주 통째로 빈 구간
+        df.iloc[400:440, :4] = df.iloc[399, 3]  # 보합 + 거래량 유지
+    return df
+
+
+FRAMES = {
+    f"{i:06d}": _daily(
+        f"{i:06d}", ints=i % 2 == 0, zero_range=i % 3 == 0, halt=i % 4 == 0
+    )
+    for i in range(12)
+}
+FRAMES["short"] = _daily("short", n=3)
+FRAMES["empty"] = _daily("empty").iloc[:0]
+
+
+@pytest.fixture
+def polars_backend():
+    backend.set_backend("polars")
+    yield
+    backend.set_backend("pandas")
+
+
+def _pandas(fn, *args):
+    backend.set_backend("pandas")
+    try:
+        return fn(*args)
+    finally:
+        backend.set_backend("polars")
+
+
+def _strategy(weekly: pd.DataFrame) -> pd.DataFrame:
+    return generate_signals(add_indicators(weekly))
+
+
+@pytest.mark.parametrize("code", [c for c in FRAMES if c != "empty"])
+def test_single_frame_parity(polars_backend, code):
+    df = FRAMES[code]
+    weekly = resample_weekly(df)
+    assert_frame_equal(weekly, _pandas(resample_weekly, df))
+    assert_frame_equal(resample_monthly(df), _pandas(resample_monthly, df))
+    assert_frame_equal(add_indicators(weekly), _pandas(add_indicators, weekly))
+    assert_frame_equal(_strategy(weekly), _pandas(_strategy, weekly))
+
+
+def test_panel_parity(polars_backend):
+    weekly = backend.resample_panel(FRAMES, "weekly")
+    monthly = backend.resample_panel(FRAMES, "monthly")
+    nonempty = {c: w for c, w in weekly.items() if len(w)}
+    signals = backend.generate_signals_panel(backend.add_indicators_panel(nonempty))
+
+    assert list(weekly) == list(FRAMES)
+    for code, df in FRAMES.items():
+        ref_weekly = _pandas(resample_weekly, df)
+        if df.empty:
+            assert weekly[code].empty and monthly[code].empty
+            continue
+        assert_frame_equal(weekly[code], ref_weekly)
+        assert_frame_equal(monthly[code], _pandas(resample_monthly, df))
+        assert_frame_equal(signals[code], _pandas(_strategy, ref_weekly))
+
+
+def test_empty_frame_uses_pandas_path(polars_backend):
+    df = FRAMES["empty"]
+    assert_frame_equal(resample_weekly(df), _pandas(resample_weekly, df))
+    assert_frame_equal(resample_monthly(df), _pandas(resample_monthly, df))
@@ -0,0 +1,102 @@
+"""결과 내보내기: ResultWriter로 기록한 결과를 load_results로 그대로 읽는지 확인."""
+
+import zlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from export import ResultWriter, list_codes, load_results  # noqa: E402
+from init import run_strategy  # noqa: E402
+
+
+def _weekly(code: str, n: int = 200) -> pd.DataFrame:
+    rng = np.random.default_rng(zlib.crc32(code.encode()))
+    close = 10000 * np.exp(np.cumsum(rng.normal(0, 0.03, n)))
+    return pd.DataFrame(
+        {
+            "Open": close * (1 + rng.normal(0, 0.01, n)),
+            "High": close * 1.02,
+            "Low": close * 0.98,
+            "Close": close,
+            "Volume": rng.integers(1, 1_000_000, n),
+        },
+        index=pd.date_range("2020-01-03", periods=n, freq="W-FRI"),
+    )
+
+
+def _result(code: str, n: int = 200) -> dict:
+    return run_strategy(_weekly(code, n), code, name=f"종목{code}")
+
+
+def test_round_trip(tmp_path):
+    results = {c: _result(c) for c in ("000660", "005930")}
+    with ResultWriter(str(tmp_path)) as writer:
+        for r in results.values():
+            writer.write(r)
+        writer.write(None)
+    assert writer.written == 2
+    assert list_codes(str(tmp_path)) == ["000660", "005930"]
+
+    indicators = load_results(str(tmp_path))
+    trades = load_results(str(tmp_path), "trades")
+    summary = load_results(str(tmp_path), "summary").set_index("code")
+    for code, r in results.items():
+        got = indicators[indicators["code"] == code].drop(columns="code")
+        expected = r["df"].rename_axis("Date").reset_index()
+        pd.testing.assert_frame_equal(
+            got.reset_index(drop=True), expected, check_dtype=False
+        )
+
+        got = trades[trades["code"] == code].drop(columns="code")
+        pd.testing.assert_frame_equal(
+            got.reset_index(drop=True), r["bt"], check_dtype=False
+        )
+        assert summary.loc[code, "name"] == f"종목{code}"
+        assert summary.loc[code, "trades"] == r["summary"]["trades"]
+
+
+def test_select_columns_and_codes(tmp_path):
+    writer = ResultWriter(str(tmp_path))
+    for code in ("000660", "005930", "035420"):
+        writer.write(_result(code))
+
+    df = load_results(
+        str(tmp_path), columns=["Date", "Close", "없는컬럼"], codes=["005930", "999999"]
+    )
+    assert list(df.columns) == ["code", "Date", "Close"]
+    assert set(df["code"]) == {"005930"}
+
+
+def test_empty_trades_keep_schema(tmp_path):
+    r = _result("005930", n=3)  # 거래 없음
+    assert r["bt"].empty
+    ResultWriter(str(tmp_path)).write(r)
+    trades = load_results(str(tmp_path), "trades")
+    assert trades.empty
+    assert trades["EntryDate"].dtype.kind == "M"
+    assert trades["Return"].dtype == np.float64
+
+
+def test_rewrite_replaces_partition(tmp_path):
+    writer = ResultWriter(str(tmp_path))
+    writer.write(_result("005930", n=200))
+    writer.write(_result("005930", n=120))
+    assert len(load_results(str(tmp_path), columns=["Close"])) == 120
+
+
+def test_multi_timeframe_result(tmp_path):
+    daily = _weekly("005930", 50).asfreq("B").ffill()
+    r = {"code": "005930", "daily": daily, "monthly": daily.resample("ME").last()}
+    ResultWriter(str(tmp_path)).write(r)
+    for tf, df in (("daily", daily), ("monthly", r["monthly"])):
+        got = load_results(str(tmp_path), timeframe=tf)
+        assert len(got) == len(df)
+    assert load_results(str(tmp_path), "trades").empty
+
+
+def test_unknown_table(tmp_path):
+    with pytest.raises(ValueError):
+        load_results(str(tmp_path), "prices")
@@ -0,0 +1,104 @@
+"""일봉 조회: 일반주가 + 조정 계수로 만든 수정주가, 디스크 캐시 구간 처리."""
+
+import warnings
+
+import cache
+import numpy as np
+import pandas as pd
+import pytest
+from fetcher import OHLCV, _load_raw, fetch_ohlcv
+
+CODE = "005930"
+KRX_COLS = ["시가", "고가", "저가", "종가", "거래량"]
+
+
+def _krx_adjusted(krx, start, end) -> pd.DataFrame:
+    df = krx.adjusted(CODE).loc[start:end, KRX_COLS]
+    return df.set_axis(OHLCV, axis=1)
+
+
+def _ohlcv_calls(krx) -> list[tuple]:
+    return [c for c in krx.calls if c[0] == "ohlcv"]
+
+
+def _assert_adjusted(got: pd.DataFrame, expected: pd.DataFrame):
+    # 계수는 소수 2자리로 반올림된 등락률에서 구하므로 ~1e-4 이내
+    assert list(got.index) == list(expected.index)
+    np.testing.assert_allclose(got[OHLCV[:4]], expected[OHLCV[:4]], rtol=1e-4)
+    np.testing.assert_allclose(got["Volume"], expected["Volume"], rtol=1e-4, atol=1)
+
+
+@pytest.fixture
+def splits(krx):
+    krx.splits[CODE] = {"2018-05-04": 0.02, "2021-03-02": 5.0}
+    return krx
+
+
+def test_adjusted_recent_window_matches_krx(splits):
+    df, _ = fetch_ohlcv(CODE, start="20170101", period="daily")
+    _assert_adjusted(df, _krx_adjusted(splits, "2017-01-01", df.index[-1]))
+
+
+def test_adjusted_historical_window_matches_krx(splits):
+    # 종료일 이후 분할(2021-03-02)은 짧은 수정주가 조회로 반영
+    df, _ = fetch_ohlcv(CODE, start="20190101", end="20191231", period="daily")
+    _assert_adjusted(df, _krx_adjusted(splits, "2019-01-01", "2019-12-31"))
+    adjusted = [c for c in _ohlcv_calls(splits) if c[4]]
+    assert len(adjusted) == 1
+    assert pd.Timestamp(adjusted[0][1]) >= pd.Timestamp("2019-12-01")
+
+
+def test_adjusted_single_day_window(splits):
+    # 바 1개면 구간 내 계수가 빈 Series (이후 분할 계수만 적용)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        df, _ = fetch_ohlcv(CODE, start="20191227", end="20191227", period="daily")
+    _assert_adjusted(df, _krx_adjusted(splits, "2019-12-27", "2019-12-27"))
+
+
+def test_raw_is_unadjusted(splits):
+    df, _ = fetch_ohlcv(
+        CODE, start="20180401", end="20180630", period="daily", adjusted=False
+    )
+    raw = splits.raw(CODE).loc["2018-04-01":"2018-06-30", KRX_COLS]
+    np.testing.assert_array_equal(df.to_numpy(), raw.to_numpy())
+
+
+def test_load_raw_fetches_only_uncovered_days(krx):
+    _load_raw(CODE, "20200101", "20200630")
+    krx.calls.clear()
+    df, _ = _load_raw(CODE, "20200401", "20200930")  # 뒤쪽만 부족
+    assert [c[1:3] for c in _ohlcv_calls(krx)] == [("20200701", "20200930")]
+    expected = krx.raw(CODE).loc["2020-04-01":"2020-09-30", "종가"]
+    np.testing.assert_array_equal(df["Close"], expected)
+    entry = cache.load_ohlcv(CODE)
+    assert (entry["start"], entry["end"]) == (
+        pd.Timestamp("2020-01-01"),
+        pd.Timestamp("2020-09-30"),
+    )
+
+
+def test_load_raw_with_gap_to_cache(krx):
+    _load_raw(CODE, "20200101", "20200630")
+
+    # 캐시보다 앞선 떨어진 구간: 그 구간만 조회, 캐시는 유지
+    df, _ = _load_raw(CODE, "20190101", "20190331")
+    assert df.index[0] >= pd.Timestamp("2019-01-01")
+    assert df.index[-1] <= pd.Timestamp("2019-03-31")
+    entry = cache.load_ohlcv(CODE)
+    assert entry["start"] == pd.Timestamp("2020-01-01")
+
+    # 캐시보다 뒤의 떨어진 구간: 더 최근이므로 캐시를 교체
+    df, _ = _load_raw(CODE, "20210101", "20210331")
+    assert df.index[0] >= pd.Timestamp("2021-01-01")
+    entry = cache.load_ohlcv(CODE)
+    assert (entry["start"], entry["end"]) == (
+        pd.Timestamp("2021-01-01"),
+        pd.Timestamp("2021-03-31"),
+    )
+
+    # 교체된 캐시는 빈틈 없는 구간으로 답함 (2020년 하반기를 덮었다고 보지 않음)
+    krx.calls.clear()
+    df, _ = _load_raw(CODE, "20200701", "20210331")
+    assert df.index[0] == pd.Timestamp("2020-07-01")
+    assert _ohlcv_calls(krx)
@@ -0,0 +1,86 @@
+"""Elder Impulse: 배치 EMA 경로가 pandas ewm 경로와 같은 라벨을 내는지 확인."""
+
+import numpy as np
+import pandas as pd
+from indicators import (
+    _SLOPE_TOL,
+    calc_elder_impulse,
+    calc_elder_impulse_panel,
+    calc_ema,
+    calc_ema_batch,
+    impulse_labels,
+)
+
+
+def _ewm_impulse(close: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """calc_ema(ewm) 기반 이전 구현의 라벨과 기울기 크기 (가격 대비)."""
+    ema = calc_ema(close, 13)
+    macd = calc_ema(close, 12) - calc_ema(close, 26)
+    hist = macd - calc_ema(macd, 9)
+    ema_slope, hist_slope = ema.diff(), hist.diff()
+
+    labels = pd.Series("neutral", index=close.index)
+    labels[(ema_slope > 0) & (hist_slope > 0)] = "bull"
+    labels[(ema_slope < 0) & (hist_slope < 0)] = "bear"
+    slope = np.minimum(ema_slope.abs(), hist_slope.abs()) / ema.abs()
+    return labels, slope
+
+
+def _walk(n: int, seed: int) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    close = 50000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.Series(close.round(), index=pd.bdate_range("2015-01-02", periods=n))
+
+
+def test_ema_batch_matches_ewm():
+    close = _walk(3000, 0)
+    got = calc_ema_batch(close, [5, 12, 13, 26])
+    for i, span in enumerate([5, 12, 13, 26]):
+        np.testing.assert_allclose(got[i], calc_ema(close, span), rtol=1e-12)
+
+
+def test_ema_batch_panel_matches_per_symbol():
+    panel = pd.concat([_walk(500, s) for s in range(3)], axis=1)
+    panel.iloc[:50, 1] = np.nan  # 상장 전
+    panel.iloc[200:210, 2] = np.nan  # 중간 결측은 직전 값으로
+    got = calc_ema_batch(panel, [13])[0]
+    for j in range(3):
+        close = panel.iloc[:, j]
+        expected = calc_ema(close.ffill(), 13)
+        np.testing.assert_allclose(got[:, j], expected, rtol=1e-12)
+    assert np.isnan(got[:50, 1]).all()
+
+
+def test_impulse_panel_matches_single():
+    panel = pd.concat([_walk(500, s) for s in range(3)], axis=1)
+    codes = calc_elder_impulse_panel(panel)["ImpulseCode"]
+    for j in range(3):
+        single = calc_elder_impulse(pd.DataFrame({"Close": panel.iloc[:, j]}))
+        np.testing.assert_array_equal(codes.iloc[:, j], single["ImpulseCode"])
+
+
+def test_impulse_constant_series_is_neutral():
+    for price in (100.0, 53700.0, 1_234_000.0):
+        close = pd.Series(price, index=pd.bdate_range("2020-01-01", periods=100))
+        df = calc_elder_impulse(pd.DataFrame({"Close": close}))
+        assert "Impulse" not in df.columns  # 라벨은 요청 시에만
+        assert (df["ImpulseCode"] == 0).all()
+
+
+def test_impulse_halted_stretches_match_ewm():
+    close = _walk(3000, 1)
+    close.iloc[400:520] = close.iloc[399]  # 거래정지
+    close.iloc[1200:1230] = close.iloc[1199]  # 상한가 고정
+    close.iloc[2000:2400] = close.iloc[1999]  # 장기 거래정지
+
+    got = impulse_labels(
+        calc_elder_impulse(pd.DataFrame({"Close": close}))["ImpulseCode"]
+    )
+    expected, slope = _ewm_impulse(close)
+
+    # ewm 기울기가 반올림 오차 수준(허용 오차 이하)인 바는 보합으로 판정
+    noise = slope <= _SLOPE_TOL
+    pd.testing.assert_series_equal(got[~noise], expected[~noise], check_names=False)
+    assert (got[noise] == "neutral").all()
+    # 차이는 보합 구간 안에서만
+    assert (close.diff()[got != expected] == 0).all()
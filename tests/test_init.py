@@ -0,0 +1,54 @@
+"""analyze_full 윈도 모드: 워밍업만큼 더 계산한 결과가 전체 이력 계산과 같은지 확인."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from init import analyze_full
+
+CODE = "005930"
+END = "20240628"
+EXACT = ["MA", "CMF", "FG", "PrevHigh", "PrevLow", "Buy", "Sell"]
+EMA_COLS = ["EMA", "MACD", "MACD_Signal", "MACD_Hist"]
+
+
+def _run(**kwargs) -> dict:
+    return analyze_full(CODE, end=END, plot=False, verbose=False, **kwargs)
+
+
+@pytest.mark.parametrize("tol", [1e-2, 1e-6])
+def test_window_matches_full_history(krx, tol):
+    window = _run(window_years=1, tol=tol)
+    full = _run(start="20150101")
+
+    start = pd.Timestamp(END) - pd.DateOffset(years=1)
+    assert window["weekly"].index[0] >= start
+    for tf in ("daily", "weekly", "monthly"):
+        got = window[tf]
+        expected = full[tf].loc[got.index]
+        assert got.index.equals(full[tf].index[full[tf].index >= start])
+        pd.testing.assert_frame_equal(
+            got[["TD_Sell", "TD_Buy"]],
+            expected[["TD_Sell", "TD_Buy"]],
+            check_freq=False,
+        )
+
+    got = window["weekly"]
+    expected = full["weekly"].loc[got.index]
+    pd.testing.assert_frame_equal(got[EXACT], expected[EXACT], check_freq=False)
+
+    # EMA 계열은 초기값 잔여 가중치가 tol 이하 (가격 대비)
+    scale = expected["Close"].abs().to_numpy()[:, None]
+    err = np.abs(got[EMA_COLS].to_numpy() - expected[EMA_COLS].to_numpy()) / scale
+    assert err.max() <= tol
+    if tol <= 1e-6:
+        assert (got["ImpulseCode"] == expected["ImpulseCode"]).all()
+
+
+def test_window_fetches_only_warmup(krx):
+    window = _run(window_years=1)
+    start = min(pd.Timestamp(c[1]) for c in krx.calls if c[0] == "ohlcv")
+    # 주봉 워밍업(약 2년) 정도만 더 조회 (전체 이력 2015년부터가 아님)
+    assert start > pd.Timestamp("2021-01-01")
+    # 맵은 잘라낸 윈도 기준
+    assert len(window["maps"]["daily_weekly"]) == len(window["daily"])
+    assert window["maps"]["daily_weekly"].max() == len(window["weekly"]) - 1
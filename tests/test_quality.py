@@ -0,0 +1,110 @@
+"""데이터 품질 검사: 심어 둔 문제를 정확히 찾고 보정하는지 확인."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from quality import ISSUES, summarize, validate_ohlcv, validate_panel
+
+CALENDAR = pd.bdate_range("2024-01-01", "2024-06-28")
+
+
+def _clean(seed: int, n: int = len(CALENDAR)) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.round(20000 * np.exp(np.cumsum(rng.normal(0, 0.015, n))))
+    open_ = np.round(close * (1 + rng.normal(0, 0.005, n)))
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(open_, close) + 100,
+            "Low": np.minimum(open_, close) - 100,
+            "Close": close,
+            "Volume": rng.integers(1000, 100_000, n),
+        },
+        index=CALENDAR[:n].rename("Date"),
+    )
+
+
+def _dirty() -> pd.DataFrame:
+    df = _clean(1)
+    df.iloc[10, df.columns.get_loc("Close")] = 0  # bad_price
+    df.iloc[20, df.columns.get_loc("High")] = df["Low"].iloc[20] - 1  # ohlc
+    df.iloc[30, df.columns.get_loc("Volume")] = 0  # zero_volume
+    df.iloc[40:, :4] *= 1.5  # outlier (급등 후 유지)
+    df.iloc[60, :4] *= 10  # spike (다음 바에 되돌아감)
+    df = df.drop(df.index[[70, 71, 72]])  # missing 3일
+    extra = df.iloc[[80]].set_axis([pd.Timestamp("2024-04-27")])  # 토요일
+    return pd.concat([df, extra]).sort_index().rename_axis("Date")
+
+
+def test_detects_each_issue():
+    report, fixed = validate_panel(
+        {"000001": _dirty(), "000002": _clean(2)}, calendar=CALENDAR
+    )
+    assert fixed is None
+    got = {(r.issue, r.date) for r in report.itertuples()}
+    assert got == {
+        ("bad_price", CALENDAR[10]),
+        ("ohlc", CALENDAR[20]),
+        ("zero_volume", CALENDAR[30]),
+        ("outlier", CALENDAR[40]),
+        ("spike", CALENDAR[60]),
+        ("missing", CALENDAR[70]),
+        ("off_calendar", pd.Timestamp("2024-04-27")),
+    }
+    assert set(report["code"]) == {"000001"}
+    assert report.set_index("issue").loc["missing", "value"] == 3
+    assert report.set_index("issue").loc["outlier", "value"] > 8
+    assert report["issue"].cat.categories.tolist() == ISSUES
+
+    table = summarize(report)
+    assert list(table.columns) == ISSUES and (table.loc["000001"] == 1).all()
+
+
+def test_repair():
+    dirty, clean = _dirty(), _clean(2).astype({"Volume": "int32"})
+    _, fixed = validate_panel(
+        {"000001": dirty, "000002": clean, "000003": clean.iloc[:0]},
+        calendar=CALENDAR,
+        repair=True,
+    )
+    # 문제 없는 종목은 dtype까지 그대로
+    pd.testing.assert_frame_equal(fixed["000002"], clean, check_freq=False)
+    assert fixed["000003"].empty
+
+    got = fixed["000001"]
+    dropped = {CALENDAR[10], CALENDAR[30], CALENDAR[60]}
+    assert set(dirty.index) - set(got.index) == dropped
+    assert (got.dtypes == dirty.dtypes).all() and got.index.name == "Date"
+    # OHLC 불일치는 High/Low를 OHLC 최대/최소로
+    row = got.loc[CALENDAR[20]]
+    assert row["High"] == max(row["Open"], row["Close"], dirty.loc[CALENDAR[20], "Low"])
+    assert row["Low"] == min(row["Open"], row["Close"], dirty.loc[CALENDAR[20], "High"])
+    # 이상치/비거래일 바는 유지
+    assert CALENDAR[40] in got.index and pd.Timestamp("2024-04-27") in got.index
+
+    report, _ = validate_panel({"000001": got}, calendar=CALENDAR)
+    assert set(report["issue"]) == {"outlier", "missing", "off_calendar"}
+
+
+def test_keep_zero_volume():
+    df = _dirty()
+    _, fixed = validate_ohlcv(
+        df, "000001", calendar=CALENDAR, repair=True, drop_zero_volume=False
+    )
+    assert fixed.loc[CALENDAR[30], "Volume"] == 0
+
+
+@pytest.mark.parametrize("frames", [{}, {"000001": _clean(1).iloc[:0]}])
+def test_empty(frames):
+    report, fixed = validate_panel(frames, calendar=CALENDAR, repair=True)
+    assert report.empty and list(report.columns) == ["code", "date", "issue", "value"]
+    assert all(df.empty for df in fixed.values()) and fixed.keys() == frames.keys()
+
+
+def test_default_calendar(krx):
+    # 캘린더를 주지 않으면 trading_calendar 거래일 사용
+    df = _clean(3).drop(CALENDAR[50])
+    report, _ = validate_ohlcv(df, "000003")
+    assert report[["issue", "date", "value"]].values.tolist() == [
+        ["missing", CALENDAR[50], 1.0]
+    ]
@@ -0,0 +1,72 @@
+"""요청 조절기: 빈 응답은 데이터를 기대한 요청에서만 조회 제한으로 처리."""
+
+import pandas as pd
+import pytest
+from fetcher import _fetch_daily
+from ratelimit import RequestError, RequestGovernor
+
+
+def _governor() -> RequestGovernor:
+    return RequestGovernor(
+        rate=1000, burst=1000, max_rate=2000, backoff=0, empty_retries=2
+    )
+
+
+def _responses(*frames):
+    """호출마다 frames를 차례로 돌려주는 요청 함수."""
+    it = iter(frames)
+    return lambda: next(it)
+
+
+def test_empty_without_expectation_is_returned():
+    g = _governor()
+    rate = g.rate
+    assert g.call(_responses(pd.DataFrame())).empty
+    m = g.metrics()
+    assert (m["empty"], m["retries"], m["throttle_events"]) == (1, 0, 0)
+    assert g.rate > rate
+
+
+def test_expected_empty_is_retried_and_throttles():
+    g = _governor()
+    data = pd.DataFrame({"종가": [1.0]})
+    result = g.call(_responses(pd.DataFrame(), data), expect_data=lambda: True)
+    assert result is data
+    m = g.metrics()
+    assert (m["empty"], m["retries"], m["throttle_events"]) == (1, 1, 1)
+    assert g.rate < 1000
+
+
+def test_expected_empty_raises_after_retries():
+    g = _governor()
+    with pytest.raises(RequestError):
+        g.call(lambda: pd.DataFrame(), expect_data=lambda: True)
+    m = g.metrics()
+    assert (m["requests"], m["failures"]) == (3, 1)
+
+
+def test_expectation_is_checked_only_for_empty_responses():
+    g = _governor()
+    calls = []
+    g.call(lambda: pd.DataFrame({"a": [1]}), expect_data=lambda: calls.append(1))
+    g.call(lambda: pd.DataFrame(), expect_data=lambda: calls.append(1))
+    assert len(calls) == 1
+
+
+def test_fetch_daily_retries_throttled_empty_frame(krx, monkeypatch):
+    # pykrx는 조회 제한 응답을 빈 프레임으로 돌려줌
+    real = krx.get_market_ohlcv_by_date
+    throttled = iter([True])
+    monkeypatch.setattr(
+        krx,
+        "get_market_ohlcv_by_date",
+        lambda *a, **k: pd.DataFrame() if next(throttled, False) else real(*a, **k),
+    )
+    df = _fetch_daily("005930", "20240102", "20240131")
+    assert len(df) == 22
+
+
+def test_fetch_daily_holiday_window_is_empty(krx):
+    df = _fetch_daily("005930", "20240106", "20240107")  # 주말
+    assert df.empty
+    assert [c[0] for c in krx.calls].count("ohlcv") == 1
@@ -0,0 +1,78 @@
+"""강건성 분석: 시드 고정 재현성과 재표본 결과의 기본 성질."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import robustness
+from robustness import monte_carlo, robustness_table, trade_matrix
+
+RETS = np.array([0.10, -0.05, 0.20, -0.10, 0.03, 0.07, -0.02])
+
+
+@pytest.mark.parametrize("method", ["bootstrap", "permutation"])
+def test_seed_is_deterministic(method):
+    a = monte_carlo(RETS, 2000, method, seed=7)
+    b = monte_carlo(RETS, 2000, method, seed=7)
+    for key in ("final", "win_rate", "max_dd"):
+        np.testing.assert_array_equal(a[key], b[key])
+        assert a[key].shape == (2000,)
+    c = monte_carlo(RETS, 2000, method, seed=8)
+    assert not np.array_equal(a["max_dd"], c["max_dd"])
+
+
+def test_seed_is_deterministic_across_chunks(monkeypatch):
+    monkeypatch.setattr(robustness, "_CHUNK_ELEMS", 50)  # 청크 여러 개
+    mat, _ = trade_matrix(
+        [pd.DataFrame({"Return": RETS}), pd.DataFrame({"Return": RETS[:3]})]
+    )
+    a = monte_carlo(mat, 101, seed=1)
+    b = monte_carlo(mat, 101, seed=1)
+    for key in ("final", "win_rate", "max_dd"):
+        np.testing.assert_array_equal(a[key], b[key])
+        assert a[key].shape == (101, 2)
+
+
+def test_permutation_keeps_trade_set():
+    sims = monte_carlo(RETS, 500, "permutation", seed=0)
+    np.testing.assert_allclose(sims["final"], np.prod(1 + RETS))
+    np.testing.assert_allclose(sims["win_rate"], (RETS > 0).mean())
+    # 손실 거래를 모두 붙인 경로가 최악, 낙폭은 그보다 나쁠 수 없음
+    worst = np.prod(1 + RETS[RETS < 0]) - 1
+    assert (sims["max_dd"] >= worst - 1e-12).all() and (sims["max_dd"] <= 0).all()
+
+
+def test_bootstrap_samples_only_valid_trades():
+    # 종목마다 거래 수가 다르고 빈 칸은 NaN; 수익률이 일정하면 결과도 고정
+    mat = np.array([[0.1, 0.1, 0.1], [np.nan, -0.2, np.nan], [np.nan] * 3])
+    sims = monte_carlo(mat, 300, seed=3)
+    np.testing.assert_allclose(sims["final"], [[1.1**3, 0.8, 1.0]] * 300)
+    np.testing.assert_allclose(sims["win_rate"], [[1.0, 0.0, 0.0]] * 300)
+    np.testing.assert_allclose(sims["max_dd"], [[0.0, -0.2, 0.0]] * 300)
+
+
+def test_matrix_matches_single_rows():
+    # 종목 1개 행렬은 1차원 입력과 같은 난수열을 사용
+    one = monte_carlo(RETS, 400, seed=5)
+    mat = monte_carlo(RETS[None, :], 400, seed=5)
+    for key in one:
+        np.testing.assert_array_equal(one[key], mat[key][:, 0])
+
+
+def test_robustness_table_reproducible():
+    results = {
+        "A": pd.DataFrame({"Return": RETS}),
+        "B": pd.DataFrame({"Return": RETS[::-1][:4]}),
+        "C": pd.DataFrame({"Return": pd.Series([], dtype=float)}),
+    }
+    t1 = robustness_table(results, n_sims=1000, seed=11)
+    t2 = robustness_table(results, n_sims=1000, seed=11)
+    pd.testing.assert_frame_equal(t1, t2)
+    assert t1["trades"].tolist() == [7, 4, 0]
+    assert (t1.loc["C", ["cum_ret_lo", "cum_ret_hi", "max_dd_lo"]] == 0).all()
+    assert (t1["cum_ret_lo"] <= t1["cum_ret_med"]).all()
+    assert (t1["cum_ret_med"] <= t1["cum_ret_hi"]).all()
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        monte_carlo(RETS, 10, "jackknife")
@@ -0,0 +1,89 @@
+"""워치리스트 러너: 증분 실행 결과가 전체 기간 백테스트와 같은지 확인."""
+
+import pandas as pd
+import pytest
+from fetcher import fetch_ohlcv
+from indicators import add_indicators
+from runner import load_state, update_symbol
+from signals import backtest, generate_signals
+
+CODE = "005930"
+SEED = "2023-10-02"
+END = "2024-09-30"
+
+
+def _days() -> pd.DatetimeIndex:
+    """실행일 (일부 날짜는 실행 누락)."""
+    days = pd.bdate_range(SEED, END)
+    return days[days.day % 3 != 0]
+
+
+def _run_daily(krx, state_dir, days) -> list[dict]:
+    """기준일을 옮기며 실행 (확정 이벤트만 모음)."""
+    krx.today = pd.Timestamp(SEED)
+    update_symbol(CODE, state_dir, as_of=SEED)
+    events = []
+    for d in days:
+        krx.today = d
+        events += [
+            e
+            for e in update_symbol(CODE, state_dir, as_of=d.strftime("%Y%m%d"))
+            if e["confirmed"]
+        ]
+    return events
+
+
+def _reference(krx) -> pd.DataFrame:
+    """END 시점 수정주가로 계산한 전체 기간 거래 (청산된 거래만)."""
+    krx.today = pd.Timestamp(END)
+    start = (pd.Timestamp(SEED) - pd.DateOffset(years=3)).strftime("%Y%m%d")
+    df, _ = fetch_ohlcv(CODE, start=start, end=END.replace("-", ""))
+    return backtest(generate_signals(add_indicators(df)), close_last=False)
+
+
+def _check(events, bt):
+    """시드 이후 진입/청산 날짜와 청산 수익률이 같은지 비교."""
+    buys = [e["date"] for e in events if e["event"] == "Buy"]
+    sells = [e for e in events if e["event"] == "ActualSell"]
+    entries = bt.loc[bt["EntryDate"] > pd.Timestamp(SEED), "EntryDate"]
+    exits = bt[bt["ExitDate"] > pd.Timestamp(SEED)]
+    assert len(exits) > 1
+    # 마지막 매수는 END에 아직 보유 중일 수 있음
+    assert buys[: len(entries)] == list(entries.dt.strftime("%Y-%m-%d"))
+    assert len(buys) - len(entries) in (0, 1)
+    assert [e["date"] for e in sells] == list(exits["ExitDate"].dt.strftime("%Y-%m-%d"))
+    assert [e["return"] for e in sells] == pytest.approx(
+        list(exits["Return"]), rel=1e-9
+    )
+
+
+def test_incremental_matches_full_backtest(krx, tmp_path):
+    events = _run_daily(krx, str(tmp_path / "state"), _days())
+    _check(events, _reference(krx))
+
+
+@pytest.mark.parametrize("factor", [0.02, 5.0])  # 50:1 분할, 5:1 병합
+def test_incremental_across_split(krx, tmp_path, factor):
+    krx.splits[CODE] = {"2024-05-08": factor}
+    state_dir = str(tmp_path / "state")
+    events = _run_daily(krx, state_dir, _days())
+    _check(events, _reference(krx))
+
+    # 저장된 꼬리도 최신 수정주가 기준
+    state = load_state(state_dir, CODE)
+    df, _ = fetch_ohlcv(CODE, start="20220101", end=END.replace("-", ""))
+    tail = pd.Series(
+        state["bars"]["Close"], index=pd.to_datetime(state["bars"]["index"])
+    )
+    assert tail.to_numpy() == pytest.approx(df["Close"].loc[tail.index].to_numpy())
+
+
+def test_weekend_rerun_keeps_state(krx, tmp_path):
+    state_dir = str(tmp_path / "state")
+    krx.today = pd.Timestamp("2024-03-08")
+    update_symbol(CODE, state_dir, as_of="20240308")
+    before = load_state(state_dir, CODE)
+    krx.calls.clear()
+    assert update_symbol(CODE, state_dir, as_of="20240310") == []
+    assert not [c for c in krx.calls if c[0] == "ohlcv"]
+    assert load_state(state_dir, CODE) == before
@@ -0,0 +1,150 @@
+"""스크리너: SignalTable 갱신과 인덱스 질의 결과를 DataFrame 필터와 비교."""
+
+import zlib
+
+import numpy as np
+import pandas as pd
+import pytest
+from indicators import calc_elder_impulse
+from init import run_strategy
+from screener import SignalTable
+
+CODES = [f"{i:06d}" for i in range(1, 41)]
+
+
+def _weekly(code: str, n: int = 120) -> pd.DataFrame:
+    rng = np.random.default_rng(zlib.crc32(code.encode()))
+    close = 10000 * np.exp(np.cumsum(rng.normal(0, 0.04, n)))
+    return pd.DataFrame(
+        {
+            "Open": close * (1 + rng.normal(0, 0.01, n)),
+            "High": close * (1 + rng.uniform(0, 0.05, n)),
+            "Low": close * (1 - rng.uniform(0, 0.05, n)),
+            "Close": close,
+            "Volume": rng.integers(1, 1_000_000, n),
+        },
+        index=pd.date_range("2022-01-07", periods=n, freq="W-FRI"),
+    )
+
+
+@pytest.fixture(scope="module")
+def results():
+    # 종목마다 길이를 달리해 최신 바 날짜가 섞이도록
+    return {
+        c: run_strategy(_weekly(c, 100 + i % 7), c, name=f"종목{c}")
+        for i, c in enumerate(CODES)
+    }
+
+
+def _filter(frame: pd.DataFrame, **conds) -> pd.DataFrame:
+    """기준 결과: to_frame()을 pandas로 직접 거름."""
+    mask = pd.Series(True, index=frame.index)
+    for col, cond in conds.items():
+        s = frame[col]
+        if col.startswith("TD_"):
+            s = s.where(s >= 0)  # -1 = 값 없음
+        if isinstance(cond, tuple):
+            lo, hi = cond
+            if col == "date":
+                lo = None if lo is None else pd.Timestamp(lo)
+                hi = None if hi is None else pd.Timestamp(hi)
+            ok = s.notna()
+            if lo is not None:
+                ok &= s >= lo
+            if hi is not None:
+                ok &= s <= hi
+        elif isinstance(cond, list):
+            ok = s.isin(cond)
+        else:
+            ok = s == (int(cond) if col == "InPos" else cond)
+        mask &= ok.fillna(False)
+    return frame[mask]
+
+
+def test_from_results_matches_last_bar(results):
+    table = SignalTable.from_results(results)
+    frame = table.to_frame()
+    assert list(frame.index) == CODES
+    for code in ("000001", "000017"):
+        last = results[code]["df"].iloc[-1]
+        row = frame.loc[code]
+        assert row["name"] == f"종목{code}"
+        assert row["date"] == results[code]["df"].index[-1]
+        for c in ("Close", "MA", "CMF", "FG"):
+            assert row[c] == pytest.approx(last[c], nan_ok=True)
+        impulse = calc_elder_impulse(results[code]["df"], labels=True)
+        assert row["Impulse"] == impulse["Impulse"].iloc[-1]
+
+
+@pytest.mark.parametrize(
+    "conds",
+    [
+        {"Buy": 1},
+        {"Sell": 0, "InPos": True},
+        {"Impulse": "bull"},
+        {"Impulse": ["bull", "neutral"], "Buy": 0},
+        {"CMF": (0.0, None)},
+        {"CMF": (None, -0.05), "Impulse": "bear"},
+        {"FG": (-0.5, 0.5), "Close": (5000, 20000)},
+        {"TD_Sell": (3, None)},
+        {"TD_Buy": (None, 2)},
+        {"date": ("2024-01-01", None)},
+        {"date": "2023-12-29"},
+    ],
+)
+def test_query_matches_dataframe_filter(results, conds):
+    table = SignalTable.from_results(results)
+    got = table.query(**conds)
+    expected = _filter(table.to_frame(), **conds)
+    pd.testing.assert_frame_equal(got, expected)
+
+
+def test_query_reflects_updates(results):
+    table = SignalTable(capacity=1)  # 용량 확장 포함
+    for code in CODES[:10]:
+        table.update(code, results[code]["df"], f"종목{code}")
+    assert len(table.query()) == 10
+
+    # 질의 후 갱신: 기존 행 교체와 새 종목 추가가 인덱스에 반영
+    df = results["000003"]["df"].copy()
+    df.iloc[-1, df.columns.get_loc("CMF")] = 0.99
+    df.iloc[-1, df.columns.get_loc("Buy")] = 1
+    table.update("000003", df)
+    table.update("000011", results["000011"]["df"], "새종목")
+
+    assert len(table) == 11 and "000011" in table
+    hit = table.query(CMF=(0.9, None), Buy=1)
+    assert list(hit.index) == ["000003"] and hit["name"].iloc[0] == "종목000003"
+    assert table.to_frame().loc["000011", "name"] == "새종목"
+    pd.testing.assert_frame_equal(
+        table.query(Impulse="bull"), _filter(table.to_frame(), Impulse="bull")
+    )
+
+
+def test_update_fills_missing_columns():
+    # add_indicators만 거친 df에 없는 TD/Impulse는 update에서 계산
+    df = _weekly("000001").assign(MA=np.nan, CMF=np.nan, FG=np.nan, Buy=0, Sell=0)
+    table = SignalTable()
+    table.update("000001", df, in_pos=True)
+    row = table.to_frame().iloc[0]
+    assert row["TD_Sell"] >= 0 and row["TD_Buy"] >= 0
+    assert row["Impulse"] in ("bull", "bear", "neutral") and row["InPos"]
+    # 값 없는 지표는 구간 질의에서 제외
+    assert table.query(CMF=(None, None)).empty
+    assert len(table.query(TD_Sell=(0, None))) == 1
+
+
+def test_save_load_round_trip(results, tmp_path):
+    table = SignalTable.from_results(results)
+    path = tmp_path / "table.pkl"
+    table.save(str(path))
+    loaded = SignalTable.load(str(path))
+    pd.testing.assert_frame_equal(loaded.to_frame(), table.to_frame())
+    pd.testing.assert_frame_equal(
+        loaded.query(Buy=1, CMF=(0, None)), table.query(Buy=1, CMF=(0, None))
+    )
+
+
+def test_unknown_column(results):
+    with pytest.raises(ValueError):
+        SignalTable.from_results(results).query(RSI=(70, None))
@@ -0,0 +1,145 @@
+"""종목명 검색: 순위 단계(정확/접두/부분/초성/혼합/입력 중 음절)와 완전 탐색 비교."""
+
+import pandas as pd
+import pytest
+from search import SearchIndex, _find_mixed, chosung
+
+STOCKS = pd.DataFrame(
+    [
+        ("005930", "삼성전자"),
+        ("005935", "삼성전자우"),
+        ("006400", "삼성SDI"),
+        ("028260", "삼성물산"),
+        ("009150", "삼성전기"),
+        ("032830", "삼성생명"),
+        ("000660", "SK하이닉스"),
+        ("035420", "NAVER"),
+        ("035720", "카카오"),
+        ("323410", "카카오뱅크"),
+        ("005380", "현대차"),
+        ("012330", "현대모비스"),
+        ("066570", "LG전자"),
+        ("051910", "LG화학"),
+        ("373220", "LG에너지솔루션"),
+        ("000270", "기아"),
+        ("068270", "셀트리온"),
+        ("105560", "KB금융"),
+        ("055550", "신한지주"),
+        ("017670", "SK텔레콤"),
+    ],
+    columns=["code", "name"],
+)
+
+
+@pytest.fixture(scope="module")
+def index():
+    return SearchIndex(STOCKS)
+
+
+def _hits(index, query, limit=10):
+    return [(r["name"], r["match"]) for r in index.search(query, limit)]
+
+
+def test_name_tiers(index):
+    hits = _hits(index, "삼성전자")
+    assert hits[:2] == [("삼성전자", "exact"), ("삼성전자우", "prefix")]
+
+    # 접두 → 부분 순, 같은 단계는 짧은 이름 → 마스터 순서
+    hits = _hits(index, "전자")
+    assert hits[:3] == [
+        ("삼성전자", "substring"),
+        ("LG전자", "substring"),
+        ("삼성전자우", "substring"),
+    ]
+    assert _hits(index, "카카오")[:2] == [("카카오", "exact"), ("카카오뱅크", "prefix")]
+    assert _hits(index, "lg")[0] == ("LG전자", "prefix")  # 대소문자 무시
+
+
+def test_chosung(index):
+    assert _hits(index, "ㅅㅅㅈㅈ") == [
+        ("삼성전자", "chosung_prefix"),
+        ("삼성전자우", "chosung_prefix"),
+    ]
+    assert _hits(index, "ㅈㅈ") == [
+        ("삼성전자", "chosung"),
+        ("LG전자", "chosung"),
+        ("신한지주", "chosung"),
+        ("삼성전자우", "chosung"),
+    ]
+    assert _hits(index, "ㅋㅋㅇ")[0] == ("카카오", "chosung_prefix")
+
+
+def test_mixed_chosung_and_syllables(index):
+    assert _hits(index, "삼ㅅ전") == [
+        ("삼성전자", "chosung_prefix"),
+        ("삼성전기", "chosung_prefix"),
+        ("삼성전자우", "chosung_prefix"),
+    ]
+    assert _hits(index, "ㅎ대") == [
+        ("현대차", "chosung_prefix"),
+        ("현대모비스", "chosung_prefix"),
+    ]
+    assert _hits(index, "sk하ㅇ") == [("SK하이닉스", "chosung_prefix")]
+
+
+def test_partial_last_syllable(index):
+    # 마지막 글자를 입력 중: '저'는 '전'과, '하'는 '한'과 일치 (받침 없는 음절만)
+    assert _hits(index, "삼성저")[:2] == [
+        ("삼성전자", "chosung_prefix"),
+        ("삼성전기", "chosung_prefix"),
+    ]
+    assert ("신한지주", "chosung_prefix") in _hits(index, "신하")
+    # 앞 글자는 입력이 끝난 음절이므로 그대로 비교
+    assert ("삼성전자", "chosung_prefix") not in _hits(index, "사성저")
+    # 받침 있는 마지막 음절은 부분 입력으로 보지 않음
+    assert not [h for h in _hits(index, "삼성젓") if h[1].startswith("chosung")]
+
+
+def test_code_prefix(index):
+    assert index.search("005930")[0] == {
+        "code": "005930",
+        "name": "삼성전자",
+        "match": "exact",
+    }
+    codes = [r["code"] for r in index.search("0353") if r["match"] == "prefix"]
+    assert codes == []
+    codes = [r["code"] for r in index.search("035") if r["match"] == "prefix"]
+    assert codes == ["035420", "035720"]
+
+
+def test_fuzzy_and_budget(index):
+    assert ("LG에너지솔루션", "fuzzy") in _hits(index, "에너지솔류션")
+    assert _hits(index, "에너지솔류션", limit=10) != []
+    # 예산을 다 쓰면 유사 검색 생략
+    assert index.search("에너지솔류션", budget_ms=0) == []
+    assert index.search("   ") == []
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "삼",
+        "성",
+        "ㅅ",
+        "ㅅㅈ",
+        "삼ㅅ",
+        "ㅅ성",
+        "카ㅋ",
+        "전ㅈ",
+        "하",
+        "대",
+        "자",
+        "지주",
+    ],
+)
+def test_matches_brute_force(index, query):
+    # 역색인 후보 축소가 완전 탐색 결과를 빠뜨리지 않는지 확인
+    q = query.lower()
+    names = STOCKS["name"].str.lower()
+    expected = {
+        n
+        for n, low in zip(STOCKS["name"], names)
+        if (q in low) or _find_mixed(q, low, chosung(low)) >= 0
+    }
+    got = {r["name"] for r in index.search(query, limit=100) if r["match"] != "fuzzy"}
+    assert got == expected
@@ -0,0 +1,73 @@
+"""거래일 캘린더: 조회 실패 기억, 조회 중에도 기존 캘린더로 응답."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+import trading_calendar
+from ratelimit import get_governor
+from trading_calendar import trading_days
+
+
+def _index_calls(krx) -> int:
+    return sum(1 for c in krx.calls if c[0] == "index")
+
+
+def test_trading_days_from_index(krx):
+    days = trading_days("20240101", "20240112")
+    assert list(days) == list(pd.bdate_range("2024-01-01", "2024-01-12"))
+    trading_days("20240201", "20240229")
+    assert _index_calls(krx) == 1  # 두 번째는 로컬 캘린더로 응답
+
+
+def test_failed_fetch_is_not_repeated(krx, monkeypatch):
+    def down(*args, **kwargs):
+        krx.calls.append(("index",))
+        raise ConnectionError("KRX down")
+
+    monkeypatch.setattr(krx, "get_index_ohlcv_by_date", down)
+    for _ in range(5):
+        days = trading_days("20240101", "20240112")
+        assert list(days) == list(pd.bdate_range("2024-01-01", "2024-01-12"))
+    # 첫 호출의 재시도만 (이후는 대기 시간 동안 평일로 대체)
+    assert _index_calls(krx) == get_governor().retries + 1
+
+
+def test_cooldown_expires(krx, monkeypatch):
+    monkeypatch.setattr(
+        trading_calendar,
+        "_failed_at",
+        datetime.now() - trading_calendar.FAILURE_COOLDOWN - timedelta(seconds=1),
+    )
+    trading_days("20240101", "20240112")
+    assert _index_calls(krx) == 1
+
+
+def test_reads_do_not_wait_for_fetch(krx, monkeypatch):
+    trading_days("20240101", "20240112")
+    # 캘린더가 오래되어 오늘까지 갱신이 필요한 상태로 만들고, 갱신 조회를 붙잡아 둠
+    state = dict(trading_calendar._state)
+    state["fetched"] -= trading_calendar.REFRESH_INTERVAL
+    monkeypatch.setattr(trading_calendar, "_state", state)
+    started, release = threading.Event(), threading.Event()
+    real = krx.get_index_ohlcv_by_date
+
+    def slow(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(krx, "get_index_ohlcv_by_date", slow)
+    refresh = threading.Thread(target=trading_days, args=("20240101",))
+    refresh.start()
+    assert started.wait(5)
+    try:
+        # 과거 구간은 조회 중인 스레드를 기다리지 않고 바로 응답
+        t0 = time.perf_counter()
+        days = trading_days("20240101", "20240105")
+        assert time.perf_counter() - t0 < 1
+        assert len(days) == 5
+    finally:
+        release.set()
+        refresh.join()
@@ -0,0 +1,181 @@
+"""KRX 거래일 캘린더: 디스크 캐시, 드물게 갱신.
+
+KOSPI 지수 일봉의 날짜를 거래일로 사용합니다. 조회한 구간
+[start, fetched 날짜]는 로컬에서 답하고, 그 이후 날짜가 필요하면
+REFRESH_INTERVAL마다 한 번만 부족분을 조회해 이어 붙입니다.
+아직 조회하지 않은 날짜(또는 조회 실패 시)는 평일을 거래일로 가정하며,
+실패 후 FAILURE_COOLDOWN 동안은 다시 조회하지 않습니다.
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pandas as pd
+from cache import load_calendar, save_calendar
+from ratelimit import RequestError, krx_call
+
+INDEX_TICKER = "1001"  # KOSPI
+DEFAULT_YEARS = 10
+REFRESH_INTERVAL = timedelta(hours=1)
+# 조회 실패 후 다시 조회하기까지 대기 (그동안은 평일/기존 캘린더로 대체)
+FAILURE_COOLDOWN = timedelta(minutes=5)
+
+_state: dict | None = None
+_failed_at: datetime | None = None
+_lock = threading.Lock()  # _state 읽기/교체
+_fetch_lock = threading.Lock()  # KRX 조회는 한 번에 한 스레드만
+_DAY = pd.Timedelta(days=1)
+
+
+def _ts(d) -> pd.Timestamp:
+    if d is None:
+        return pd.Timestamp(datetime.now().date())
+    return pd.Timestamp(d).normalize()
+
+
+def _fetch(start: pd.Timestamp, end: pd.Timestamp) -> pd.DatetimeIndex | None:
+    """지수 일봉 날짜 조회 (재시도 후에도 실패하면 경고 후 None)."""
+    try:
+        df = krx_call(
+            "get_index_ohlcv_by_date",
+            start.strftime("%Y%m%d"),
+            end.strftime("%Y%m%d"),
+            INDEX_TICKER,
+            name_display=False,
+        )
+    except RequestError as e:
+        print(f"[경고] 거래일 캘린더 조회 실패, 평일로 대체합니다: {e}")
+        return None
+    return pd.DatetimeIndex(df.index).normalize()
+
+
+def _plan(state: dict | None, start, end, now: datetime) -> list[tuple]:
+    """[start, end]에 답하기 위해 조회할 구간 [(종류, 시작, 끝), ...]."""
+    today = pd.Timestamp(now.date())
+    if state is None:
+        first = min(start, today - pd.DateOffset(years=DEFAULT_YEARS))
+        return [("init", first, today)]
+
+    todo = []
+    if start < state["start"]:
+        todo.append(("back", start, state["start"] - _DAY))
+    fetched = pd.Timestamp(state["fetched"].date())
+    if end >= fetched and now - state["fetched"] >= REFRESH_INTERVAL:
+        # 마지막 조회일부터 다시 조회 (장중 조회였다면 당일 포함 여부 갱신)
+        todo.append(("refresh", fetched, today))
+    return todo
+
+
+def _current(start, end) -> tuple[dict | None, list[tuple]]:
+    """(현재 캘린더, 필요한 조회) — 최근 조회 실패 후 대기 중이면 조회 없음."""
+    global _state
+    with _lock:
+        if _state is None:
+            _state = load_calendar()
+        now = datetime.now()
+        if _failed_at is not None and now - _failed_at < FAILURE_COOLDOWN:
+            return _state, []
+        return _state, _plan(_state, start, end, now)
+
+
+def _ensure(start: pd.Timestamp, end: pd.Timestamp) -> dict | None:
+    """[start, end]를 답할 수 있도록 캘린더 로드/보충 (필요할 때만 조회).
+
+    KRX 조회는 _lock 밖에서 한 스레드만 하고, 조회가 필요 없는 호출은 그동안
+    기존 캘린더로 바로 답합니다. 조회 실패 시 FAILURE_COOLDOWN 동안은 다시
+    조회하지 않고 기존 캘린더(없으면 평일)로 대체합니다.
+    """
+    global _state, _failed_at
+    state, todo = _current(start, end)
+    if not todo:
+        return state
+
+    with _fetch_lock:
+        # 기다리는 동안 다른 스레드가 조회(또는 실패)했으면 다시 확인
+        state, todo = _current(start, end)
+        if not todo:
+            return state
+
+        now = datetime.now()
+        fetched = [(kind, _fetch(s, e), s) for kind, s, e in todo]
+        with _lock:
+            state = None if _state is None else dict(_state)
+            for kind, days, first in fetched:
+                if days is None:
+                    continue
+                if kind == "init":
+                    state = {"days": days, "start": first, "fetched": now}
+                elif kind == "back":
+                    state["days"] = days.union(state["days"])
+                    state["start"] = first
+                else:
+                    state["days"] = state["days"].union(days)
+                    state["fetched"] = now
+            ok = [days is not None for _, days, _ in fetched]
+            _failed_at = None if all(ok) else now
+            if any(ok):
+                _state = state
+        if any(ok):
+            save_calendar(state)
+        return state
+
+
+def trading_days(start, end=None) -> pd.DatetimeIndex:
+    """[start, end] 구간의 거래일.
+
+    Args:
+        start: 시작일 (YYYYMMDD, YYYY-MM-DD 또는 Timestamp)
+        end: 종료일 (기본 오늘)
+
+    Returns:
+        거래일 DatetimeIndex
+    """
+    start, end = _ts(start), _ts(end)
+    if start > end:
+        return pd.DatetimeIndex([])
+
+    state = _ensure(start, end)
+    if state is None:
+        return pd.bdate_range(start, end)
+
+    known_end = pd.Timestamp(state["fetched"].date())
+    days = state["days"]
+    known = days[(days >= start) & (days <= min(end, known_end))]
+    if end <= known_end:
+        return known
+    # 아직 조회하지 않은 날짜는 평일로 가정
+    return known.append(pd.bdate_range(known_end + _DAY, end))
+
+
+def last_trading_day(as_of=None) -> pd.Timestamp:
+    """as_of(기본 오늘) 이전의 마지막 거래일 (as_of 포함)."""
+    as_of = _ts(as_of)
+    days = trading_days(as_of - pd.Timedelta(days=30), as_of)
+    return days[-1] if len(days) else as_of
+
+
+def is_trading_day(d) -> bool:
+    """거래일 여부."""
+    d = _ts(d)
+    return len(trading_days(d, d)) == 1
+
+
+def uncovered(start, end, cached_start, cached_end) -> list[tuple]:
+    """캐시 구간 밖에 있는 거래일 구간.
+
+    Args:
+        start, end: 요청 구간
+        cached_start, cached_end: 캐시가 조회를 마친 구간
+
+    Returns:
+        [(시작 거래일, 끝 거래일), ...] (최대 2개: 앞/뒤), 모두 캐시되어 있으면 []
+    """
+    days = trading_days(start, end)
+    before = days[days < _ts(cached_start)]
+    after = days[days > _ts(cached_end)]
+    return [(d[0], d[-1]) for d in (before, after) if len(d)]
+
+
+def is_cached(start, end, cached_start, cached_end) -> bool:
+    """요청 구간의 거래일이 캐시 구간에 모두 포함되는지 여부."""
+    return not uncovered(start, end, cached_start, cached_end)
@@ -1,33 +1,60 @@
 """유틸리티: 종목 조회, 공통 헬퍼."""
 
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from functools import lru_cache
+from itertools import islice
 
+import numpy as np
 import pandas as pd
+from backend import use_polars
+from cache import load_name, load_stock_list, save_name, save_stock_list
+from ratelimit import RequestError, krx_call
 
-from pykrx import stock
+# 바 1개당 대략적인 달력일 수 (휴장일 여유 포함)
+_DAYS_PER_BAR = {"daily": 1.5, "weekly": 7, "monthly": 31}
+
+
+def krx():
+    """pykrx stock 모듈 (지연 로드).
+
+    pykrx는 import 시 matplotlib까지 불러오므로, 캐시만으로 끝나는 조회에서는
+    실제 요청이 필요할 때까지 import를 미룹니다.
+    """
+    from pykrx import stock
+
+    return stock
 
 
 @lru_cache(maxsize=1)
 def get_stock_list() -> pd.DataFrame:
-    """전체 종목 리스트 조회 (캐시)."""
-    from datetime import datetime, timedelta
-
-    # 최근 영업일 추정 (주말 회피)
-    dt = datetime.now()
-    for _ in range(7):
-        date_str = dt.strftime("%Y%m%d")
-        try:
-            codes = stock.get_market_ticker_list(date_str, market="ALL")
-            if codes:
-                break
-        except Exception:
-            pass
-        dt -= timedelta(days=1)
-    else:
-        codes = []
+    """전체 종목 리스트 조회 (캐시, 디스크 캐시는 당일분만 사용).
 
+    Raises:
+        ratelimit.RequestError: 종목 리스트 조회가 재시도 후에도 실패한 경우
+    """
+    from trading_calendar import last_trading_day
+
+    cached = load_stock_list(max_age_days=0)
+    if cached is not None:
+        return cached
+
+    # 마지막 거래일 기준 (당일 목록이 아직 없으면 직전 거래일)
+    day = last_trading_day()
+    codes = []
+    for _ in range(2):
+        codes = krx_call("get_market_ticker_list", day.strftime("%Y%m%d"), market="ALL")
+        if codes:
+            break
+        day = last_trading_day(day - pd.Timedelta(days=1))
+
+    # 종목명은 목록 조회 시 받아 둔 pykrx 내부 표에서 찾으므로 요청 없음
+    stock = krx()
     names = [stock.get_market_ticker_name(c) for c in codes]
-    return pd.DataFrame({"code": codes, "name": names})
+    df = pd.DataFrame({"code": codes, "name": names})
+    if codes:
+        save_stock_list(df)
+    return df
 
 
 def to_code(query: str) -> str | None:
@@ -71,8 +98,19 @@ def to_code(query: str) -> str | None:
 
 
 def to_name(code: str) -> str:
-    """종목코드 → 종목명."""
-    return stock.get_market_ticker_name(code) or code
+    """종목코드 → 종목명 (디스크 캐시의 종목 마스터 우선)."""
+    cached = load_stock_list()
+    if cached is not None:
+        match = cached.loc[cached["code"] == code, "name"]
+        if not match.empty:
+            return match.iloc[0]
+
+    name = load_name(code)
+    if name is None:
+        name = krx_call("get_market_ticker_name", code)
+        if name:
+            save_name(code, name)
+    return name or code
 
 
 def resample_weekly(df: pd.DataFrame) -> pd.DataFrame:
@@ -84,6 +122,11 @@ def resample_weekly(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         주봉 DataFrame
     """
+    if use_polars() and not df.empty:
+        import backend
+
+        return backend.resample(df, "weekly")
+
     r = df.resample("W-FRI")
     return pd.DataFrame(
         {
@@ -105,6 +148,11 @@ def resample_monthly(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         월봉 DataFrame
     """
+    if use_polars() and not df.empty:
+        import backend
+
+        return backend.resample(df, "monthly")
+
     r = df.resample("M")
     return pd.DataFrame(
         {
@@ -132,3 +180,82 @@ def filter_period(df: pd.DataFrame, years: int = 1) -> pd.DataFrame:
     last_date = df.index.max()
     start_date = last_date - pd.DateOffset(years=years)
     return df[df.index >= start_date]
+
+
+def bars_to_days(bars: int, period: str = "weekly") -> int:
+    """바 수 → 달력일 수 환산 (조회 시작일 계산용).
+
+    Args:
+        bars: 바 개수
+        period: 'daily', 'weekly', 'monthly'
+
+    Returns:
+        해당 바 수를 덮는 달력일 수
+    """
+    return int(np.ceil(bars * _DAYS_PER_BAR[period]))
+
+
+def json_value(v):
+    """JSON 직렬화용 값 변환 (NaN/NaT → None, numpy 스칼라/Timestamp 변환)."""
+    if pd.api.types.is_scalar(v) and pd.isna(v):
+        return None
+    if hasattr(v, "item"):
+        v = v.item()
+    if hasattr(v, "strftime"):
+        return v.strftime("%Y-%m-%d")
+    return v
+
+
+def json_records(df: pd.DataFrame) -> list[dict]:
+    """DataFrame → JSON 직렬화 가능한 레코드 리스트."""
+    return [{k: json_value(v) for k, v in row.items()} for row in df.to_dict("records")]
+
+
+def bounded_map(
+    fn: Callable,
+    queries: Iterable[str],
+    jobs: int = 1,
+    max_pending: int | None = None,
+) -> Iterator:
+    """종목별 작업을 스레드 풀에서 실행하고 완료되는 순서대로 결과 생성.
+
+    소비자가 다음 결과를 요청할 때만 새 작업을 제출하므로 동시에 존재하는
+    결과는 최대 max_pending개입니다 (느린 소비자 배압). 재시도 후에도 실패한
+    조회(RequestError)는 오류를 출력하고 건너뜁니다.
+
+    Args:
+        fn: 종목 질의 1개 → 결과 (None이면 건너뜀)
+        queries: 종목명 또는 코드
+        jobs: 동시 실행 스레드 수 (1이면 입력 순서대로 순차 실행)
+        max_pending: 동시 진행/대기 작업 상한 (기본 jobs * 2)
+
+    Yields:
+        None이 아닌 fn 결과
+    """
+
+    def run(q):
+        try:
+            return fn(q)
+        except RequestError as e:
+            print(f"[오류] '{q}' 조회 실패: {e}")
+            return None
+
+    if jobs <= 1:
+        for q in queries:
+            result = run(q)
+            if result is not None:
+                yield result
+        return
+
+    limit = max(max_pending or jobs * 2, jobs)
+    todo = iter(queries)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        pending = {pool.submit(run, q) for q in islice(todo, limit)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                result = fut.result()
+                if result is not None:
+                    yield result
+            # 소비된 만큼만 새 작업 제출
+            pending |= {pool.submit(run, q) for q in islice(todo, limit - len(pending))}